@@ -73,8 +73,6 @@ class ABAF:
                 for arg2 in arguments:
                     # if arg1 != arg2 and self.contraries[premise] == arg2.conclusion:
                     if self.contraries[premise] == arg2.conclusion:
-                        arg1.add_ingoing_defeat(arg2)
-                        arg2.add_outgoing_defeat(arg1)
                         defeats.add(Defeat(arg2, arg1))
 
         return AbstractArgumentationFramework('', arguments=list(arguments), defeats=list(defeats))
@@ -101,8 +99,6 @@ class ABAF:
                 for arg2 in arguments:
                     # if arg1 != arg2 and self.contraries[premise] == arg2.conclusion:
                     if self.contraries[premise] == arg2.conclusion:
-                        arg1.add_ingoing_defeat(arg2)
-                        arg2.add_outgoing_defeat(arg1)
                         defeats.add(Defeat(arg2, arg1))
 
         return AbstractArgumentationFramework('', arguments=list(arguments), defeats=list(defeats))
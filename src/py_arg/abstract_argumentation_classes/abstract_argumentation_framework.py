@@ -1,10 +1,23 @@
-from typing import Optional, List
+from typing import Optional, List, Dict
 
 from py_arg.abstract_argumentation_classes.argument import Argument
 from py_arg.abstract_argumentation_classes.defeat import Defeat
 
 
 class AbstractArgumentationFramework:
+    """
+    An abstract argumentation framework consists of a set of arguments and a defeat relation between them.
+
+    On construction, the framework builds an index of incoming and outgoing defeats for each argument, so
+    get_incoming_defeat_arguments and get_outgoing_defeat_arguments run in time linear in the number of defeats
+    of that argument rather than in the total number of defeats. All algorithms in py_arg.algorithms.semantics
+    (and the explanation algorithms built on them) look up defeats through these two methods; they never scan the
+    defeats list themselves.
+
+    The defeat indexes are owned by the framework: the Argument objects passed in are not modified, so the same
+    arguments can safely be shared between many frameworks (e.g. completions of an incomplete argumentation framework
+    or frameworks for different argument orderings).
+    """
     def __init__(self, name: str = '',
                  arguments: Optional[List[Argument]] = None,
                  defeats: Optional[List[Defeat]] = None):
@@ -20,9 +33,13 @@ class AbstractArgumentationFramework:
         else:
             self._defeats = defeats
 
+        self._incoming_defeat_arguments: Dict[str, List[Argument]] = \
+            {argument_name: [] for argument_name in self._arguments.keys()}
+        self._outgoing_defeat_arguments: Dict[str, List[Argument]] = \
+            {argument_name: [] for argument_name in self._arguments.keys()}
         for defeat in self._defeats:
-            defeat.from_argument.add_outgoing_defeat(defeat.to_argument)
-            defeat.to_argument.add_ingoing_defeat(defeat.from_argument)
+            self._incoming_defeat_arguments.setdefault(defeat.to_argument.name, []).append(defeat.from_argument)
+            self._outgoing_defeat_arguments.setdefault(defeat.from_argument.name, []).append(defeat.to_argument)
 
     def __repr__(self):
         return '( [' + ', '.join(argument.name for argument in self.arguments) + \
@@ -51,7 +68,7 @@ class AbstractArgumentationFramework:
         >>> a in af.get_incoming_defeat_arguments(b)
         True
         """
-        return [defeat.from_argument for defeat in self._defeats if defeat.to_argument == argument]
+        return list(self._incoming_defeat_arguments.get(argument.name, []))
 
     def get_outgoing_defeat_arguments(self, argument: Argument) -> List[Argument]:
         """
@@ -70,7 +87,7 @@ class AbstractArgumentationFramework:
         >>> b in af.get_outgoing_defeat_arguments(a)
         True
         """
-        return [defeat.to_argument for defeat in self._defeats if defeat.from_argument == argument]
+        return list(self._outgoing_defeat_arguments.get(argument.name, []))
 
     def is_defeated(self, argument: Argument) -> bool:
         """
@@ -92,7 +109,7 @@ class AbstractArgumentationFramework:
         >>> af.is_defeated(c)
         True
         """
-        return len(self.get_incoming_defeat_arguments(argument)) > 0
+        return len(self._incoming_defeat_arguments.get(argument.name, [])) > 0
 
     def is_in_arguments(self, argument_name: str) -> bool:
         """
@@ -0,0 +1,173 @@
+from array import array
+from typing import Dict, List, Optional, Sequence
+
+from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
+from py_arg.abstract_argumentation_classes.argument import Argument
+from py_arg.abstract_argumentation_classes.defeat import Defeat
+
+
+class CompactArgumentationFramework:
+    """
+    A memory-efficient representation of an abstract argumentation framework. Arguments are identified by dense
+    integer ids 0, ..., n - 1 (in the order of the argument names) and the defeat relation is stored twice, as
+    compressed sparse rows of 32-bit integers: once grouped by attacker (CSR) and once grouped by attacked argument
+    (CSC). There are no Argument or Defeat objects, so a framework with m defeats takes roughly 8 * m bytes.
+    """
+    def __init__(self, name: str, argument_names: List[str],
+                 attack_sources: Sequence[int], attack_targets: Sequence[int]):
+        """
+        Create a compact argumentation framework.
+
+        :param name: The name of the argumentation framework.
+        :param argument_names: Names of the arguments; the position of each name is the id of that argument.
+        :param attack_sources: For each defeat, the id of the defeating argument.
+        :param attack_targets: For each defeat, the id of the defeated argument (same length as attack_sources).
+
+        >>> caf = CompactArgumentationFramework('af', ['a', 'b', 'c'], [0, 1, 1], [1, 0, 2])
+        >>> caf.nr_of_arguments, caf.nr_of_attacks
+        (3, 3)
+        >>> list(caf.get_attacked_ids(1))
+        [0, 2]
+        >>> list(caf.get_attacker_ids(0))
+        [1]
+        """
+        if len(attack_sources) != len(attack_targets):
+            raise ValueError('Each attack needs both a source and a target.')
+
+        self.name = name
+        self.argument_names = list(argument_names)
+        self._argument_ids: Dict[str, int] = {argument_name: argument_id
+                                              for argument_id, argument_name in enumerate(self.argument_names)}
+        if len(self._argument_ids) != len(self.argument_names):
+            raise ValueError('Argument names should be unique.')
+
+        nr_of_arguments = len(self.argument_names)
+        for argument_id in attack_sources:
+            if not 0 <= argument_id < nr_of_arguments:
+                raise ValueError('There is no argument with id ' + str(argument_id) + '.')
+        for argument_id in attack_targets:
+            if not 0 <= argument_id < nr_of_arguments:
+                raise ValueError('There is no argument with id ' + str(argument_id) + '.')
+
+        self.attacked_offsets, self.attacked_ids = _to_compressed_rows(nr_of_arguments, attack_sources, attack_targets)
+        self.attacker_offsets, self.attacker_ids = _to_compressed_rows(nr_of_arguments, attack_targets, attack_sources)
+
+    def __repr__(self):
+        return 'CompactArgumentationFramework(' + repr(self.name) + ', ' + str(self.nr_of_arguments) + \
+            ' arguments, ' + str(self.nr_of_attacks) + ' attacks)'
+
+    @property
+    def nr_of_arguments(self) -> int:
+        return len(self.argument_names)
+
+    @property
+    def nr_of_attacks(self) -> int:
+        return len(self.attacked_ids)
+
+    def get_argument_id(self, argument_name: str) -> int:
+        """
+        Get the id of the argument with this name (if it exists, otherwise raise ValueError).
+
+        >>> caf = CompactArgumentationFramework('af', ['a', 'b'], [], [])
+        >>> caf.get_argument_id('b')
+        1
+        >>> caf.get_argument_id('c')
+        Traceback (most recent call last):
+            ...
+        ValueError: There is no argument named c.
+        """
+        if argument_name not in self._argument_ids:
+            raise ValueError('There is no argument named ' + argument_name + '.')
+        return self._argument_ids[argument_name]
+
+    def get_argument_name(self, argument_id: int) -> str:
+        return self.argument_names[argument_id]
+
+    def get_attacked_ids(self, argument_id: int) -> array:
+        """
+        Get the ids of the arguments defeated by the argument with this id.
+        """
+        return self.attacked_ids[self.attacked_offsets[argument_id]:self.attacked_offsets[argument_id + 1]]
+
+    def get_attacker_ids(self, argument_id: int) -> array:
+        """
+        Get the ids of the arguments defeating the argument with this id.
+        """
+        return self.attacker_ids[self.attacker_offsets[argument_id]:self.attacker_offsets[argument_id + 1]]
+
+    def get_attacked_lists(self) -> List[List[int]]:
+        """
+        Get, for each argument id, a list of the ids it defeats. Solvers iterating over the defeat relation many
+        times are faster with plain lists than with slices of the compressed arrays.
+        """
+        offsets = self.attacked_offsets
+        return [self.attacked_ids[offsets[i]:offsets[i + 1]].tolist() for i in range(self.nr_of_arguments)]
+
+    def get_attacker_lists(self) -> List[List[int]]:
+        """
+        Get, for each argument id, a list of the ids defeating it.
+        """
+        offsets = self.attacker_offsets
+        return [self.attacker_ids[offsets[i]:offsets[i + 1]].tolist() for i in range(self.nr_of_arguments)]
+
+    @classmethod
+    def from_abstract_argumentation_framework(cls, argumentation_framework: AbstractArgumentationFramework) \
+            -> 'CompactArgumentationFramework':
+        """
+        Convert an abstract argumentation framework. Argument ids follow the order of argumentation_framework.arguments.
+
+        >>> a, b, c = Argument('a'), Argument('b'), Argument('c')
+        >>> af = AbstractArgumentationFramework('af', [a, b, c], [Defeat(a, b), Defeat(b, c)])
+        >>> caf = CompactArgumentationFramework.from_abstract_argumentation_framework(af)
+        >>> [caf.get_argument_name(i) for i in caf.get_attacked_ids(caf.get_argument_id('b'))]
+        ['c']
+        """
+        argument_names = [argument.name for argument in argumentation_framework.arguments]
+        argument_ids = {argument_name: argument_id for argument_id, argument_name in enumerate(argument_names)}
+        try:
+            attack_sources = array('i', [argument_ids[defeat.from_argument.name]
+                                         for defeat in argumentation_framework.defeats])
+            attack_targets = array('i', [argument_ids[defeat.to_argument.name]
+                                         for defeat in argumentation_framework.defeats])
+        except KeyError as error:
+            raise ValueError('There is no argument named ' + error.args[0] + '.')
+        return cls(argumentation_framework.name, argument_names, attack_sources, attack_targets)
+
+    def to_abstract_argumentation_framework(self, name: Optional[str] = None) -> AbstractArgumentationFramework:
+        """
+        Convert back to an abstract argumentation framework. Arguments keep their order; defeats are listed grouped by
+        their defeating argument.
+
+        >>> caf = CompactArgumentationFramework('af', ['a', 'b'], [1, 0], [0, 1])
+        >>> caf.to_abstract_argumentation_framework()
+        ( [a, b], [(a, b), (b, a)] )
+        """
+        arguments = [Argument(argument_name) for argument_name in self.argument_names]
+        offsets = self.attacked_offsets
+        defeats = [Defeat(arguments[from_id], arguments[self.attacked_ids[position]])
+                   for from_id in range(self.nr_of_arguments)
+                   for position in range(offsets[from_id], offsets[from_id + 1])]
+        if name is None:
+            name = self.name
+        return AbstractArgumentationFramework(name, arguments, defeats)
+
+
+def _to_compressed_rows(nr_of_rows: int, row_ids: Sequence[int], column_ids: Sequence[int]):
+    offsets = array('i', [0]) * (nr_of_rows + 1)
+    for row_id in row_ids:
+        offsets[row_id + 1] += 1
+    for row_id in range(nr_of_rows):
+        offsets[row_id + 1] += offsets[row_id]
+
+    columns = array('i', [0]) * len(column_ids)
+    next_position = offsets[:-1]
+    for row_id, column_id in zip(row_ids, column_ids):
+        columns[next_position[row_id]] = column_id
+        next_position[row_id] += 1
+    return offsets, columns
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
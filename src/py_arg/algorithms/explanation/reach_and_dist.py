@@ -36,9 +36,9 @@ def recursive_reach(argumentation_framework, reach, argument, new_argument, dist
         framework the distance (possibly several) to the given argument.
     """
     visited_start = visited.copy()
+    defeaters = set(argumentation_framework.get_incoming_defeat_arguments(new_argument))
     for pot_argument in argumentation_framework.arguments:
-        if pot_argument in argumentation_framework.get_incoming_defeat_arguments(new_argument) \
-                and [str(pot_argument), str(new_argument)] not in visited:
+        if pot_argument in defeaters and [str(pot_argument), str(new_argument)] not in visited:
             pot_dist = distance[str(pot_argument)]
             pot_dist.add(dist + 1)
             distance[str(pot_argument)] = pot_dist
@@ -1,11 +1,14 @@
+from typing import FrozenSet, Iterable, List, Optional, Set
+
 from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
 from py_arg.abstract_argumentation_classes.argument import Argument
 from py_arg.algorithms.explanation.reach_and_dist import get_reach
 from py_arg.algorithms.semantics.get_admissible_sets import get_admissible_sets
+from py_arg.utils.budget import Budget, BudgetExceeded
 
 
 def get_sufficient_or_necessary(argumentation_framework: AbstractArgumentationFramework, argument: Argument,
-                                explanation_function: str, explanation_type: str):
+                                explanation_function: str, explanation_type: str, budget: Optional[Budget] = None):
     """
     Obtain the necessary or (minimal) sufficient explanations for the given argument.
 
@@ -13,16 +16,24 @@ def get_sufficient_or_necessary(argumentation_framework: AbstractArgumentationFr
     :param argument: The argument that is accepted.
     :param explanation_function: The explanation function, to determine the content of the explanation.
     :param explanation_type: The explanation type, to determine acceptance/non-acceptance explanation.
+    :param budget: Budget for the search for admissible sets (see py_arg.utils.budget). If it is exhausted,
+        BudgetExceeded is raised, with the sufficient sets found so far as partial results for Suff (and no partial
+        results otherwise).
     :return: a list of sets of arguments, each representing a sufficient set of arguments for the acceptance of the
     given argument, or the necessary arguments.
     """
     if explanation_type == 'Acceptance':
         if explanation_function == 'Suff':
-            return get_sufficient_arguments_for_acceptance(argumentation_framework, argument)
+            return get_sufficient_arguments_for_acceptance(argumentation_framework, argument, budget)
 
         elif explanation_function == 'MinSuff':
             # TODO: Check what happens here, could be done more efficiently.
-            sufficient_sets = get_sufficient_arguments_for_acceptance(argumentation_framework, argument)
+            try:
+                sufficient_sets = get_sufficient_arguments_for_acceptance(argumentation_framework, argument, budget)
+            except BudgetExceeded as error:
+                # A sufficient set that is minimal among those found so far need not be minimal among all of them.
+                error.partial_results = None
+                raise
             current_minimal_sufficient_explanations = []
             for sufficient_set in sufficient_sets:
                 minsuff_suff = []
@@ -37,25 +48,37 @@ def get_sufficient_or_necessary(argumentation_framework: AbstractArgumentationFr
             return current_minimal_sufficient_explanations
 
         elif explanation_function == 'Nec':
-            return get_necessary_arguments_for_acceptance(argumentation_framework, argument)
+            return get_necessary_arguments_for_acceptance(argumentation_framework, argument, budget)
 
     raise NotImplementedError
 
 
-def get_sufficient_arguments_for_acceptance(arg_framework: AbstractArgumentationFramework, argument: Argument):
+def get_sufficient_arguments_for_acceptance(arg_framework: AbstractArgumentationFramework, argument: Argument,
+                                            budget: Optional[Budget] = None):
     """
     Obtain the sets with sufficient arguments for the acceptance of the given argument.
 
     :param arg_framework: The argumentation framework the explanation should be about.
     :param argument: The argument that is accepted.
+    :param budget: Budget for the search for admissible sets (see py_arg.utils.budget). If it is exhausted,
+        BudgetExceeded is raised, with the sufficient sets found so far as partial results.
     :return: a list of sets of arguments, each representing a sufficient set of arguments for the acceptance of the
     given argument.
     """
-    sufficient_sets = []
     reach, dist = get_reach(arg_framework, argument)
     if dist[str(argument)] == {0}:
         reach.remove(argument)
-    admissible_sets = get_admissible_sets(arg_framework)
+    try:
+        admissible_sets = get_admissible_sets(arg_framework, budget=budget)
+    except BudgetExceeded as error:
+        error.partial_results = _get_sufficient_sets(error.partial_results, argument, reach)
+        raise
+    return _get_sufficient_sets(admissible_sets, argument, reach)
+
+
+def _get_sufficient_sets(admissible_sets: Iterable[FrozenSet[Argument]], argument: Argument, reach: Set[Argument]) \
+        -> List[Set[Argument]]:
+    sufficient_sets = []
     adm_arg = [set(adm) for adm in admissible_sets if argument in adm]
     for adm in adm_arg:
         if argument not in reach:
@@ -66,16 +89,24 @@ def get_sufficient_arguments_for_acceptance(arg_framework: AbstractArgumentation
     return sufficient_sets
 
 
-def get_necessary_arguments_for_acceptance(arg_framework: AbstractArgumentationFramework, argument: Argument):
+def get_necessary_arguments_for_acceptance(arg_framework: AbstractArgumentationFramework, argument: Argument,
+                                           budget: Optional[Budget] = None):
     """
     Obtain the necessary arguments for the acceptance of the given argument.
 
     :param arg_framework: The argumentation framework the explanation should be about.
     :param argument: The argument that is accepted.
+    :param budget: Budget for the search for admissible sets (see py_arg.utils.budget). If it is exhausted,
+        BudgetExceeded is raised without partial results, since an argument in all admissible sets found so far need
+        not be necessary.
     :return: a list of arguments, necessary for the acceptance of the given argument.
     """
     reach, dist = get_reach(arg_framework, argument)
-    admissible_sets = get_admissible_sets(arg_framework)
+    try:
+        admissible_sets = get_admissible_sets(arg_framework, budget=budget)
+    except BudgetExceeded as error:
+        error.partial_results = None
+        raise
     adm_arg = [set(adm) for adm in admissible_sets if argument in adm]
     intersect_adm_arg = set.intersection(*adm_arg)
     if dist[str(argument)] == {0}:
@@ -17,6 +17,6 @@ def compute_all_literal_grounded_justification_status_naive(argumentation_theory
     grounded_extension = get_grounded_extension(arg_framework)
     for grounded_argument in grounded_extension:
         result[grounded_argument.conclusion] = EnumJustificationLabel.DEFENDED
-        for attacked_argument in grounded_argument.get_outgoing_defeat_arguments:
+        for attacked_argument in arg_framework.get_outgoing_defeat_arguments(grounded_argument):
             result[attacked_argument.conclusion] = EnumJustificationLabel.OUT
     return LiteralLabels(result)
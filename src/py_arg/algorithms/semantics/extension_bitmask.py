@@ -0,0 +1,124 @@
+from typing import FrozenSet, Iterable, Optional, Set
+
+from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
+from py_arg.abstract_argumentation_classes.argument import Argument
+from py_arg.abstract_argumentation_classes.defeat import Defeat
+from py_arg.utils.budget import Budget, BudgetExceeded, iterate_within_budget
+
+
+# An extension can be represented as a bitmask: a Python int in which bit i is set if and only if the i-th argument of
+# argumentation_framework.arguments is in the extension (this is also the argument id in the corresponding
+# CompactArgumentationFramework). Subset tests are then a single AND: s is a subset of t iff s & ~t == 0.
+
+
+def extension_to_bitmask(extension: Iterable[Argument], argumentation_framework: AbstractArgumentationFramework) \
+        -> int:
+    """
+    Get the bitmask representing this set of arguments.
+
+    >>> a, b, c = Argument('a'), Argument('b'), Argument('c')
+    >>> af = AbstractArgumentationFramework('af', [a, b, c], [Defeat(a, b)])
+    >>> extension_to_bitmask({a, c}, af)
+    5
+    """
+    argument_names = {argument.name for argument in extension}
+    bitmask = 0
+    for argument_id, argument in enumerate(argumentation_framework.arguments):
+        if argument.name in argument_names:
+            bitmask |= 1 << argument_id
+    return bitmask
+
+
+def bitmask_to_extension(bitmask: int, argumentation_framework: AbstractArgumentationFramework) \
+        -> FrozenSet[Argument]:
+    """
+    Get the set of arguments represented by this bitmask.
+
+    >>> a, b, c = Argument('a'), Argument('b'), Argument('c')
+    >>> af = AbstractArgumentationFramework('af', [a, b, c], [Defeat(a, b)])
+    >>> sorted(bitmask_to_extension(5, af))
+    [a, c]
+    """
+    arguments = argumentation_framework.arguments
+    return frozenset(arguments[argument_id] for argument_id in iterate_bitmask(bitmask))
+
+
+def bitmasks_to_extensions(bitmasks: Iterable[int], argumentation_framework: AbstractArgumentationFramework) \
+        -> Set[FrozenSet[Argument]]:
+    """
+    Get the sets of arguments represented by these bitmasks.
+    """
+    arguments = argumentation_framework.arguments
+    return {frozenset(arguments[argument_id] for argument_id in iterate_bitmask(bitmask)) for bitmask in bitmasks}
+
+
+def collect_bitmasks(bitmasks: Iterable[int], argumentation_framework: AbstractArgumentationFramework,
+                     as_bitmasks: bool, budget: Optional[Budget]) -> Set[int]:
+    """
+    Collect the bitmasks of the extensions found by a search, charging each extension to the budget (if any). If the
+    budget is exhausted, the BudgetExceeded carries the extensions found so far: as a set of bitmasks if as_bitmasks,
+    and as a set of sets of arguments otherwise.
+
+    >>> a, b = Argument('a'), Argument('b')
+    >>> af = AbstractArgumentationFramework('af', [a, b], [])
+    >>> try:
+    ...     collect_bitmasks([1, 2, 3], af, as_bitmasks=False, budget=Budget(max_extensions=1))
+    ... except BudgetExceeded as error:
+    ...     error.partial_results
+    {frozenset({a})}
+    """
+    try:
+        return set(iterate_within_budget(bitmasks, budget))
+    except BudgetExceeded as error:
+        error.partial_results = set(error.partial_results) if as_bitmasks else \
+            bitmasks_to_extensions(error.partial_results, argumentation_framework)
+        raise
+
+
+def iterate_bitmask(bitmask: int) -> Iterable[int]:
+    """
+    Iterate over the ids of the arguments in this bitmask, in increasing order.
+
+    >>> list(iterate_bitmask(0b10110))
+    [1, 2, 4]
+    """
+    while bitmask:
+        lowest_bit = bitmask & -bitmask
+        yield lowest_bit.bit_length() - 1
+        bitmask ^= lowest_bit
+
+
+def is_subset(bitmask: int, other_bitmask: int) -> bool:
+    """
+    Check if the set represented by bitmask is a subset of the set represented by other_bitmask.
+
+    >>> is_subset(0b101, 0b111), is_subset(0b101, 0b011)
+    (True, False)
+    """
+    return bitmask & ~other_bitmask == 0
+
+
+def is_strict_subset(bitmask: int, other_bitmask: int) -> bool:
+    return bitmask != other_bitmask and bitmask & ~other_bitmask == 0
+
+
+def get_maximal_bitmasks(bitmasks: Iterable[int]) -> Set[int]:
+    """
+    Get the bitmasks that are not a strict subset of any other given bitmask.
+
+    >>> sorted(get_maximal_bitmasks([0b001, 0b011, 0b100, 0b110, 0b010]))
+    [3, 6]
+    """
+    maximal_bitmasks = []
+    # Any superset has at least as many elements, so checking candidates by decreasing size means a candidate only
+    # needs to be compared with the maximal bitmasks found so far.
+    for bitmask in sorted(set(bitmasks), key=lambda x: bin(x).count('1'), reverse=True):
+        if not any(bitmask & ~maximal_bitmask == 0 for maximal_bitmask in maximal_bitmasks):
+            maximal_bitmasks.append(bitmask)
+    return set(maximal_bitmasks)
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
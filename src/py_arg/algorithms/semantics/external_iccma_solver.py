@@ -0,0 +1,212 @@
+import os
+import re
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, FrozenSet, List, Optional, Sequence, Set, Union
+
+from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
+from py_arg.abstract_argumentation_classes.argument import Argument
+from py_arg.import_export.argumentation_framework_to_iccma23_format_writer import \
+    ArgumentationFrameworkToICCMA23FormatWriter
+
+# Abbreviations of the semantics in ICCMA tasks such as SE-PR or DC-CO.
+ICCMA_SEMANTICS = {'Complete': 'CO', 'Grounded': 'GR', 'Preferred': 'PR', 'Stable': 'ST', 'SemiStable': 'SST',
+                   'Stage': 'STG', 'Ideal': 'ID'}
+
+
+class ExternalSolverError(Exception):
+    """
+    The external solver failed or gave output that could not be parsed.
+    """
+
+
+class ExternalSolverTimeout(ExternalSolverError):
+    """
+    The external solver did not finish within the timeout; it has been killed.
+    """
+
+
+class ExternalICCMASolver:
+    """
+    Adapter for an external argumentation solver that follows the ICCMA 2023 command line interface: it is called as
+    `<command> -p <task> -f <file> [-a <argument>]`, where the file is the framework in ICCMA 2023 format (see
+    ArgumentationFrameworkToICCMA23FormatWriter) and arguments are referred to by their position (starting at 1) in
+    argumentation_framework.arguments. The solver prints YES or NO for decision tasks (DC and DS), and "w" followed by
+    the arguments of an extension for SE and EE tasks (NO if there is none). For EE tasks, each extension is on its own
+    line; the ICCMA 2019 output format [[1,2],[3]] is accepted as well.
+
+    Each call runs one solver process with a timeout, after which the process is killed. At most max_workers solver
+    processes run at the same time, also if the adapter is used from several threads; submit runs a call in the
+    adapter's own thread pool of that size. Since get_extensions(argumentation_framework, semantics) has the same form
+    as the other enumerators, the adapter can also serve as inner solver of get_scc_recursive_extensions or be passed
+    to iter_extensions, so that only large instances go to the external solver.
+    """
+    def __init__(self, command: Union[str, Sequence[str]], timeout: Optional[float] = None, max_workers: int = 1):
+        """
+        :param command: The solver executable, or a list with the executable and the arguments that precede the task.
+        :param timeout: Maximum number of seconds per solver call (no limit if None).
+        :param max_workers: Maximum number of solver processes running at the same time.
+        """
+        if max_workers < 1:
+            raise ValueError('There should be at least one worker.')
+        self.command = [command] if isinstance(command, str) else list(command)
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self._process_slots = threading.BoundedSemaphore(max_workers)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Shut down the thread pool used by submit, after the submitted calls have finished.
+        """
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    def submit(self, function: Callable, *args) -> Future:
+        """
+        Run one of the methods of this adapter (or any function calling them) in the adapter's thread pool, for example
+        solver.submit(solver.get_extensions, argumentation_framework, 'Preferred').
+
+        :return: A future for the result of the function.
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            return self._executor.submit(function, *args)
+
+    def get_extensions(self, argumentation_framework: AbstractArgumentationFramework, semantics: str) \
+            -> Set[FrozenSet[Argument]]:
+        """
+        Get all extensions under some semantics (ICCMA task EE).
+        """
+        output_lines = self.run(argumentation_framework, 'EE-' + _get_iccma_semantics(semantics))
+        return {extension for extension in _parse_extensions(output_lines, argumentation_framework)}
+
+    def get_some_extension(self, argumentation_framework: AbstractArgumentationFramework, semantics: str) \
+            -> Optional[FrozenSet[Argument]]:
+        """
+        Get some extension under some semantics, or None if there is none (ICCMA task SE).
+        """
+        output_lines = self.run(argumentation_framework, 'SE-' + _get_iccma_semantics(semantics))
+        extensions = _parse_extensions(output_lines, argumentation_framework)
+        return extensions[0] if extensions else None
+
+    def is_credulously_accepted(self, argumentation_framework: AbstractArgumentationFramework, argument: Argument,
+                                semantics: str) -> bool:
+        """
+        Check if the argument is in some extension (ICCMA task DC).
+        """
+        return self._decide(argumentation_framework, 'DC-' + _get_iccma_semantics(semantics), argument)
+
+    def is_skeptically_accepted(self, argumentation_framework: AbstractArgumentationFramework, argument: Argument,
+                                semantics: str) -> bool:
+        """
+        Check if the argument is in each extension (ICCMA task DS).
+        """
+        return self._decide(argumentation_framework, 'DS-' + _get_iccma_semantics(semantics), argument)
+
+    def run(self, argumentation_framework: AbstractArgumentationFramework, task: str,
+            argument: Optional[Argument] = None) -> List[str]:
+        """
+        Run the solver on some task and get the non-empty lines of its output.
+
+        :param argumentation_framework: The argumentation framework, which is written to a temporary file.
+        :param task: The ICCMA task, for example SE-PR.
+        :param argument: The query argument of a decision task.
+        :return: The lines printed by the solver.
+        """
+        command = self.command + ['-p', task]
+        file_descriptor, file_path = tempfile.mkstemp(suffix='.af')
+        try:
+            with os.fdopen(file_descriptor, 'w') as file:
+                file.write(ArgumentationFrameworkToICCMA23FormatWriter.write_to_str(argumentation_framework))
+            command += ['-f', file_path]
+            if argument is not None:
+                command += ['-a', str(_get_argument_index(argumentation_framework, argument))]
+            with self._process_slots:
+                try:
+                    completed_process = subprocess.run(command, capture_output=True, text=True, timeout=self.timeout)
+                except subprocess.TimeoutExpired:
+                    raise ExternalSolverTimeout('The solver did not finish task ' + task + ' within ' +
+                                                str(self.timeout) + ' seconds.')
+        finally:
+            os.remove(file_path)
+        if completed_process.returncode != 0:
+            raise ExternalSolverError('The solver failed on task ' + task + ' with exit code ' +
+                                      str(completed_process.returncode) + ': ' + completed_process.stderr.strip())
+        return [line.strip() for line in completed_process.stdout.splitlines() if line.strip()]
+
+    def _decide(self, argumentation_framework: AbstractArgumentationFramework, task: str, argument: Argument) -> bool:
+        output_lines = self.run(argumentation_framework, task, argument)
+        if output_lines and output_lines[0] in ['YES', 'NO']:
+            return output_lines[0] == 'YES'
+        raise ExternalSolverError('Expected YES or NO from the solver on task ' + task + ', got: ' +
+                                  ' '.join(output_lines))
+
+
+def _get_iccma_semantics(semantics: str) -> str:
+    if semantics not in ICCMA_SEMANTICS:
+        raise ValueError('Unknown semantics ' + semantics + '; choose one of ' + ', '.join(ICCMA_SEMANTICS) + '.')
+    return ICCMA_SEMANTICS[semantics]
+
+
+def _get_argument_index(argumentation_framework: AbstractArgumentationFramework, argument: Argument) -> int:
+    for index, other_argument in enumerate(argumentation_framework.arguments):
+        if other_argument.name == argument.name:
+            return index + 1
+    raise ValueError('There is no argument named ' + argument.name + '.')
+
+
+def _parse_extensions(output_lines: List[str], argumentation_framework: AbstractArgumentationFramework) \
+        -> List[FrozenSet[Argument]]:
+    """
+    Parse the extensions printed by an ICCMA solver.
+
+    >>> from py_arg.abstract_argumentation_classes.defeat import Defeat
+    >>> a, b, c = Argument('a'), Argument('b'), Argument('c')
+    >>> af = AbstractArgumentationFramework('af', [a, b, c], [Defeat(a, b), Defeat(b, a)])
+    >>> [sorted(extension) for extension in _parse_extensions(['w 1 3', 'w 2 3'], af)]
+    [[a, c], [b, c]]
+    >>> [sorted(extension) for extension in _parse_extensions(['[[1,3],[2,3]]'], af)]
+    [[a, c], [b, c]]
+    >>> _parse_extensions(['NO'], af)
+    []
+    """
+    arguments = argumentation_framework.arguments
+
+    def to_extension(indices: List[str]) -> FrozenSet[Argument]:
+        try:
+            return frozenset(arguments[int(index) - 1] for index in indices)
+        except (ValueError, IndexError):
+            raise ExternalSolverError('The solver gave an unknown argument in: ' + ' '.join(indices))
+
+    if output_lines == ['NO']:
+        return []
+    if output_lines and output_lines[0].startswith('['):
+        # ICCMA 2019 format: a list of lists of arguments.
+        return [to_extension(re.findall(r'[^\s,\[\]]+', extension))
+                for extension in re.findall(r'\[([^\[\]]*)\]', ''.join(output_lines))]
+    extensions = []
+    for line in output_lines:
+        parts = line.split()
+        if parts[0] != 'w':
+            raise ExternalSolverError('Unexpected line in the output of the solver: ' + line)
+        extensions.append(to_extension(parts[1:]))
+    return extensions
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
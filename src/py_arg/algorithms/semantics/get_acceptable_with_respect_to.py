@@ -33,6 +33,7 @@ def get_acceptable_with_respect_to(argument_set: Iterable[Argument],
     >>> b in acc_set
     True
     """
+    argument_set = set(argument_set)
     return {argument for argument in argumentation_framework.arguments
             if is_acceptable_with_respect_to(argument, argument_set, argumentation_framework)}
 
@@ -0,0 +1,149 @@
+import copy
+from typing import FrozenSet, Iterable, Iterator, Optional
+
+from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
+from py_arg.abstract_argumentation_classes.argument import Argument
+from py_arg.abstract_argumentation_classes.defeat import Defeat
+from py_arg.algorithms.semantics.get_grounded_labelling import get_grounded_labelling
+from py_arg.algorithms.semantics.get_preferred_extensions import iter_preferred_extensions
+from py_arg.algorithms.semantics.get_stable_extensions import iter_stable_extensions
+from py_arg.utils.budget import Budget, BudgetExceeded
+
+ACCEPTANCE_BOUNDS_SEMANTICS = ['Complete', 'Preferred', 'Stable']
+
+
+class AcceptanceBounds:
+    """
+    Sound bounds on the credulously and skeptically accepted arguments under complete, preferred or stable semantics:
+    each lower bound is a subset and each upper bound a superset of the accepted arguments. The bounds start from the
+    grounded labelling, which is a subset of each extension, while the arguments defeated by it are in no extension.
+    Every extension that is added (under complete semantics, this may also be a preferred extension) tightens the lower
+    bound of the credulous and the upper bound of the skeptical acceptance. Once all extensions have been added, finish
+    makes the bounds exact.
+
+    Under complete semantics, the skeptically accepted arguments are exactly the grounded extension. Under stable
+    semantics, there may be no extension at all, in which case no argument is credulously and every argument is
+    skeptically accepted; so until an extension is added, the credulous lower bound is empty and the skeptical upper
+    bound contains all arguments.
+
+    >>> a, b, c = Argument('a'), Argument('b'), Argument('c')
+    >>> af = AbstractArgumentationFramework('af', [a, b, c], [Defeat(a, b), Defeat(b, a), Defeat(b, c)])
+    >>> bounds = AcceptanceBounds(af, 'Preferred')
+    >>> sorted(bounds.credulous_lower), sorted(bounds.credulous_upper)
+    ([], [a, b, c])
+    >>> bounds.add_extension({a, c})
+    >>> sorted(bounds.credulous_lower), sorted(bounds.skeptical_upper)
+    ([a, c], [a, c])
+    """
+    def __init__(self, argumentation_framework: AbstractArgumentationFramework, semantics: str):
+        if semantics not in ACCEPTANCE_BOUNDS_SEMANTICS:
+            raise ValueError('Unknown semantics ' + semantics + '; choose one of ' +
+                             ', '.join(ACCEPTANCE_BOUNDS_SEMANTICS) + '.')
+        self.semantics = semantics
+        grounded_labelling = get_grounded_labelling(argumentation_framework)
+        grounded_extension = frozenset(grounded_labelling.in_arguments)
+        not_defeated = frozenset(argumentation_framework.arguments) - grounded_labelling.out_arguments
+        self.credulous_lower: FrozenSet[Argument] = frozenset() if semantics == 'Stable' else grounded_extension
+        self.credulous_upper: FrozenSet[Argument] = not_defeated
+        self.skeptical_lower: FrozenSet[Argument] = grounded_extension
+        self.skeptical_upper: FrozenSet[Argument] = \
+            frozenset(argumentation_framework.arguments) if semantics == 'Stable' else \
+            grounded_extension if semantics == 'Complete' else not_defeated
+        self.nr_of_extensions = 0
+        self.is_finished = False
+
+    def add_extension(self, extension: Iterable[Argument]):
+        """
+        Tighten the bounds with an extension.
+        """
+        extension = frozenset(extension)
+        if self.nr_of_extensions == 0 and self.semantics == 'Stable':
+            # Now that there is a stable extension, the grounded extension is credulously accepted and each argument
+            # defeated by it is not skeptically accepted.
+            self.credulous_lower = self.skeptical_lower
+            self.skeptical_upper = self.credulous_upper
+        self.credulous_lower = self.credulous_lower | extension
+        self.skeptical_upper = self.skeptical_upper & extension
+        self.nr_of_extensions += 1
+
+    def finish(self):
+        """
+        Make the bounds exact, once all extensions have been added.
+        """
+        self.credulous_upper = self.credulous_lower
+        self.skeptical_lower = self.skeptical_upper
+        self.is_finished = True
+
+    @property
+    def is_exact(self) -> bool:
+        return self.credulous_lower == self.credulous_upper and self.skeptical_lower == self.skeptical_upper
+
+
+def iter_acceptance_bounds(argumentation_framework: AbstractArgumentationFramework, semantics: str,
+                           budget: Optional[Budget] = None) -> Iterator[AcceptanceBounds]:
+    """
+    Iterate over ever tighter bounds on the credulously and skeptically accepted arguments, starting from the bounds
+    given by the grounded labelling and tightened by each extension found. The search stops once the bounds are exact.
+    Under complete semantics, only the preferred extensions are searched: they accept the same arguments credulously,
+    and the skeptically accepted arguments are already known.
+
+    :param argumentation_framework: The argumentation framework.
+    :param semantics: The semantics: Complete, Preferred or Stable.
+    :param budget: Budget for the search (see py_arg.utils.budget). If it is exhausted, BudgetExceeded is raised, with
+        the last bounds as partial results.
+    :return: Iterator over the bounds; the last bounds are exact.
+
+    >>> a, b, c = Argument('a'), Argument('b'), Argument('c')
+    >>> af = AbstractArgumentationFramework('af', [a, b, c], [Defeat(a, b), Defeat(b, a), Defeat(b, c)])
+    >>> [(len(bounds.credulous_lower), len(bounds.credulous_upper)) for bounds in iter_acceptance_bounds(af, 'Stable')]
+    [(0, 3), (2, 3), (3, 3)]
+    """
+    bounds = AcceptanceBounds(argumentation_framework, semantics)
+    yield copy.copy(bounds)
+    iter_extensions = iter_stable_extensions if semantics == 'Stable' else iter_preferred_extensions
+    try:
+        for extension in iter_extensions(argumentation_framework, budget=budget):
+            bounds.add_extension(extension)
+            if bounds.is_exact:
+                break
+            yield copy.copy(bounds)
+    except BudgetExceeded as error:
+        error.partial_results = copy.copy(bounds)
+        raise
+    bounds.finish()
+    yield bounds
+
+
+def get_acceptance_bounds(argumentation_framework: AbstractArgumentationFramework, semantics: str,
+                          budget: Optional[Budget] = None) -> AcceptanceBounds:
+    """
+    Get bounds on the credulously and skeptically accepted arguments: the exact sets if the search completes within the
+    budget, and otherwise the bounds found until the budget was exhausted (see iter_acceptance_bounds).
+
+    :param argumentation_framework: The argumentation framework.
+    :param semantics: The semantics: Complete, Preferred or Stable.
+    :param budget: Budget for the search (see py_arg.utils.budget).
+    :return: The bounds; is_finished tells if the search completed.
+
+    >>> a, b, c = Argument('a'), Argument('b'), Argument('c')
+    >>> af = AbstractArgumentationFramework('af', [a, b, c], [Defeat(a, b), Defeat(b, a), Defeat(b, c)])
+    >>> bounds = get_acceptance_bounds(af, 'Preferred')
+    >>> sorted(bounds.credulous_lower), sorted(bounds.skeptical_lower), bounds.is_finished
+    ([a, b, c], [], True)
+    >>> bounds = get_acceptance_bounds(af, 'Preferred', budget=Budget(max_nodes=0))
+    >>> sorted(bounds.credulous_lower), sorted(bounds.credulous_upper), bounds.is_finished
+    ([], [a, b, c], False)
+    """
+    bounds = None
+    try:
+        for bounds in iter_acceptance_bounds(argumentation_framework, semantics, budget):
+            pass
+    except BudgetExceeded as error:
+        return error.partial_results
+    return bounds
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
@@ -1,28 +1,31 @@
-from enum import Enum
-from typing import Set, Dict, FrozenSet
+from itertools import islice
+from typing import Set, FrozenSet, Iterator, Optional, Union
 
 from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
 from py_arg.abstract_argumentation_classes.argument import Argument
 from py_arg.abstract_argumentation_classes.defeat import Defeat
-
-
-# Algorithm 1 from Nofal, Samer, Katie Atkinson, and Paul E. Dunne. "Algorithms for decision problems in argument
-# systems under preferred semantics." Artificial Intelligence 207 (2014): 23-51.
-
-
-class AdmissibleLabel(Enum):
-    IN = 1  # Arguments *might* be in an admissible set
-    OUT = 2  # Argument is defeated by an IN argument
-    BLANK = 3  # Default label for all arguments, indicating that the argument is still unprocessed.
-    MUST_OUT = 4  # Argument defeats IN argument
-    UNDEC = 5  # Argument may not be included in an admissible set because not defended by any IN argument.
-
-
-def get_admissible_sets(argumentation_framework: AbstractArgumentationFramework) -> Set[FrozenSet[Argument]]:
+from py_arg.algorithms.semantics.extension_bitmask import bitmask_to_extension, bitmasks_to_extensions, \
+    collect_bitmasks
+from py_arg.algorithms.semantics.get_extensions_in_parallel import get_bitmasks_in_parallel
+from py_arg.algorithms.semantics.labelling_search import LabellingSearch
+from py_arg.utils.budget import Budget
+from py_arg.utils.search_statistics import SearchStatistics, in_phase
+
+
+def get_admissible_sets(argumentation_framework: AbstractArgumentationFramework, as_bitmasks: bool = False,
+                        n_jobs: int = 1, budget: Optional[Budget] = None,
+                        stats: Optional[SearchStatistics] = None) \
+        -> Union[Set[FrozenSet[Argument]], Set[int]]:
     """
     Get the admissible sets of an argumentation framework.
 
     :param argumentation_framework: The argumentation framework for which we need the admissible sets.
+    :param as_bitmasks: Return each admissible set as a bitmask over argumentation_framework.arguments instead.
+    :param n_jobs: Split the search over this many processes (one per CPU if smaller than 1), see
+        get_bitmasks_in_parallel.
+    :param budget: Budget for the search (see py_arg.utils.budget). If it is exhausted, BudgetExceeded is raised, with
+        the extensions found so far as partial results.
+    :param stats: Statistics in which the search counts its work (see py_arg.utils.search_statistics).
     :return: admissible sets of the argumentation framework.
 
     >>> b = Argument('b')
@@ -39,52 +42,38 @@ def get_admissible_sets(argumentation_framework: AbstractArgumentationFramework)
     >>> frozenset({c}) in ads
     False
     """
-    initial_labelling = {argument: AdmissibleLabel.BLANK
-                         for argument in argumentation_framework.arguments}
-    return _recursively_get_admissible_sets(argumentation_framework, initial_labelling, set())
-
-
-def _recursively_get_admissible_sets(argumentation_framework: AbstractArgumentationFramework,
-                                     labelling: Dict[Argument, AdmissibleLabel],
-                                     admissible_sets: Set[FrozenSet[Argument]]) -> Set[FrozenSet[Argument]]:
-    if all(labelling[argument] != AdmissibleLabel.BLANK for argument in argumentation_framework.arguments):
-        if all(labelling[argument] != AdmissibleLabel.MUST_OUT
-               for argument in argumentation_framework.arguments):
-            candidate_admissible_set = frozenset(sorted({argument for argument in argumentation_framework.arguments
-                                                         if labelling[argument] == AdmissibleLabel.IN}))
-            admissible_sets.add(candidate_admissible_set)
+    if n_jobs != 1:
+        admissible_bitmasks = get_bitmasks_in_parallel(argumentation_framework, 'Admissible', n_jobs, budget=budget,
+                                                       stats=stats)
     else:
-        blank_argument = [argument for argument in argumentation_framework.arguments
-                          if labelling[argument] == AdmissibleLabel.BLANK][0]
-        alternative_labelling = _in_trans(labelling, blank_argument, argumentation_framework)
-        admissible_sets = _recursively_get_admissible_sets(argumentation_framework, alternative_labelling,
-                                                           admissible_sets)
-        alternative_labelling = _undec_trans(labelling, blank_argument)
-        admissible_sets = _recursively_get_admissible_sets(argumentation_framework, alternative_labelling,
-                                                           admissible_sets)
-    return admissible_sets
-
-
-def _in_trans(labelling: Dict[Argument, AdmissibleLabel], argument: Argument,
-              argumentation_framework: AbstractArgumentationFramework) -> Dict[Argument, AdmissibleLabel]:
-    new_labelling = labelling.copy()
-    new_labelling[argument] = AdmissibleLabel.IN
-    for defeater in argumentation_framework.get_outgoing_defeat_arguments(argument):
-        if defeater == argument:
-            break
-        else:
-            new_labelling[defeater] = AdmissibleLabel.OUT
-    for defeated in argumentation_framework.get_incoming_defeat_arguments(argument):
-        if new_labelling[defeated] != AdmissibleLabel.OUT:
-            new_labelling[defeated] = AdmissibleLabel.MUST_OUT
-    return new_labelling
-
+        search = LabellingSearch.from_argumentation_framework(argumentation_framework, propagate_for='Admissible',
+                                                             budget=budget, stats=stats)
+        with in_phase(stats, 'search'):
+            admissible_bitmasks = collect_bitmasks(search.search(), argumentation_framework, as_bitmasks, budget)
+    if as_bitmasks:
+        return admissible_bitmasks
+    with in_phase(stats, 'conversion'):
+        return bitmasks_to_extensions(admissible_bitmasks, argumentation_framework)
+
+
+def iter_admissible_sets(argumentation_framework: AbstractArgumentationFramework, limit: Optional[int] = None,
+                         as_bitmasks: bool = False, budget: Optional[Budget] = None,
+                         stats: Optional[SearchStatistics] = None) \
+        -> Iterator[Union[FrozenSet[Argument], int]]:
+    """
+    Iterate over the admissible sets of an argumentation framework, yielding each as soon as the search finds it.
 
-def _undec_trans(labelling: Dict[Argument, AdmissibleLabel], argument: Argument) -> \
-        Dict[Argument, AdmissibleLabel]:
-    new_labelling = labelling.copy()
-    new_labelling[argument] = AdmissibleLabel.UNDEC
-    return new_labelling
+    :param argumentation_framework: The argumentation framework for which we need the admissible sets.
+    :param limit: Stop the search after this many admissible sets (no limit if None).
+    :param as_bitmasks: Yield bitmasks over argumentation_framework.arguments instead.
+    :param budget: Budget for the search nodes (see py_arg.utils.budget); BudgetExceeded is raised once it is exhausted.
+    :param stats: Statistics in which the search counts its work (see py_arg.utils.search_statistics).
+    :return: Iterator over the admissible sets of the argumentation framework.
+    """
+    search = LabellingSearch.from_argumentation_framework(argumentation_framework, propagate_for='Admissible',
+                                                         budget=budget, stats=stats)
+    for bitmask in islice(search.search(), limit):
+        yield bitmask if as_bitmasks else bitmask_to_extension(bitmask, argumentation_framework)
 
 
 if __name__ == "__main__":
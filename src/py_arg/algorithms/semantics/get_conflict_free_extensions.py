@@ -1,29 +1,82 @@
-from typing import Set
+from typing import FrozenSet, Iterator, List, Optional, Set, Tuple, Union
 from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
 from py_arg.abstract_argumentation_classes.argument import Argument
+from py_arg.abstract_argumentation_classes.compact_argumentation_framework import CompactArgumentationFramework
+from py_arg.abstract_argumentation_classes.defeat import Defeat
+from py_arg.algorithms.semantics.extension_bitmask import bitmask_to_extension, bitmasks_to_extensions, \
+    collect_bitmasks
+from py_arg.utils.budget import Budget
 
 
-def apply(argumentation_framework: AbstractArgumentationFramework) -> Set[frozenset[Argument]]:
-    return recursively_get_cf(set(), set(argumentation_framework.arguments), argumentation_framework)
+def apply(argumentation_framework: AbstractArgumentationFramework, as_bitmasks: bool = False,
+          budget: Optional[Budget] = None) -> Union[Set[frozenset[Argument]], Set[int]]:
+    if not argumentation_framework.arguments:
+        return set()
+    conflict_free_bitmasks = collect_bitmasks(iter_conflict_free_extensions(argumentation_framework, as_bitmasks=True,
+                                                                            budget=budget),
+                                              argumentation_framework, as_bitmasks, budget)
+    if as_bitmasks:
+        return conflict_free_bitmasks
+    return bitmasks_to_extensions(conflict_free_bitmasks, argumentation_framework)
 
 
-def recursively_get_cf(in_: Set[Argument], todo: Set[Argument],
-                       af: AbstractArgumentationFramework) -> Set[frozenset[Argument]]:
-    if len(todo) == 0:
-        return set()
+def iter_conflict_free_extensions(argumentation_framework: AbstractArgumentationFramework, as_bitmasks: bool = False,
+                                  budget: Optional[Budget] = None) -> Iterator[Union[FrozenSet[Argument], int]]:
+    """
+    Iterate over the conflict-free sets of an argumentation framework (including the empty set), without keeping them
+    in memory. Each set is extended only with arguments of a higher id that are not in conflict with it, so every set
+    is generated exactly once; the candidates are bitmasks, so extending a set takes a few bitwise operations.
+
+    :param argumentation_framework: The argumentation framework for which we need the conflict-free sets.
+    :param as_bitmasks: Yield bitmasks over argumentation_framework.arguments instead.
+    :param budget: Budget for the search nodes (see py_arg.utils.budget); BudgetExceeded is raised once it is exhausted.
+    :return: Iterator over the conflict-free sets.
+
+    >>> a, b, c = Argument('a'), Argument('b'), Argument('c')
+    >>> af = AbstractArgumentationFramework('af', [a, b, c], [Defeat(a, b), Defeat(c, c)])
+    >>> sorted(sorted(extension) for extension in iter_conflict_free_extensions(af))
+    [[], [a], [b]]
+    """
+    conflict_bitmasks, self_attacking_bitmask = get_conflict_bitmasks(argumentation_framework)
+    all_bitmask = (1 << len(conflict_bitmasks)) - 1
+    # Each entry is a conflict-free set and the arguments that may still be added to it.
+    stack = [(0, all_bitmask & ~self_attacking_bitmask)]
+    while stack:
+        bitmask, candidate_bitmask = stack.pop()
+        if budget is not None:
+            budget.add_node()
+        yield bitmask if as_bitmasks else bitmask_to_extension(bitmask, argumentation_framework)
+        while candidate_bitmask:
+            lowest_bit = candidate_bitmask & -candidate_bitmask
+            candidate_bitmask ^= lowest_bit
+            argument_id = lowest_bit.bit_length() - 1
+            stack.append((bitmask | lowest_bit, candidate_bitmask & ~conflict_bitmasks[argument_id]))
+
+
+def get_conflict_bitmasks(argumentation_framework: AbstractArgumentationFramework) -> Tuple[List[int], int]:
+    """
+    Get the undirected conflict graph of an argumentation framework: for each argument, the bitmask of the arguments
+    that it defeats or is defeated by (including itself), and the bitmask of the self-defeating arguments.
+
+    >>> a, b, c = Argument('a'), Argument('b'), Argument('c')
+    >>> af = AbstractArgumentationFramework('af', [a, b, c], [Defeat(a, b), Defeat(c, c)])
+    >>> conflict_bitmasks, self_attacking_bitmask = get_conflict_bitmasks(af)
+    >>> [bin(bitmask) for bitmask in conflict_bitmasks], bin(self_attacking_bitmask)
+    (['0b11', '0b11', '0b100'], '0b100')
+    """
+    compact_framework = CompactArgumentationFramework.from_abstract_argumentation_framework(argumentation_framework)
+    conflict_bitmasks = [1 << argument_id for argument_id in range(compact_framework.nr_of_arguments)]
+    self_attacking_bitmask = 0
+    for argument_id, attacked_ids in enumerate(compact_framework.get_attacked_lists()):
+        for attacked_id in attacked_ids:
+            conflict_bitmasks[argument_id] |= 1 << attacked_id
+            conflict_bitmasks[attacked_id] |= 1 << argument_id
+            if attacked_id == argument_id:
+                self_attacking_bitmask |= 1 << argument_id
+    return conflict_bitmasks, self_attacking_bitmask
+
+
+if __name__ == "__main__":
+    import doctest
 
-    out = {frozenset(in_)}
-    for arg in todo:
-        if arg in arg.get_outgoing_defeat_arguments:
-            continue
-        rec_todo = set(todo.copy())
-        rec_todo.remove(arg)
-        rm = set()
-        for a in rec_todo:
-            if a < arg or a in arg.get_outgoing_defeat_arguments or a in arg.get_ingoing_defeat_arguments:
-                rm.add(a)
-        rec_todo.difference_update(rm)
-        out.add(frozenset(in_.union({arg})))
-        out.update(recursively_get_cf(in_.union({arg}), rec_todo, af))
-
-    return out
+    doctest.testmod()
@@ -0,0 +1,204 @@
+from typing import FrozenSet, Iterable, List, Optional, Set, Tuple, Union
+
+from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
+from py_arg.abstract_argumentation_classes.argument import Argument
+from py_arg.abstract_argumentation_classes.compact_argumentation_framework import CompactArgumentationFramework
+from py_arg.abstract_argumentation_classes.defeat import Defeat
+from py_arg.algorithms.semantics.extension_bitmask import bitmask_to_extension, iterate_bitmask
+from py_arg.algorithms.semantics.get_grounded_labelling import get_grounded_labelling
+from py_arg.algorithms.semantics.get_naive_extensions import iter_naive_extensions
+from py_arg.algorithms.semantics.get_stable_extensions import iter_stable_extensions
+from py_arg.algorithms.semantics.get_strongly_connected_components import get_strongly_connected_component_ids
+from py_arg.algorithms.semantics.iterate_extensions import iter_extensions
+from py_arg.utils.budget import Budget, iterate_within_budget
+
+EXTENSION_SEMANTICS = ['Admissible', 'Complete', 'Grounded', 'Preferred', 'Ideal', 'Stable', 'SemiStable', 'Stage',
+                       'Eager', 'Naive']
+
+# The classes of frameworks recognised by get_framework_classes, and the paths reported by get_extensions: one of
+# these classes, or GENERAL if the extensions were found by the general search.
+ACYCLIC = 'acyclic'
+EVEN_CYCLE_FREE = 'even-cycle-free'
+SYMMETRIC = 'symmetric'
+BIPARTITE = 'bipartite'
+GENERAL = 'general'
+
+# In a framework without even cycles, the grounded extension is the only complete extension, so it is the only
+# extension under these semantics. If it is stable, it is also the only stable and stage extension.
+_UNIQUE_COMPLETE_SEMANTICS = ['Complete', 'Grounded', 'Preferred', 'Ideal', 'SemiStable', 'Eager']
+# In a symmetric framework, every conflict-free set is admissible, so the preferred extensions are the naive ones, and
+# in a bipartite framework (which has no odd cycles), every preferred extension is stable. Semi-stable and stage
+# extensions are the stable ones as soon as there is a stable extension.
+_STABLE_BASED_SEMANTICS = ['Preferred', 'Stable', 'SemiStable', 'Stage']
+
+
+def get_framework_classes(argumentation_framework: AbstractArgumentationFramework) -> Set[str]:
+    """
+    Get the classes of the defeat graph of an argumentation framework for which get_extensions has a polynomial path:
+
+    * ACYCLIC: there is no cycle of defeats (including self-defeats);
+    * EVEN_CYCLE_FREE: each strongly connected component is a single argument or a simple cycle of odd length, which
+      is a special case of a framework without even cycles (recognising those in general takes a far more involved
+      algorithm);
+    * SYMMETRIC: each argument defeats the arguments that defeat it;
+    * BIPARTITE: the arguments can be split into two sets without defeats within a set.
+
+    All checks take O(|arguments| + |defeats|) time.
+
+    :param argumentation_framework: The argumentation framework to classify.
+    :return: The set of classes to which the framework belongs.
+
+    >>> a, b, c, d = Argument('a'), Argument('b'), Argument('c'), Argument('d')
+    >>> defeats = [Defeat(a, b), Defeat(b, c), Defeat(c, a), Defeat(c, d)]
+    >>> af = AbstractArgumentationFramework('af', [a, b, c, d], defeats)
+    >>> sorted(get_framework_classes(af))
+    ['even-cycle-free']
+    >>> af = AbstractArgumentationFramework('af', [a, b, c], [Defeat(a, b), Defeat(b, a), Defeat(c, b), Defeat(b, c)])
+    >>> sorted(get_framework_classes(af))
+    ['bipartite', 'symmetric']
+    """
+    compact_framework = CompactArgumentationFramework.from_abstract_argumentation_framework(argumentation_framework)
+    attacked_ids = compact_framework.get_attacked_lists()
+    attacker_ids = compact_framework.get_attacker_lists()
+    framework_classes = set()
+    components = get_strongly_connected_component_ids(attacked_ids)
+    if all(len(component) == 1 and component[0] not in attacked_ids[component[0]] for component in components):
+        framework_classes.update([ACYCLIC, EVEN_CYCLE_FREE])
+    elif all(_is_odd_cycle(component, attacked_ids) for component in components if len(component) > 1):
+        framework_classes.add(EVEN_CYCLE_FREE)
+    if _is_symmetric(attacked_ids):
+        framework_classes.add(SYMMETRIC)
+    if _is_bipartite(attacked_ids, attacker_ids):
+        framework_classes.add(BIPARTITE)
+    return framework_classes
+
+
+def _is_odd_cycle(component: List[int], attacked_ids: List[List[int]]) -> bool:
+    # A strongly connected component in which each argument defeats exactly one argument of the component is a simple
+    # cycle through all its arguments.
+    component_ids = set(component)
+    return len(component) % 2 == 1 and \
+        all(len({attacked_id for attacked_id in attacked_ids[argument_id] if attacked_id in component_ids}) == 1
+            for argument_id in component)
+
+
+def _is_symmetric(attacked_ids: List[List[int]]) -> bool:
+    defeats = {(argument_id, attacked_id)
+               for argument_id in range(len(attacked_ids)) for attacked_id in attacked_ids[argument_id]}
+    return all((attacked_id, argument_id) in defeats for argument_id, attacked_id in defeats)
+
+
+def _is_bipartite(attacked_ids: List[List[int]], attacker_ids: List[List[int]]) -> bool:
+    # Colour the arguments of each weakly connected component alternately, breadth-first. A self-defeating argument
+    # gets the colour of its neighbour, itself, so the framework is not bipartite.
+    colours = [-1] * len(attacked_ids)
+    for root_id in range(len(attacked_ids)):
+        if colours[root_id] != -1:
+            continue
+        colours[root_id] = 0
+        queue = [root_id]
+        for argument_id in queue:
+            for neighbour_id in attacked_ids[argument_id] + attacker_ids[argument_id]:
+                if colours[neighbour_id] == -1:
+                    colours[neighbour_id] = 1 - colours[argument_id]
+                    queue.append(neighbour_id)
+                elif colours[neighbour_id] == colours[argument_id]:
+                    return False
+    return True
+
+
+def get_extensions(argumentation_framework: AbstractArgumentationFramework, semantics: str,
+                   budget: Optional[Budget] = None, return_path: bool = False) \
+        -> Union[Set[FrozenSet[Argument]], Tuple[Set[FrozenSet[Argument]], str]]:
+    """
+    Get the extensions of an argumentation framework under some semantics, using a polynomial algorithm if the
+    framework belongs to a class for which there is one (see get_framework_classes), and the general search otherwise:
+
+    * in a framework without even cycles (in particular an acyclic one), the grounded extension is the only complete,
+      preferred, semi-stable, ideal and eager extension, and the only stable and stage extension if it is stable (if
+      not, there is no stable extension);
+    * in a symmetric framework, the preferred extensions are the naive extensions, and the stable extensions (as well
+      as the semi-stable and stage extensions, if there are any) are the naive extensions that defeat every other
+      argument;
+    * in a bipartite framework, the preferred, semi-stable and stage extensions are the stable extensions, which the
+      labelling search enumerates without a maximality check.
+
+    A symmetric or bipartite framework may still have exponentially many extensions; what these paths save is checking
+    each candidate for admissibility and maximality.
+
+    :param argumentation_framework: The argumentation framework for which we need the extensions.
+    :param semantics: The semantics: Admissible, Complete, Grounded, Preferred, Ideal, Stable, SemiStable, Stage, Eager
+        or Naive.
+    :param budget: Budget for the search and the extensions (see py_arg.utils.budget). If it is exhausted,
+        BudgetExceeded is raised, with the list of extensions found so far as partial results.
+    :param return_path: Also return the path that was taken: the class of the framework that was used (ACYCLIC,
+        EVEN_CYCLE_FREE, SYMMETRIC or BIPARTITE), or GENERAL.
+    :return: The extensions, and the path if return_path is True.
+
+    >>> a, b, c = Argument('a'), Argument('b'), Argument('c')
+    >>> af = AbstractArgumentationFramework('af', [a, b, c], [Defeat(a, b), Defeat(b, c)])
+    >>> extensions, path = get_extensions(af, 'Preferred', return_path=True)
+    >>> [sorted(extension) for extension in extensions], path
+    ([[a, c]], 'acyclic')
+    >>> af = AbstractArgumentationFramework('af', [a, b, c], [Defeat(a, b), Defeat(b, a), Defeat(c, c)])
+    >>> extensions, path = get_extensions(af, 'Stable', return_path=True)
+    >>> extensions, path
+    (set(), 'symmetric')
+    >>> extensions, path = get_extensions(af, 'SemiStable', return_path=True)
+    >>> sorted(sorted(extension) for extension in extensions), path
+    ([[a], [b]], 'general')
+    """
+    if semantics not in EXTENSION_SEMANTICS:
+        raise ValueError('Unknown semantics ' + semantics + '; choose one of ' + ', '.join(EXTENSION_SEMANTICS) + '.')
+    framework_classes = get_framework_classes(argumentation_framework)
+    path, extensions = _get_tractable_extensions(argumentation_framework, semantics, framework_classes, budget)
+    if path != GENERAL:
+        extensions = set(iterate_within_budget(extensions, budget))
+    elif semantics == 'Naive':
+        extensions = set(iterate_within_budget(iter_naive_extensions(argumentation_framework, budget=budget), budget))
+    else:
+        extensions = set(iter_extensions(argumentation_framework, semantics, budget=budget))
+    if return_path:
+        return extensions, path
+    return extensions
+
+
+def _get_tractable_extensions(argumentation_framework: AbstractArgumentationFramework, semantics: str,
+                              framework_classes: Set[str], budget: Optional[Budget]) \
+        -> Tuple[str, Iterable[FrozenSet[Argument]]]:
+    # Returns the path and the extensions, or GENERAL (and no extensions) if no polynomial algorithm applies.
+    if EVEN_CYCLE_FREE in framework_classes and semantics in _UNIQUE_COMPLETE_SEMANTICS + ['Stable', 'Stage']:
+        path = ACYCLIC if ACYCLIC in framework_classes else EVEN_CYCLE_FREE
+        grounded_labelling = get_grounded_labelling(argumentation_framework)
+        if semantics in _UNIQUE_COMPLETE_SEMANTICS or not grounded_labelling.undec_arguments:
+            return path, [frozenset(grounded_labelling.in_arguments)]
+        if semantics == 'Stable':
+            return path, []
+    if SYMMETRIC in framework_classes and semantics in _STABLE_BASED_SEMANTICS:
+        naive_bitmasks = iter_naive_extensions(argumentation_framework, as_bitmasks=True, budget=budget)
+        if semantics == 'Preferred':
+            return SYMMETRIC, (bitmask_to_extension(bitmask, argumentation_framework) for bitmask in naive_bitmasks)
+        compact_framework = CompactArgumentationFramework.from_abstract_argumentation_framework(argumentation_framework)
+        attacked_ids = compact_framework.get_attacked_lists()
+        all_bitmask = (1 << compact_framework.nr_of_arguments) - 1
+        stable_bitmasks = [bitmask for bitmask in naive_bitmasks
+                           if _get_range_bitmask(bitmask, attacked_ids) == all_bitmask]
+        if stable_bitmasks or semantics == 'Stable':
+            return SYMMETRIC, [bitmask_to_extension(bitmask, argumentation_framework) for bitmask in stable_bitmasks]
+    if BIPARTITE in framework_classes and semantics in _STABLE_BASED_SEMANTICS:
+        return BIPARTITE, iter_stable_extensions(argumentation_framework, budget=budget)
+    return GENERAL, []
+
+
+def _get_range_bitmask(bitmask: int, attacked_ids: List[List[int]]) -> int:
+    range_bitmask = bitmask
+    for argument_id in iterate_bitmask(bitmask):
+        for attacked_id in attacked_ids[argument_id]:
+            range_bitmask |= 1 << attacked_id
+    return range_bitmask
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
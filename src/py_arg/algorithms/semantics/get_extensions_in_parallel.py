@@ -0,0 +1,116 @@
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import List, Optional, Set, Tuple
+
+from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
+from py_arg.abstract_argumentation_classes.argument import Argument
+from py_arg.abstract_argumentation_classes.compact_argumentation_framework import CompactArgumentationFramework
+from py_arg.abstract_argumentation_classes.defeat import Defeat
+from py_arg.algorithms.semantics.extension_bitmask import get_maximal_bitmasks, iterate_bitmask
+from py_arg.algorithms.semantics.labelling_search import LabellingSearch, is_admissible_labelling, \
+    is_complete_labelling, is_stable_labelling, iter_maximal_bitmasks
+from py_arg.algorithms.semantics.range_maximal_search import RangeAntichain, get_range_maximal_bitmasks
+from py_arg.utils.budget import Budget
+from py_arg.utils.search_statistics import SearchStatistics
+
+PARALLEL_SEMANTICS = ['Admissible', 'Complete', 'Preferred', 'Stable', 'SemiStable']
+
+# The framework of the worker process, as lists of defeated and defeating argument ids. It is sent once per worker
+# when the worker starts, rather than with every subproblem.
+_worker_framework: Optional[Tuple[List[List[int]], List[List[int]]]] = None
+
+
+def get_bitmasks_in_parallel(argumentation_framework: AbstractArgumentationFramework, semantics: str, n_jobs: int,
+                             nr_of_subproblems_per_job: int = 4, budget: Optional[Budget] = None,
+                             stats: Optional[SearchStatistics] = None) -> Set[int]:
+    """
+    Get the extensions of an argumentation framework under some semantics, as bitmasks over
+    argumentation_framework.arguments, using several processes. The labelling search tree is split at its top
+    branching decisions into independent subtrees, which are searched by a pool of worker processes. The workers only
+    get the defeat relation as arrays of argument ids, and return bitmasks. For preferred and semi-stable semantics,
+    each worker returns the extensions that are maximal within its subtree, and only those that are also maximal among
+    the results of all workers are kept.
+
+    :param argumentation_framework: The argumentation framework for which we need the extensions.
+    :param semantics: The semantics: Admissible, Complete, Preferred, Stable or SemiStable.
+    :param n_jobs: The number of worker processes; if it is smaller than 1, there is one per CPU.
+    :param nr_of_subproblems_per_job: The search tree is split into at least this many subtrees per worker (unless
+        it is too small), so that workers that finish early can take over the remaining subtrees.
+    :param budget: Not supported: the worker processes cannot share a budget, so this raises ValueError unless None.
+    :param stats: Not supported either, for the same reason.
+    :return: The bitmasks of the extensions.
+
+    >>> a, b, c = Argument('a'), Argument('b'), Argument('c')
+    >>> af = AbstractArgumentationFramework('af', [a, b, c], [Defeat(a, b), Defeat(b, a), Defeat(b, c), Defeat(c, c)])
+    >>> sorted(get_bitmasks_in_parallel(af, 'Preferred', n_jobs=2))
+    [1, 2]
+    """
+    if semantics not in PARALLEL_SEMANTICS:
+        raise ValueError('Unknown semantics ' + semantics + '; choose one of ' + ', '.join(PARALLEL_SEMANTICS) + '.')
+    if budget is not None:
+        raise ValueError('A budget cannot be used for a search in several processes.')
+    if stats is not None:
+        raise ValueError('Statistics cannot be collected for a search in several processes.')
+    if n_jobs < 1:
+        n_jobs = os.cpu_count() or 1
+
+    compact_framework = CompactArgumentationFramework.from_abstract_argumentation_framework(argumentation_framework)
+    attacked_lists = compact_framework.get_attacked_lists()
+    search = _create_search(attacked_lists, compact_framework.get_attacker_lists(), semantics)
+    subproblems = search.split(n_jobs * nr_of_subproblems_per_job)
+    framework_arrays = (compact_framework.attacked_offsets, compact_framework.attacked_ids,
+                        compact_framework.attacker_offsets, compact_framework.attacker_ids)
+    with ProcessPoolExecutor(max_workers=n_jobs, initializer=_initialise_worker,
+                             initargs=framework_arrays) as executor:
+        results = list(executor.map(_search_subproblem, repeat(semantics), subproblems))
+
+    bitmasks = {bitmask for result in results for bitmask in result}
+    if semantics == 'Preferred':
+        return get_maximal_bitmasks(bitmasks)
+    if semantics == 'SemiStable':
+        antichain = RangeAntichain()
+        for bitmask in bitmasks:
+            range_bitmask = bitmask
+            for argument_id in iterate_bitmask(bitmask):
+                for attacked_id in attacked_lists[argument_id]:
+                    range_bitmask |= 1 << attacked_id
+            antichain.add(range_bitmask, bitmask)
+        return antichain.get_in_bitmasks()
+    return bitmasks
+
+
+def _create_search(attacked_ids: List[List[int]], attacker_ids: List[List[int]], semantics: str) -> LabellingSearch:
+    is_accepted = {'Complete': is_complete_labelling, 'Stable': is_stable_labelling}.get(semantics,
+                                                                                        is_admissible_labelling)
+    # Except for admissible sets, all extensions are complete, so they contain the grounded extension.
+    propagate_for = semantics if semantics in ['Admissible', 'Stable'] else 'Complete'
+    return LabellingSearch(attacked_ids, attacker_ids, is_accepted=is_accepted,
+                           fix_grounded_labels=semantics != 'Admissible', propagate_for=propagate_for)
+
+
+def _initialise_worker(attacked_offsets: array, attacked_ids: array, attacker_offsets: array, attacker_ids: array):
+    global _worker_framework
+    _worker_framework = (_to_lists(attacked_offsets, attacked_ids), _to_lists(attacker_offsets, attacker_ids))
+
+
+def _to_lists(offsets: array, ids: array) -> List[List[int]]:
+    return [ids[offsets[i]:offsets[i + 1]].tolist() for i in range(len(offsets) - 1)]
+
+
+def _search_subproblem(semantics: str, decisions: List[Tuple[int, int]]) -> List[int]:
+    attacked_ids, attacker_ids = _worker_framework
+    search = _create_search(attacked_ids, attacker_ids, semantics)
+    search.fix_decisions(decisions)
+    if semantics == 'SemiStable':
+        return list(get_range_maximal_bitmasks(search))
+    if semantics == 'Preferred':
+        return list(iter_maximal_bitmasks(search))
+    return list(search.search())
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
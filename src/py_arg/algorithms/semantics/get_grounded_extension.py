@@ -1,17 +1,20 @@
-from typing import Set
+from typing import Set, Union
 
 from py_arg.abstract_argumentation_classes.defeat import Defeat
-from py_arg.algorithms.semantics.get_acceptable_with_respect_to import get_acceptable_with_respect_to
 from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
 from py_arg.abstract_argumentation_classes.argument import Argument
-from py_arg.utils.fixpoint import get_least_fixed_point
+from py_arg.algorithms.semantics.extension_bitmask import extension_to_bitmask
+from py_arg.algorithms.semantics.get_grounded_labelling import get_grounded_labelling
 
 
-def get_grounded_extension(argumentation_framework: AbstractArgumentationFramework) -> Set[Argument]:
+def get_grounded_extension(argumentation_framework: AbstractArgumentationFramework, as_bitmask: bool = False) \
+        -> Union[Set[Argument], int]:
     """
+    Get the grounded extension of an argumentation framework, in time linear in the number of arguments and defeats.
 
-    :param argumentation_framework:
-    :return:
+    :param argumentation_framework: The argumentation framework for which we need the grounded extension.
+    :param as_bitmask: Return the extension as a bitmask over argumentation_framework.arguments instead.
+    :return: The grounded extension of the argumentation framework.
 
     >>> a = Argument('a')
     >>> b = Argument('b')
@@ -30,7 +33,10 @@ def get_grounded_extension(argumentation_framework: AbstractArgumentationFramewo
     >>> d in ge
     True
     """
-    return get_least_fixed_point(lambda x: get_acceptable_with_respect_to(x, argumentation_framework), set())
+    grounded_extension = get_grounded_labelling(argumentation_framework).in_arguments
+    if as_bitmask:
+        return extension_to_bitmask(grounded_extension, argumentation_framework)
+    return grounded_extension
 
 
 if __name__ == "__main__":
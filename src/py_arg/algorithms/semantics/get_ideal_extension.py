@@ -1,28 +1,26 @@
-from enum import Enum
-from typing import Set, Dict, FrozenSet, List, Any
+from typing import Set, List, Any, Optional
 
 from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
 from py_arg.abstract_argumentation_classes.argument import Argument
+from py_arg.abstract_argumentation_classes.compact_argumentation_framework import CompactArgumentationFramework
 from py_arg.abstract_argumentation_classes.defeat import Defeat
+from py_arg.algorithms.semantics.extension_bitmask import bitmask_to_extension, iterate_bitmask
+from py_arg.algorithms.semantics.get_largest_admissible_subset import get_largest_admissible_subset
+from py_arg.algorithms.semantics.labelling_search import LabellingSearch, IN, BLANK
+from py_arg.utils.budget import Budget
+from py_arg.utils.search_statistics import SearchStatistics, in_phase
 
 
-# Algorithm 1 from Nofal, Samer, Katie Atkinson, and Paul E. Dunne. "Algorithms for decision problems in argument
-# systems under preferred semantics." Artificial Intelligence 207 (2014): 23-51.
-
-
-class IdealExtensionLabel(Enum):
-    IN = 1  # Arguments *might* be in a preferred extension
-    OUT = 2  # Argument is defeated by an IN argument
-    BLANK = 3  # Default label for all arguments, indicating that the argument is still unprocessed.
-    MUST_OUT = 4  # Argument defeats IN argument
-    UNDEC = 5  # Argument may not be included in a preferred extension because not defended by any IN argument.
-
-
-def get_ideal_extension(argumentation_framework: AbstractArgumentationFramework) -> List[Set[Any]]:
+def get_ideal_extension(argumentation_framework: AbstractArgumentationFramework, as_bitmasks: bool = False,
+                        budget: Optional[Budget] = None, stats: Optional[SearchStatistics] = None) -> List[Set[Any]]:
     """
     Get the ideal extension of an argumentation framework.
 
     :param argumentation_framework: The argumentation framework for which we need the ideal extension.
+    :param as_bitmasks: Return the extension as a bitmask over argumentation_framework.arguments instead.
+    :param budget: Budget for the search (see py_arg.utils.budget). If it is exhausted, BudgetExceeded is raised,
+        without partial results.
+    :param stats: Statistics in which the search counts its work (see py_arg.utils.search_statistics).
     :return: ideal extension of the argumentation framework.
 
     >>> b = Argument('b')
@@ -39,68 +37,50 @@ def get_ideal_extension(argumentation_framework: AbstractArgumentationFramework)
     >>> frozenset({b}) in idl
     False
     """
-    initial_labelling = {argument: IdealExtensionLabel.BLANK
-                         for argument in argumentation_framework.arguments}
-    frozen_admissible_sets = _recursively_get_admissible_sets(argumentation_framework, initial_labelling, set())
-    admissible_sets = [set(frozen_admissible_set) for frozen_admissible_set in frozen_admissible_sets]
-    preferred_extensions = []
-    for candidate_preferred_extension in admissible_sets:
-        if not any(candidate_preferred_extension < admissible_set
-                   for admissible_set in admissible_sets):
-            preferred_extensions.append(candidate_preferred_extension)
-    intersect_preferred = set.intersection(*preferred_extensions)
-    admissible_subsets = [admissible_set for admissible_set in admissible_sets if
-                          intersect_preferred.issuperset(admissible_set) == True]
-    max_admissible_subsets = []
-    for candidate_ideal_extension in admissible_subsets:
-        if not any(candidate_ideal_extension < admissible_set
-                   for admissible_set in admissible_subsets):
-            max_admissible_subsets.append(candidate_ideal_extension)
-    return max_admissible_subsets
-
-
-def _recursively_get_admissible_sets(argumentation_framework: AbstractArgumentationFramework,
-                                     labelling: Dict[Argument, IdealExtensionLabel],
-                                     admissible_sets: Set[FrozenSet[Argument]]) -> Set[FrozenSet[Argument]]:
-    if all(labelling[argument] != IdealExtensionLabel.BLANK for argument in argumentation_framework.arguments):
-        if all(labelling[argument] != IdealExtensionLabel.MUST_OUT
-               for argument in argumentation_framework.arguments):
-            candidate_admissible_set = frozenset(sorted({argument for argument in argumentation_framework.arguments
-                                                         if labelling[argument] == IdealExtensionLabel.IN}))
-            admissible_sets.add(candidate_admissible_set)
-    else:
-        blank_argument = [argument for argument in argumentation_framework.arguments
-                          if labelling[argument] == IdealExtensionLabel.BLANK][0]
-        alternative_labelling = _in_trans(labelling, blank_argument, argumentation_framework)
-        admissible_sets = _recursively_get_admissible_sets(argumentation_framework, alternative_labelling,
-                                                           admissible_sets)
-        alternative_labelling = _undec_trans(labelling, blank_argument)
-        admissible_sets = _recursively_get_admissible_sets(argumentation_framework, alternative_labelling,
-                                                           admissible_sets)
-
-    return admissible_sets
-
-
-def _in_trans(labelling: Dict[Argument, IdealExtensionLabel], argument: Argument,
-              argumentation_framework: AbstractArgumentationFramework) -> Dict[Argument, IdealExtensionLabel]:
-    new_labelling = labelling.copy()
-    new_labelling[argument] = IdealExtensionLabel.IN
-    for defeater in argumentation_framework.get_outgoing_defeat_arguments(argument):
-        if defeater == argument:
-            break
-        else:
-            new_labelling[defeater] = IdealExtensionLabel.OUT
-    for defeated in argumentation_framework.get_incoming_defeat_arguments(argument):
-        if new_labelling[defeated] != IdealExtensionLabel.OUT:
-            new_labelling[defeated] = IdealExtensionLabel.MUST_OUT
-    return new_labelling
-
-
-def _undec_trans(labelling: Dict[Argument, IdealExtensionLabel], argument: Argument) -> \
-        Dict[Argument, IdealExtensionLabel]:
-    new_labelling = labelling.copy()
-    new_labelling[argument] = IdealExtensionLabel.UNDEC
-    return new_labelling
+    # Algorithm from Dunne, Paul E. "The computational complexity of ideal semantics." Artificial Intelligence 173
+    # (2009): 1559-1591. An admissible set is contained in each preferred extension iff none of its arguments is
+    # defeated by a credulously accepted argument (one in some admissible set). So the ideal extension is the largest
+    # admissible subset of the credulously accepted arguments that have no credulously accepted defeater, which is
+    # conflict-free. Only the set of credulously accepted arguments needs a search, rather than all admissible sets.
+    compact_framework = CompactArgumentationFramework.from_abstract_argumentation_framework(argumentation_framework)
+    attacked_ids = compact_framework.get_attacked_lists()
+    attacker_ids = compact_framework.get_attacker_lists()
+    credulous_bitmask = _get_credulously_accepted_bitmask(attacked_ids, attacker_ids, budget, stats)
+    candidate_bitmask = 0
+    for argument_id in iterate_bitmask(credulous_bitmask):
+        if not any(credulous_bitmask >> attacker_id & 1 for attacker_id in attacker_ids[argument_id]):
+            candidate_bitmask |= 1 << argument_id
+    max_admissible_subsets = [get_largest_admissible_subset(candidate_bitmask, attacked_ids, attacker_ids)]
+    if as_bitmasks:
+        return list(max_admissible_subsets)
+    return [set(bitmask_to_extension(bitmask, argumentation_framework)) for bitmask in max_admissible_subsets]
+
+
+def _get_credulously_accepted_bitmask(attacked_ids: List[List[int]], attacker_ids: List[List[int]],
+                                      budget: Optional[Budget], stats: Optional[SearchStatistics]) -> int:
+    """
+    Get the bitmask of the arguments that are in some admissible set. These are the arguments that are IN in the
+    grounded labelling, and the UNDEC arguments that are IN in some complete labelling. For each UNDEC argument that is
+    not known to be accepted yet, the search looks for a complete labelling in which it is IN, and all IN arguments of
+    that labelling are accepted as well, so often only a few queries are needed. The queries share one search, whose
+    grounded labels are fixed once, and stop at the first labelling found; they branch on the defeaters of MUST_OUT
+    arguments first, so an argument that cannot be defended is usually rejected by propagation alone.
+    """
+    search = LabellingSearch(attacked_ids, attacker_ids, fix_grounded_labels=True, propagate_for='Complete',
+                             branching='attacker_of_in', budget=budget, stats=stats)
+    credulous_bitmask = search.get_bitmask(IN)
+    undecided_ids = [argument_id for argument_id, label in enumerate(search.labels)
+                     if label == BLANK and not search.is_self_attacking[argument_id]]
+    with in_phase(stats, 'search'):
+        for argument_id in undecided_ids:
+            if credulous_bitmask >> argument_id & 1:
+                continue
+            labellings = search.search_assuming([(argument_id, IN)])
+            in_bitmask = next(labellings, None)
+            labellings.close()
+            if in_bitmask is not None:
+                credulous_bitmask |= in_bitmask
+    return credulous_bitmask
 
 
 if __name__ == "__main__":
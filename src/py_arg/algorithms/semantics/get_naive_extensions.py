@@ -1,15 +1,97 @@
-from typing import Set
+from typing import FrozenSet, Iterator, List, Optional, Set, Union
 from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
 from py_arg.abstract_argumentation_classes.argument import Argument
+from py_arg.abstract_argumentation_classes.defeat import Defeat
 import py_arg.algorithms.semantics.get_conflict_free_extensions as get_conflict_free_extensions
+from py_arg.algorithms.semantics.extension_bitmask import bitmask_to_extension, bitmasks_to_extensions, \
+    collect_bitmasks, iterate_bitmask
+from py_arg.utils.budget import Budget
+from py_arg.utils.search_statistics import SearchStatistics
 
 
-def apply(argumentation_framework: AbstractArgumentationFramework) -> Set[frozenset[Argument]]:
-    cf_ext = get_conflict_free_extensions.apply(argumentation_framework)
-    rm = set()
-    for ext1 in cf_ext:
-        for ext2 in cf_ext:
-            if ext1.issubset(ext2) and not ext2.issubset(ext1):
-                rm.add(ext1)
-    return cf_ext.difference(rm)
+def apply(argumentation_framework: AbstractArgumentationFramework, as_bitmasks: bool = False,
+          budget: Optional[Budget] = None) -> Union[Set[frozenset[Argument]], Set[int]]:
+    if not argumentation_framework.arguments:
+        return set()
+    naive_bitmasks = collect_bitmasks(iter_naive_extensions(argumentation_framework, as_bitmasks=True, budget=budget),
+                                      argumentation_framework, as_bitmasks, budget)
+    if as_bitmasks:
+        return naive_bitmasks
+    return bitmasks_to_extensions(naive_bitmasks, argumentation_framework)
 
+
+def iter_naive_extensions(argumentation_framework: AbstractArgumentationFramework, as_bitmasks: bool = False,
+                          budget: Optional[Budget] = None, stats: Optional[SearchStatistics] = None) \
+        -> Iterator[Union[FrozenSet[Argument], int]]:
+    """
+    Iterate over the naive extensions (maximal conflict-free sets) of an argumentation framework. These are the maximal
+    independent sets of the undirected conflict graph without the self-defeating arguments, which are enumerated by the
+    Bron-Kerbosch algorithm with pivoting (Tomita, Etsuji, Akira Tanaka and Haruhisa Takahashi. "The worst-case time
+    complexity for generating all maximal cliques and computational experiments." Theoretical Computer Science 363
+    (2006): 28-42) on the complement of the conflict graph, with all vertex sets as bitmasks.
+
+    :param argumentation_framework: The argumentation framework for which we need the naive extensions.
+    :param as_bitmasks: Yield bitmasks over argumentation_framework.arguments instead.
+    :param budget: Budget for the search nodes (see py_arg.utils.budget); BudgetExceeded is raised once it is exhausted.
+    :param stats: Statistics in which the search counts its nodes and backtracks (see py_arg.utils.search_statistics);
+        the live labellings are the frames on the stack.
+    :return: Iterator over the naive extensions.
+
+    >>> a, b, c, d = Argument('a'), Argument('b'), Argument('c'), Argument('d')
+    >>> defeats = [Defeat(a, b), Defeat(b, c), Defeat(c, a), Defeat(d, d)]
+    >>> af = AbstractArgumentationFramework('af', [a, b, c, d], defeats)
+    >>> sorted(sorted(extension) for extension in iter_naive_extensions(af))
+    [[a], [b], [c]]
+    """
+    conflict_bitmasks, self_attacking_bitmask = get_conflict_free_extensions.get_conflict_bitmasks(
+        argumentation_framework)
+    candidate_bitmask = ((1 << len(conflict_bitmasks)) - 1) & ~self_attacking_bitmask
+    for bitmask in _iter_maximal_independent_sets(conflict_bitmasks, candidate_bitmask, budget, stats):
+        yield bitmask if as_bitmasks else bitmask_to_extension(bitmask, argumentation_framework)
+
+
+def _iter_maximal_independent_sets(conflict_bitmasks: List[int], candidate_bitmask: int, budget: Optional[Budget],
+                                   stats: Optional[SearchStatistics]) -> Iterator[int]:
+    # The recursion of Bron-Kerbosch is replaced by a stack of frames [current, candidates, excluded, to_try], so deep
+    # searches are not limited by the Python recursion limit. current is an independent set, candidates are the
+    # arguments that can still be added to it, excluded are those that could be added but whose sets have already been
+    # generated, and to_try are the candidates that still have to be branched on (None until the pivot is chosen).
+    stack = [[0, candidate_bitmask, 0, None]]
+    while stack:
+        frame = stack[-1]
+        current_bitmask, candidate_bitmask, excluded_bitmask, to_try_bitmask = frame
+        if to_try_bitmask is None:
+            if not candidate_bitmask:
+                if not excluded_bitmask:
+                    yield current_bitmask
+                stack.pop()
+                if stats is not None:
+                    stats.nr_of_backtracks += 1
+                continue
+            # Each maximal independent set extending the current one contains the pivot or one of its conflicting
+            # arguments, so only those need to be tried. The pivot is chosen to leave as few of them as possible.
+            to_try_bitmask = min((candidate_bitmask & conflict_bitmasks[argument_id]
+                                  for argument_id in iterate_bitmask(candidate_bitmask | excluded_bitmask)),
+                                 key=lambda bitmask: bin(bitmask).count('1'))
+        if not to_try_bitmask:
+            stack.pop()
+            if stats is not None:
+                stats.nr_of_backtracks += 1
+            continue
+        lowest_bit = to_try_bitmask & -to_try_bitmask
+        argument_id = lowest_bit.bit_length() - 1
+        frame[1] = candidate_bitmask & ~lowest_bit
+        frame[2] = excluded_bitmask | lowest_bit
+        frame[3] = to_try_bitmask ^ lowest_bit
+        if budget is not None:
+            budget.add_node()
+        stack.append([current_bitmask | lowest_bit, candidate_bitmask & ~conflict_bitmasks[argument_id],
+                      excluded_bitmask & ~conflict_bitmasks[argument_id], None])
+        if stats is not None:
+            stats.add_node(len(stack))
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
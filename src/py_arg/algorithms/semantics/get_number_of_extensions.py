@@ -0,0 +1,179 @@
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
+from py_arg.abstract_argumentation_classes.argument import Argument
+from py_arg.abstract_argumentation_classes.compact_argumentation_framework import CompactArgumentationFramework
+from py_arg.abstract_argumentation_classes.defeat import Defeat
+from py_arg.algorithms.semantics.get_strongly_connected_components import get_strongly_connected_component_ids
+from py_arg.algorithms.semantics.labelling_search import IN, OUT, UNDEC, LabellingSearch, is_admissible_labelling, \
+    is_complete_labelling, is_stable_labelling, iter_maximal_bitmasks
+from py_arg.utils.budget import Budget, BudgetExceeded
+from py_arg.utils.search_statistics import SearchStatistics
+
+COUNTABLE_SEMANTICS = ['Complete', 'Grounded', 'Preferred', 'Stable']
+
+
+def get_number_of_extensions(argumentation_framework: AbstractArgumentationFramework, semantics: str,
+                             budget: Optional[Budget] = None, stats: Optional[SearchStatistics] = None) -> int:
+    """
+    Count the extensions of an argumentation framework without enumerating them. Independent (weakly connected)
+    components of the framework are counted separately and their numbers of extensions are multiplied. Within a
+    component, the strongly connected components (SCCs) are solved in topological order, conditioned on the labels of
+    the earlier arguments that defeat them, as in get_scc_recursive_extensions. Instead of extending each partial
+    extension, this keeps the number of partial labellings per labelling of the earlier arguments that still defeat
+    arguments in later SCCs, since the rest of a partial labelling does not affect how it can be extended. Each SCC is
+    solved only once per conditioning.
+
+    :param argumentation_framework: The argumentation framework for which we need the number of extensions.
+    :param semantics: The semantics: Complete, Grounded, Preferred or Stable.
+    :param budget: Budget for the searches within the SCCs, charged one node more per labelling of the boundary (see
+        py_arg.utils.budget). If it is exhausted, BudgetExceeded is raised, with as partial results the number of
+        extensions of the weakly connected components that were counted so far (taken together).
+    :param stats: Statistics in which the searches within the SCCs count their work (see
+        py_arg.utils.search_statistics).
+    :return: The number of extensions.
+
+    >>> a, b, c, d = Argument('a'), Argument('b'), Argument('c'), Argument('d')
+    >>> defeats = [Defeat(a, b), Defeat(b, a), Defeat(b, c), Defeat(c, d), Defeat(d, c)]
+    >>> af = AbstractArgumentationFramework('af', [a, b, c, d], defeats)
+    >>> [get_number_of_extensions(af, semantics) for semantics in ['Complete', 'Preferred', 'Stable']]
+    [6, 3, 3]
+    >>> pairs = [(Argument('a' + str(i)), Argument('b' + str(i))) for i in range(50)]
+    >>> defeats = [Defeat(x, y) for x, y in pairs] + [Defeat(y, x) for x, y in pairs]
+    >>> af = AbstractArgumentationFramework('af', [argument for pair in pairs for argument in pair], defeats)
+    >>> get_number_of_extensions(af, 'Complete') == 3 ** 50
+    True
+    """
+    if semantics not in COUNTABLE_SEMANTICS:
+        raise ValueError('Unknown semantics ' + semantics + '; choose one of ' + ', '.join(COUNTABLE_SEMANTICS) + '.')
+    if semantics == 'Grounded':
+        return 1
+
+    compact_framework = CompactArgumentationFramework.from_abstract_argumentation_framework(argumentation_framework)
+    attacked_ids = compact_framework.get_attacked_lists()
+    attacker_ids = compact_framework.get_attacker_lists()
+    number_of_extensions = 1
+    for components in _group_by_weakly_connected_component(attacked_ids):
+        try:
+            number_of_extensions *= _count_connected_extensions(attacked_ids, attacker_ids, components, semantics,
+                                                                budget, stats)
+        except BudgetExceeded as error:
+            error.partial_results = number_of_extensions
+            raise
+        if number_of_extensions == 0:
+            break
+    return number_of_extensions
+
+
+def _group_by_weakly_connected_component(attacked_ids: List[List[int]]) -> List[List[List[int]]]:
+    # Union-find over the defeats, then the SCCs (in topological order) per weakly connected component.
+    parents = list(range(len(attacked_ids)))
+
+    def find(argument_id: int) -> int:
+        while parents[argument_id] != argument_id:
+            parents[argument_id] = parents[parents[argument_id]]
+            argument_id = parents[argument_id]
+        return argument_id
+
+    for argument_id, defeated_ids in enumerate(attacked_ids):
+        for attacked_id in defeated_ids:
+            parents[find(attacked_id)] = find(argument_id)
+    components_by_root: Dict[int, List[List[int]]] = {}
+    for component in get_strongly_connected_component_ids(attacked_ids):
+        components_by_root.setdefault(find(component[0]), []).append(component)
+    return list(components_by_root.values())
+
+
+def _count_connected_extensions(attacked_ids: List[List[int]], attacker_ids: List[List[int]],
+                                components: List[List[int]], semantics: str, budget: Optional[Budget],
+                                stats: Optional[SearchStatistics]) -> int:
+    # components are the SCCs of a weakly connected component, in topological order.
+    position = {argument_id: index for index, component in enumerate(components) for argument_id in component}
+    last_position = {argument_id: max((position[attacked_id] for attacked_id in attacked_ids[argument_id]),
+                                      default=-1)
+                     for argument_id in position}
+
+    # Each state is a labelling of the boundary: the arguments of earlier SCCs that defeat arguments in later SCCs.
+    boundary_ids: List[int] = []
+    counts_by_state: Dict[Tuple[int, ...], int] = {(): 1}
+    for index, component in enumerate(components):
+        next_boundary_ids = [argument_id for argument_id in boundary_ids if last_position[argument_id] > index]
+        new_boundary_ids = [argument_id for argument_id in component if last_position[argument_id] > index]
+        component_labellings: Dict[Tuple[FrozenSet[int], FrozenSet[int]], List[Dict[int, int]]] = {}
+        next_counts_by_state: Dict[Tuple[int, ...], int] = {}
+        for state, count in counts_by_state.items():
+            if budget is not None:
+                budget.add_node()
+            boundary_labels = dict(zip(boundary_ids, state))
+            conditioning = _get_conditioning(attacker_ids, component, position, index, boundary_labels)
+            if conditioning not in component_labellings:
+                component_labellings[conditioning] = _get_component_labellings(
+                    attacked_ids, attacker_ids, component, conditioning[0], conditioning[1], semantics, budget,
+                    stats)
+            kept_labels = tuple(boundary_labels[argument_id] for argument_id in next_boundary_ids)
+            for labels in component_labellings[conditioning]:
+                next_state = kept_labels + tuple(labels[argument_id] for argument_id in new_boundary_ids)
+                next_counts_by_state[next_state] = next_counts_by_state.get(next_state, 0) + count
+        boundary_ids = next_boundary_ids + new_boundary_ids
+        counts_by_state = next_counts_by_state
+        if not counts_by_state:
+            return 0
+    return sum(counts_by_state.values())
+
+
+def _get_conditioning(attacker_ids: List[List[int]], component: List[int], position: Dict[int, int], index: int,
+                      boundary_labels: Dict[int, int]) -> Tuple[FrozenSet[int], FrozenSet[int]]:
+    # The arguments of the component that are defeated by an earlier IN argument, and those that are not, but are
+    # defeated by an earlier UNDEC argument.
+    out_ids = set()
+    not_in_ids = set()
+    for argument_id in component:
+        for attacker_id in attacker_ids[argument_id]:
+            if position[attacker_id] == index:
+                continue
+            if boundary_labels[attacker_id] == IN:
+                out_ids.add(argument_id)
+                break
+            if boundary_labels[attacker_id] == UNDEC:
+                not_in_ids.add(argument_id)
+    return frozenset(out_ids), frozenset(not_in_ids - out_ids)
+
+
+def _get_component_labellings(attacked_ids: List[List[int]], attacker_ids: List[List[int]], component: List[int],
+                              out_ids: FrozenSet[int], not_in_ids: FrozenSet[int], semantics: str,
+                              budget: Optional[Budget], stats: Optional[SearchStatistics]) -> List[Dict[int, int]]:
+    # Solve the conditioned component: the arguments that are OUT are left out, and the arguments that cannot be IN
+    # are defeated by an extra, self-defeating argument.
+    local_ids = [argument_id for argument_id in component if argument_id not in out_ids]
+    local_id_by_id = {argument_id: local_id for local_id, argument_id in enumerate(local_ids)}
+    local_attacked_ids = [[local_id_by_id[attacked_id] for attacked_id in attacked_ids[argument_id]
+                           if attacked_id in local_id_by_id] for argument_id in local_ids]
+    local_attacker_ids = [[local_id_by_id[attacker_id] for attacker_id in attacker_ids[argument_id]
+                           if attacker_id in local_id_by_id] for argument_id in local_ids]
+    if not_in_ids:
+        undecided_id = len(local_ids)
+        local_attacked_ids.append([undecided_id] + [local_id_by_id[argument_id] for argument_id in not_in_ids])
+        local_attacker_ids.append([undecided_id])
+        for argument_id in not_in_ids:
+            local_attacker_ids[local_id_by_id[argument_id]].append(undecided_id)
+
+    is_accepted = {'Complete': is_complete_labelling, 'Stable': is_stable_labelling}.get(semantics,
+                                                                                        is_admissible_labelling)
+    search = LabellingSearch(local_attacked_ids, local_attacker_ids, is_accepted=is_accepted, fix_grounded_labels=True,
+                             propagate_for='Stable' if semantics == 'Stable' else 'Complete', budget=budget,
+                             stats=stats)
+    bitmasks = iter_maximal_bitmasks(search) if semantics == 'Preferred' else search.search()
+    labellings = []
+    for bitmask in bitmasks:
+        in_ids = {argument_id for local_id, argument_id in enumerate(local_ids) if bitmask >> local_id & 1}
+        labellings.append({argument_id: IN if argument_id in in_ids else
+                           OUT if argument_id in out_ids or any(attacker_id in in_ids
+                                                                for attacker_id in attacker_ids[argument_id]) else
+                           UNDEC for argument_id in component})
+    return labellings
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
@@ -1,28 +1,31 @@
-from enum import Enum
-from typing import Set, Dict, FrozenSet
+from itertools import islice
+from typing import Set, FrozenSet, Iterator, Optional, Union
 
 from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
 from py_arg.abstract_argumentation_classes.argument import Argument
 from py_arg.abstract_argumentation_classes.defeat import Defeat
-
-
-# Algorithm 1 from Nofal, Samer, Katie Atkinson, and Paul E. Dunne. "Algorithms for decision problems in argument
-# systems under preferred semantics." Artificial Intelligence 207 (2014): 23-51.
-
-
-class PreferredExtensionLabel(Enum):
-    IN = 1              # Arguments *might* be in a preferred extension
-    OUT = 2             # Argument is defeated by an IN argument
-    BLANK = 3           # Default label for all arguments, indicating that the argument is still unprocessed.
-    MUST_OUT = 4        # Argument defeats IN argument
-    UNDEC = 5           # Argument may not be included in a preferred extension because not defended by any IN argument.
-
-
-def get_preferred_extensions(argumentation_framework: AbstractArgumentationFramework) -> Set[FrozenSet[Argument]]:
+from py_arg.algorithms.semantics.extension_bitmask import bitmask_to_extension, bitmasks_to_extensions, \
+    collect_bitmasks
+from py_arg.algorithms.semantics.get_extensions_in_parallel import get_bitmasks_in_parallel
+from py_arg.algorithms.semantics.labelling_search import LabellingSearch, iter_maximal_bitmasks
+from py_arg.utils.budget import Budget
+from py_arg.utils.search_statistics import SearchStatistics, in_phase
+
+
+def get_preferred_extensions(argumentation_framework: AbstractArgumentationFramework, as_bitmasks: bool = False,
+                             n_jobs: int = 1, budget: Optional[Budget] = None,
+                             stats: Optional[SearchStatistics] = None) \
+        -> Union[Set[FrozenSet[Argument]], Set[int]]:
     """
     Get the preferred extensions of an argumentation framework.
 
     :param argumentation_framework: The argumentation framework for which we need the preferred extensions.
+    :param as_bitmasks: Return each extension as a bitmask over argumentation_framework.arguments instead.
+    :param n_jobs: Split the search over this many processes (one per CPU if smaller than 1), see
+        get_bitmasks_in_parallel.
+    :param budget: Budget for the search (see py_arg.utils.budget). If it is exhausted, BudgetExceeded is raised, with
+        the extensions found so far as partial results.
+    :param stats: Statistics in which the search counts its work (see py_arg.utils.search_statistics).
     :return: Preferred extension of the argumentation framework.
 
     >>> b = Argument('b')
@@ -38,54 +41,54 @@ def get_preferred_extensions(argumentation_framework: AbstractArgumentationFrame
     True
     >>> frozenset({b}) in pes
     False
+    >>> get_preferred_extensions(af, as_bitmasks=True)
+    {5}
     """
-    initial_labelling = {argument: PreferredExtensionLabel.BLANK
-                         for argument in argumentation_framework.arguments}
-    return _recursively_get_preferred_extensions(argumentation_framework, initial_labelling, set())
-
-
-def _recursively_get_preferred_extensions(argumentation_framework: AbstractArgumentationFramework,
-                                          labelling: Dict[Argument, PreferredExtensionLabel],
-                                          preferred_extensions: Set[FrozenSet[Argument]]) -> Set[FrozenSet[Argument]]:
-    if all(labelling[argument] != PreferredExtensionLabel.BLANK for argument in argumentation_framework.arguments):
-        if all(labelling[argument] != PreferredExtensionLabel.MUST_OUT
-               for argument in argumentation_framework.arguments):
-            candidate_preferred_extension = frozenset(sorted({argument for argument in argumentation_framework.arguments
-                                                              if labelling[argument] == PreferredExtensionLabel.IN}))
-            if not any(candidate_preferred_extension < preferred_extension
-                       for preferred_extension in preferred_extensions):
-                preferred_extensions.add(candidate_preferred_extension)
+    if n_jobs != 1:
+        preferred_bitmasks = get_bitmasks_in_parallel(argumentation_framework, 'Preferred', n_jobs, budget=budget,
+                                                      stats=stats)
     else:
-        blank_argument = [argument for argument in argumentation_framework.arguments
-                          if labelling[argument] == PreferredExtensionLabel.BLANK][0]
-        alternative_labelling = _in_trans(labelling, blank_argument, argumentation_framework)
-        preferred_extensions = _recursively_get_preferred_extensions(argumentation_framework, alternative_labelling,
-                                                                     preferred_extensions)
-        alternative_labelling = _undec_trans(labelling, blank_argument)
-        preferred_extensions = _recursively_get_preferred_extensions(argumentation_framework, alternative_labelling,
-                                                                     preferred_extensions)
-    return preferred_extensions
-
+        with in_phase(stats, 'search'):
+            preferred_bitmasks = collect_bitmasks(_iter_preferred_bitmasks(argumentation_framework, budget, stats),
+                                                  argumentation_framework, as_bitmasks, budget)
+    if as_bitmasks:
+        return preferred_bitmasks
+    with in_phase(stats, 'conversion'):
+        return bitmasks_to_extensions(preferred_bitmasks, argumentation_framework)
+
+
+def iter_preferred_extensions(argumentation_framework: AbstractArgumentationFramework, limit: Optional[int] = None,
+                              as_bitmasks: bool = False, budget: Optional[Budget] = None,
+                              stats: Optional[SearchStatistics] = None) \
+        -> Iterator[Union[FrozenSet[Argument], int]]:
+    """
+    Iterate over the preferred extensions of an argumentation framework, yielding each as soon as the search finds it.
+    Every yielded set is already known to be a maximal admissible set.
 
-def _in_trans(labelling: Dict[Argument, PreferredExtensionLabel], argument: Argument,
-              argumentation_framework: AbstractArgumentationFramework) -> Dict[Argument, PreferredExtensionLabel]:
-    new_labelling = labelling.copy()
-    new_labelling[argument] = PreferredExtensionLabel.IN
-    for defeater in argumentation_framework.get_outgoing_defeat_arguments(argument):
-        if defeater == argument: break
-        else:
-            new_labelling[defeater] = PreferredExtensionLabel.OUT
-    for defeated in argumentation_framework.get_incoming_defeat_arguments(argument):
-        if new_labelling[defeated] != PreferredExtensionLabel.OUT:
-            new_labelling[defeated] = PreferredExtensionLabel.MUST_OUT
-    return new_labelling
+    :param argumentation_framework: The argumentation framework for which we need the preferred extensions.
+    :param limit: Stop the search after this many preferred extensions (no limit if None).
+    :param as_bitmasks: Yield bitmasks over argumentation_framework.arguments instead.
+    :param budget: Budget for the search nodes (see py_arg.utils.budget); BudgetExceeded is raised once it is exhausted.
+    :param stats: Statistics in which the search counts its work (see py_arg.utils.search_statistics).
+    :return: Iterator over the preferred extensions of the argumentation framework.
+
+    >>> b, c, d = Argument('b'), Argument('c'), Argument('d')
+    >>> af = AbstractArgumentationFramework('af', [b, c, d], [Defeat(c, d), Defeat(d, c)])
+    >>> [sorted(extension) for extension in iter_preferred_extensions(af)]
+    [[b, c], [b, d]]
+    >>> [sorted(extension) for extension in iter_preferred_extensions(af, limit=1)]
+    [[b, c]]
+    """
+    for bitmask in islice(_iter_preferred_bitmasks(argumentation_framework, budget, stats), limit):
+        yield bitmask if as_bitmasks else bitmask_to_extension(bitmask, argumentation_framework)
 
 
-def _undec_trans(labelling: Dict[Argument, PreferredExtensionLabel], argument: Argument) -> \
-        Dict[Argument, PreferredExtensionLabel]:
-    new_labelling = labelling.copy()
-    new_labelling[argument] = PreferredExtensionLabel.UNDEC
-    return new_labelling
+def _iter_preferred_bitmasks(argumentation_framework: AbstractArgumentationFramework, budget: Optional[Budget],
+                             stats: Optional[SearchStatistics]) -> Iterator[int]:
+    # Each preferred extension is complete, so the search only needs to visit complete labellings.
+    search = LabellingSearch.from_argumentation_framework(argumentation_framework, fix_grounded_labels=True,
+                                                         propagate_for='Complete', budget=budget, stats=stats)
+    return iter_maximal_bitmasks(search)
 
 
 if __name__ == "__main__":
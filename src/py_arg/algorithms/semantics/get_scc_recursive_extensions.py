@@ -0,0 +1,148 @@
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
+from py_arg.abstract_argumentation_classes.argument import Argument
+from py_arg.abstract_argumentation_classes.defeat import Defeat
+from py_arg.algorithms.semantics.get_complete_extensions import get_complete_extensions
+from py_arg.algorithms.semantics.get_grounded_extension import get_grounded_extension
+from py_arg.algorithms.semantics.get_preferred_extensions import get_preferred_extensions
+from py_arg.algorithms.semantics.get_stable_extensions import get_stable_extensions
+from py_arg.algorithms.semantics.get_strongly_connected_components import get_strongly_connected_components
+from py_arg.utils.budget import Budget, BudgetExceeded
+from py_arg.utils.search_statistics import SearchStatistics
+
+
+# SCC-recursive evaluation, based on Baroni, Pietro, Massimiliano Giacomin and Giovanni Guida. "SCC-recursiveness: a
+# general schema for argumentation semantics." Artificial Intelligence 168.1-2 (2005): 162-210, and on the labelling
+# formulation in Cerutti, Federico, Massimiliano Giacomin, Mauro Vallati and Marina Zanella. "An SCC recursive
+# meta-algorithm for computing preferred labellings in abstract argumentation." KR 2014.
+# The strongly connected components (SCCs) are solved in topological order. Given the labels of the arguments in
+# earlier components, an argument of the current component is OUT if it is defeated by an earlier IN argument (and
+# can then be left out), and it cannot be IN if it is defeated by an earlier UNDEC argument. The latter is enforced
+# by letting one extra, self-defeating (and hence UNDEC) argument defeat it.
+
+InnerSolver = Callable[[AbstractArgumentationFramework], Iterable[Iterable[Argument]]]
+
+# The default solvers also take the budget and the statistics as keyword arguments.
+_DEFAULT_INNER_SOLVERS: Dict[str, Callable[..., Iterable[Iterable[Argument]]]] = {
+    'Complete': get_complete_extensions,
+    'Grounded': lambda argumentation_framework, **_options: [get_grounded_extension(argumentation_framework)],
+    'Preferred': get_preferred_extensions,
+    'Stable': get_stable_extensions,
+}
+
+
+def get_scc_recursive_extensions(argumentation_framework: AbstractArgumentationFramework, semantics: str,
+                                 inner_solver: Optional[InnerSolver] = None, budget: Optional[Budget] = None,
+                                 stats: Optional[SearchStatistics] = None) -> Set[FrozenSet[Argument]]:
+    """
+    Get the extensions of an argumentation framework by solving its strongly connected components one by one, so the
+    search space grows exponentially with the size of the largest component rather than with the size of the
+    framework.
+
+    :param argumentation_framework: The argumentation framework for which we need the extensions.
+    :param semantics: The semantics: Complete, Grounded, Preferred or Stable.
+    :param inner_solver: Function that gets the extensions of a single (conditioned) component under this semantics,
+        such as get_preferred_extensions for preferred semantics. By default, the solver of py_arg.algorithms.semantics
+        for this semantics is used.
+    :param budget: Budget for the evaluation (see py_arg.utils.budget), charged one node per partial extension, and
+        shared by the searches of the default inner solver. If it is exhausted, BudgetExceeded is raised, without
+        partial results (a partial extension need not be part of an extension of the framework).
+    :param stats: Statistics in which the searches of the default inner solver count their work (see
+        py_arg.utils.search_statistics).
+    :return: The extensions of the argumentation framework.
+
+    >>> a, b, c, d = Argument('a'), Argument('b'), Argument('c'), Argument('d')
+    >>> defeats = [Defeat(a, b), Defeat(b, a), Defeat(b, c), Defeat(c, d), Defeat(d, c)]
+    >>> af = AbstractArgumentationFramework('af', [a, b, c, d], defeats)
+    >>> sorted(sorted(extension) for extension in get_scc_recursive_extensions(af, 'Preferred'))
+    [[a, c], [a, d], [b, d]]
+    >>> sorted(sorted(extension) for extension in get_scc_recursive_extensions(af, 'Grounded'))
+    [[]]
+    """
+    if semantics not in _DEFAULT_INNER_SOLVERS:
+        raise ValueError('Unknown semantics ' + semantics + '; choose one of ' +
+                         ', '.join(_DEFAULT_INNER_SOLVERS.keys()) + '.')
+    if inner_solver is None:
+        default_solver = _DEFAULT_INNER_SOLVERS[semantics]
+
+        def inner_solver(conditioned_framework: AbstractArgumentationFramework) -> Iterable[Iterable[Argument]]:
+            return default_solver(conditioned_framework, budget=budget, stats=stats)
+
+    try:
+        return _get_scc_recursive_extensions(argumentation_framework, inner_solver, budget)
+    except BudgetExceeded as error:
+        error.partial_results = None
+        raise
+
+
+def _get_scc_recursive_extensions(argumentation_framework: AbstractArgumentationFramework, inner_solver: InnerSolver,
+                                  budget: Optional[Budget]) -> Set[FrozenSet[Argument]]:
+
+    undecided_argument_name = '_undecided'
+    while argumentation_framework.is_in_arguments(undecided_argument_name):
+        undecided_argument_name += '_'
+    undecided_argument = Argument(undecided_argument_name)
+
+    partial_extensions: List[FrozenSet[Argument]] = [frozenset()]
+    for component in get_strongly_connected_components(argumentation_framework):
+        component_set = set(component)
+        # Components with the same conditioning have the same extensions, so each conditioning is solved only once.
+        component_extensions: Dict[Tuple[FrozenSet[Argument], FrozenSet[Argument]], List[FrozenSet[Argument]]] = {}
+        next_partial_extensions = []
+        for partial_extension in partial_extensions:
+            if budget is not None:
+                budget.add_node()
+            out_arguments, not_in_arguments = _get_conditioning(argumentation_framework, component, component_set,
+                                                                partial_extension)
+            conditioning = (out_arguments, not_in_arguments)
+            if conditioning not in component_extensions:
+                conditioned_framework = _get_conditioned_framework(argumentation_framework, component, out_arguments,
+                                                                   not_in_arguments, undecided_argument)
+                component_extensions[conditioning] = [frozenset(extension) - {undecided_argument}
+                                                      for extension in inner_solver(conditioned_framework)]
+            next_partial_extensions.extend(partial_extension | component_extension
+                                           for component_extension in component_extensions[conditioning])
+        partial_extensions = next_partial_extensions
+    return set(partial_extensions)
+
+
+def _get_conditioning(argumentation_framework: AbstractArgumentationFramework, component: List[Argument],
+                      component_set: Set[Argument], partial_extension: FrozenSet[Argument]) \
+        -> Tuple[FrozenSet[Argument], FrozenSet[Argument]]:
+    # The arguments of the component that are defeated by an earlier IN argument, and those that are not, but are
+    # defeated by an earlier UNDEC argument (which is neither IN nor defeated by an IN argument).
+    out_arguments = set()
+    not_in_arguments = set()
+    for argument in component:
+        for defeater in argumentation_framework.get_incoming_defeat_arguments(argument):
+            if defeater in component_set:
+                continue
+            if defeater in partial_extension:
+                out_arguments.add(argument)
+                break
+            if not any(defeater_defeater in partial_extension
+                       for defeater_defeater in argumentation_framework.get_incoming_defeat_arguments(defeater)):
+                not_in_arguments.add(argument)
+    return frozenset(out_arguments), frozenset(not_in_arguments - out_arguments)
+
+
+def _get_conditioned_framework(argumentation_framework: AbstractArgumentationFramework, component: List[Argument],
+                               out_arguments: FrozenSet[Argument], not_in_arguments: FrozenSet[Argument],
+                               undecided_argument: Argument) -> AbstractArgumentationFramework:
+    arguments = [argument for argument in component if argument not in out_arguments]
+    argument_set = set(arguments)
+    defeats = [Defeat(defeater, argument) for argument in arguments
+               for defeater in argumentation_framework.get_incoming_defeat_arguments(argument)
+               if defeater in argument_set]
+    if not_in_arguments:
+        arguments.append(undecided_argument)
+        defeats.append(Defeat(undecided_argument, undecided_argument))
+        defeats.extend(Defeat(undecided_argument, argument) for argument in not_in_arguments)
+    return AbstractArgumentationFramework(argumentation_framework.name, arguments, defeats)
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
@@ -1,30 +1,33 @@
-from enum import Enum
-from typing import Set, Dict, FrozenSet
+from itertools import islice
+from typing import Set, FrozenSet, Iterator, Optional, Union
 
 from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
 from py_arg.abstract_argumentation_classes.argument import Argument
 from py_arg.abstract_argumentation_classes.defeat import Defeat
-
-
-# Algorithm 1 from Nofal, Samer, Katie Atkinson, and Paul E. Dunne. "Algorithms for decision problems in argument
-# systems under preferred semantics." Artificial Intelligence 207 (2014): 23-51.
-# Adjustment based on Modgil, Sanjay and Martin Caminada. "Proof Theories and Algorithms for Abstract Argumentation 
-# Frameworks." In Iyad Rahwan and Guillermo R. Simari, editors, Argumentation in Artificial Intelligence, pages 105–132
-
-
-class SemiStableExtensionLabel(Enum):
-    IN = 1  # Arguments *might* be in a semi-stable extension
-    OUT = 2  # Argument is defeated by an IN argument
-    BLANK = 3  # Default label for all arguments, indicating that the argument is still unprocessed.
-    MUST_OUT = 4  # Argument defeats IN argument
-    UNDEC = 5  # Argument may not be included in a semi-stable extension because not defended by any IN argument.
-
-
-def get_semistable_extensions(argumentation_framework: AbstractArgumentationFramework) -> Set[FrozenSet[Argument]]:
+from py_arg.algorithms.semantics.extension_bitmask import bitmask_to_extension, bitmasks_to_extensions, \
+    is_strict_subset
+from py_arg.algorithms.semantics.get_extensions_in_parallel import get_bitmasks_in_parallel
+from py_arg.algorithms.semantics.labelling_search import LabellingSearch, is_admissible_labelling
+from py_arg.algorithms.semantics.range_maximal_search import RangeAntichain, get_range_bitmask, \
+    get_range_maximal_bitmasks, get_range_upper_bound
+from py_arg.utils.budget import Budget
+from py_arg.utils.search_statistics import SearchStatistics, in_phase
+
+
+def get_semistable_extensions(argumentation_framework: AbstractArgumentationFramework, as_bitmasks: bool = False,
+                              n_jobs: int = 1, budget: Optional[Budget] = None,
+                              stats: Optional[SearchStatistics] = None) \
+        -> Union[Set[FrozenSet[Argument]], Set[int]]:
     """
     Get the semi-stable extensions of an argumentation framework.
 
     :param argumentation_framework: The argumentation framework for which we need the semi-stable extensions.
+    :param as_bitmasks: Return each extension as a bitmask over argumentation_framework.arguments instead.
+    :param n_jobs: Split the search over this many processes (one per CPU if smaller than 1), see
+        get_bitmasks_in_parallel.
+    :param budget: Budget for the search (see py_arg.utils.budget). If it is exhausted, BudgetExceeded is raised,
+        without partial results: no extension is known to be semi-stable before the search completes.
+    :param stats: Statistics in which the search counts its work (see py_arg.utils.search_statistics).
     :return: semi-stable extension of the argumentation framework.
 
     >>> b = Argument('b')
@@ -41,70 +44,75 @@ def get_semistable_extensions(argumentation_framework: AbstractArgumentationFram
     >>> frozenset({b}) in sses
     False
     """
-    initial_labelling = {argument: SemiStableExtensionLabel.BLANK
-                         for argument in argumentation_framework.arguments}
-    return _recursively_get_semistable_extensions(argumentation_framework, initial_labelling, [])
-
-
-def _recursively_get_semistable_extensions(argumentation_framework: AbstractArgumentationFramework,
-                                           labelling: Dict[Argument, SemiStableExtensionLabel],
-                                           labellings) -> Set[FrozenSet[Argument]]:
-    if all(labelling[argument] != SemiStableExtensionLabel.BLANK for argument in argumentation_framework.arguments):
-        if all(labelling[argument] != SemiStableExtensionLabel.MUST_OUT
-               for argument in argumentation_framework.arguments):
-            candidate_semistable_undec = frozenset(sorted({argument for argument in argumentation_framework.arguments
-                                                           if labelling[argument] == SemiStableExtensionLabel.UNDEC}))
-            calculated_semistable_undec = []
-            for ss_labelling in labellings:
-                calculated_semistable_undec.append(
-                    [frozenset(sorted({argument for argument in argumentation_framework.arguments
-                                       if ss_labelling[argument] == SemiStableExtensionLabel.UNDEC})),
-                     ss_labelling])
-            if not any(candidate_semistable_undec > semistable_undec[0]
-                       for semistable_undec in calculated_semistable_undec):
-                labellings.append(labelling)
-                if any(candidate_semistable_undec < semistable_undec[0]
-                       for semistable_undec in calculated_semistable_undec):
-                    for semistable_undec in calculated_semistable_undec:
-                        if candidate_semistable_undec < semistable_undec[0]:
-                            labellings.remove(semistable_undec[1])
+    # Semi-stable extensions are the admissible sets with a maximal range (IN and OUT arguments). They are complete, so
+    # the grounded labels can be fixed and the search only needs to visit complete labellings.
+    if n_jobs != 1:
+        semistable_bitmasks = get_bitmasks_in_parallel(argumentation_framework, 'SemiStable', n_jobs, budget=budget,
+                                                       stats=stats)
     else:
-        blank_argument = [argument for argument in argumentation_framework.arguments
-                          if labelling[argument] == SemiStableExtensionLabel.BLANK][0]
-        alternative_labelling = _in_trans(labelling, blank_argument, argumentation_framework)
-        semistable_extensions = _recursively_get_semistable_extensions(argumentation_framework, alternative_labelling,
-                                                                       labellings)
-        alternative_labelling = _undec_trans(labelling, blank_argument)
-        semistable_extensions = _recursively_get_semistable_extensions(argumentation_framework, alternative_labelling,
-                                                                       labellings)
-    semistable_extensions = set()
-    for labelling in labellings:
-        semistable_extensions.add(frozenset(sorted({argument for argument in argumentation_framework.arguments if
-                                                    labelling[argument] == SemiStableExtensionLabel.IN})))
-
-    return semistable_extensions
-
-
-def _in_trans(labelling: Dict[Argument, SemiStableExtensionLabel], argument: Argument,
-              argumentation_framework: AbstractArgumentationFramework) -> Dict[Argument, SemiStableExtensionLabel]:
-    new_labelling = labelling.copy()
-    new_labelling[argument] = SemiStableExtensionLabel.IN
-    for defeater in argumentation_framework.get_outgoing_defeat_arguments(argument):
-        if defeater == argument:
-            break
-        else:
-            new_labelling[defeater] = SemiStableExtensionLabel.OUT
-    for defeated in argumentation_framework.get_incoming_defeat_arguments(argument):
-        if new_labelling[defeated] != SemiStableExtensionLabel.OUT:
-            new_labelling[defeated] = SemiStableExtensionLabel.MUST_OUT
-    return new_labelling
-
-
-def _undec_trans(labelling: Dict[Argument, SemiStableExtensionLabel], argument: Argument) -> \
-        Dict[Argument, SemiStableExtensionLabel]:
-    new_labelling = labelling.copy()
-    new_labelling[argument] = SemiStableExtensionLabel.UNDEC
-    return new_labelling
+        search = LabellingSearch.from_argumentation_framework(argumentation_framework, fix_grounded_labels=True,
+                                                             propagate_for='Complete', budget=budget, stats=stats)
+        with in_phase(stats, 'search'):
+            semistable_bitmasks = get_range_maximal_bitmasks(search)
+    if as_bitmasks:
+        return semistable_bitmasks
+    with in_phase(stats, 'conversion'):
+        return bitmasks_to_extensions(semistable_bitmasks, argumentation_framework)
+
+
+def iter_semistable_extensions(argumentation_framework: AbstractArgumentationFramework, limit: Optional[int] = None,
+                               as_bitmasks: bool = False, budget: Optional[Budget] = None,
+                               stats: Optional[SearchStatistics] = None) \
+        -> Iterator[Union[FrozenSet[Argument], int]]:
+    """
+    Iterate over the semi-stable extensions of an argumentation framework, yielding each as soon as it is found. Before
+    a candidate is yielded, a separate search checks that no admissible set has a strictly larger range, so every
+    yielded set is a semi-stable extension. This makes finding the first few extensions fast, but enumerating all of
+    them is slower than with get_semistable_extensions.
+
+    :param argumentation_framework: The argumentation framework for which we need the semi-stable extensions.
+    :param limit: Stop the search after this many semi-stable extensions (no limit if None).
+    :param as_bitmasks: Yield bitmasks over argumentation_framework.arguments instead.
+    :param budget: Budget for the search nodes (see py_arg.utils.budget); BudgetExceeded is raised once it is exhausted.
+    :param stats: Statistics in which the search counts its work (see py_arg.utils.search_statistics).
+    :return: Iterator over the semi-stable extensions of the argumentation framework.
+
+    >>> b, c, d = Argument('b'), Argument('c'), Argument('d')
+    >>> af = AbstractArgumentationFramework('af', [b, c, d], [Defeat(b, c), Defeat(c, d), Defeat(d, c)])
+    >>> [sorted(extension) for extension in iter_semistable_extensions(af)]
+    [[b, d]]
+    """
+    for bitmask in islice(_iter_semistable_bitmasks(argumentation_framework, budget, stats), limit):
+        yield bitmask if as_bitmasks else bitmask_to_extension(bitmask, argumentation_framework)
+
+
+def _iter_semistable_bitmasks(argumentation_framework: AbstractArgumentationFramework, budget: Optional[Budget],
+                              stats: Optional[SearchStatistics]) -> Iterator[int]:
+    # Ranges of the admissible labellings found so far that are maximal among them.
+    antichain = RangeAntichain()
+    search = LabellingSearch.from_argumentation_framework(
+        argumentation_framework, fix_grounded_labels=True, propagate_for='Complete', budget=budget, stats=stats,
+        prune=lambda current_search: antichain.is_dominated(get_range_upper_bound(current_search)))
+    for candidate_semistable_in in search.search():
+        candidate_range = get_range_bitmask(search)
+        if antichain.add(candidate_range, candidate_semistable_in) and not _has_larger_range(search, candidate_range):
+            yield candidate_semistable_in
+        elif stats is not None:
+            stats.nr_of_maximality_rejections += 1
+
+
+def _has_larger_range(search: LabellingSearch, range_bitmask: int) -> bool:
+    def is_accepted(other_search: LabellingSearch) -> bool:
+        return is_admissible_labelling(other_search) and is_strict_subset(range_bitmask,
+                                                                          get_range_bitmask(other_search))
+
+    def prune(other_search: LabellingSearch) -> bool:
+        return not is_strict_subset(range_bitmask, get_range_upper_bound(other_search))
+
+    other_search = LabellingSearch(search.attacked_ids, search.attacker_ids, is_accepted=is_accepted, prune=prune,
+                                   fix_grounded_labels=True, propagate_for='Complete', budget=search.budget,
+                                   stats=search.stats)
+    return next(other_search.search(), None) is not None
 
 
 if __name__ == "__main__":
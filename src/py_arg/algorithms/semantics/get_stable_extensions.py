@@ -1,30 +1,31 @@
-from enum import Enum
-from typing import Set, Dict, FrozenSet
+from itertools import islice
+from typing import Set, FrozenSet, Iterator, Optional, Union
 
 from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
 from py_arg.abstract_argumentation_classes.argument import Argument
 from py_arg.abstract_argumentation_classes.defeat import Defeat
-
-
-# Algorithm 1 from Nofal, Samer, Katie Atkinson, and Paul E. Dunne. "Algorithms for decision problems in argument
-# systems under preferred semantics." Artificial Intelligence 207 (2014): 23-51.
-# Adjustment based on Modgil, Sanjay and Martin Caminada. "Proof Theories and Algorithms for Abstract Argumentation 
-# Frameworks." In Iyad Rahwan and Guillermo R. Simari, editors, Argumentation in Artificial Intelligence, pages 105–132
-
-
-class StableExtensionLabel(Enum):
-    IN = 1  # Arguments *might* be in a stable extension
-    OUT = 2  # Argument is defeated by an IN argument
-    BLANK = 3  # Default label for all arguments, indicating that the argument is still unprocessed.
-    MUST_OUT = 4  # Argument defeats IN argument
-    UNDEC = 5  # Argument may not be included in a stable extension because not defended by any IN argument.
-
-
-def get_stable_extensions(argumentation_framework: AbstractArgumentationFramework) -> Set[FrozenSet[Argument]]:
+from py_arg.algorithms.semantics.extension_bitmask import bitmask_to_extension, bitmasks_to_extensions, \
+    collect_bitmasks
+from py_arg.algorithms.semantics.get_extensions_in_parallel import get_bitmasks_in_parallel
+from py_arg.algorithms.semantics.labelling_search import LabellingSearch, is_stable_labelling
+from py_arg.utils.budget import Budget
+from py_arg.utils.search_statistics import SearchStatistics, in_phase
+
+
+def get_stable_extensions(argumentation_framework: AbstractArgumentationFramework, as_bitmasks: bool = False,
+                          n_jobs: int = 1, budget: Optional[Budget] = None,
+                          stats: Optional[SearchStatistics] = None) \
+        -> Union[Set[FrozenSet[Argument]], Set[int]]:
     """
     Get the stable extensions of an argumentation framework.
 
     :param argumentation_framework: The argumentation framework for which we need the stable extensions.
+    :param as_bitmasks: Return each extension as a bitmask over argumentation_framework.arguments instead.
+    :param n_jobs: Split the search over this many processes (one per CPU if smaller than 1), see
+        get_bitmasks_in_parallel.
+    :param budget: Budget for the search (see py_arg.utils.budget). If it is exhausted, BudgetExceeded is raised, with
+        the extensions found so far as partial results.
+    :param stats: Statistics in which the search counts its work (see py_arg.utils.search_statistics).
     :return: stable extension of the argumentation framework.
 
     >>> b = Argument('b')
@@ -41,52 +42,40 @@ def get_stable_extensions(argumentation_framework: AbstractArgumentationFramewor
     >>> frozenset({b}) in ses
     False
     """
-    initial_labelling = {argument: StableExtensionLabel.BLANK
-                         for argument in argumentation_framework.arguments}
-    return _recursively_get_stable_extensions(argumentation_framework, initial_labelling, set())
-
-
-def _recursively_get_stable_extensions(argumentation_framework: AbstractArgumentationFramework,
-                                       labelling: Dict[Argument, StableExtensionLabel],
-                                       stable_extensions: Set[FrozenSet[Argument]]) -> Set[FrozenSet[Argument]]:
-    if all(labelling[argument] != StableExtensionLabel.BLANK for argument in argumentation_framework.arguments):
-        if all(labelling[argument] != StableExtensionLabel.MUST_OUT and labelling[
-            argument] != StableExtensionLabel.UNDEC
-               for argument in argumentation_framework.arguments):
-            stable_extensions.add(frozenset(sorted({argument for argument in argumentation_framework.arguments
-                                                    if labelling[argument] == StableExtensionLabel.IN})))
+    if n_jobs != 1:
+        stable_bitmasks = get_bitmasks_in_parallel(argumentation_framework, 'Stable', n_jobs, budget=budget,
+                                                   stats=stats)
     else:
-        blank_argument = [argument for argument in argumentation_framework.arguments
-                          if labelling[argument] == StableExtensionLabel.BLANK][0]
-        alternative_labelling = _in_trans(labelling, blank_argument, argumentation_framework)
-        stable_extensions = _recursively_get_stable_extensions(argumentation_framework, alternative_labelling,
-                                                               stable_extensions)
-        alternative_labelling = _undec_trans(labelling, blank_argument)
-        stable_extensions = _recursively_get_stable_extensions(argumentation_framework, alternative_labelling,
-                                                               stable_extensions)
-    return stable_extensions
-
-
-def _in_trans(labelling: Dict[Argument, StableExtensionLabel], argument: Argument,
-              argumentation_framework: AbstractArgumentationFramework) -> Dict[Argument, StableExtensionLabel]:
-    new_labelling = labelling.copy()
-    new_labelling[argument] = StableExtensionLabel.IN
-    for defeater in argumentation_framework.get_outgoing_defeat_arguments(argument):
-        if defeater == argument:
-            break
-        else:
-            new_labelling[defeater] = StableExtensionLabel.OUT
-    for defeated in argumentation_framework.get_incoming_defeat_arguments(argument):
-        if new_labelling[defeated] != StableExtensionLabel.OUT:
-            new_labelling[defeated] = StableExtensionLabel.MUST_OUT
-    return new_labelling
-
+        search = LabellingSearch.from_argumentation_framework(argumentation_framework, is_accepted=is_stable_labelling,
+                                                             fix_grounded_labels=True, propagate_for='Stable',
+                                                             budget=budget, stats=stats)
+        with in_phase(stats, 'search'):
+            stable_bitmasks = collect_bitmasks(search.search(), argumentation_framework, as_bitmasks, budget)
+    if as_bitmasks:
+        return stable_bitmasks
+    with in_phase(stats, 'conversion'):
+        return bitmasks_to_extensions(stable_bitmasks, argumentation_framework)
+
+
+def iter_stable_extensions(argumentation_framework: AbstractArgumentationFramework, limit: Optional[int] = None,
+                           as_bitmasks: bool = False, budget: Optional[Budget] = None,
+                           stats: Optional[SearchStatistics] = None) \
+        -> Iterator[Union[FrozenSet[Argument], int]]:
+    """
+    Iterate over the stable extensions of an argumentation framework, yielding each as soon as the search finds it.
 
-def _undec_trans(labelling: Dict[Argument, StableExtensionLabel], argument: Argument) -> \
-        Dict[Argument, StableExtensionLabel]:
-    new_labelling = labelling.copy()
-    new_labelling[argument] = StableExtensionLabel.UNDEC
-    return new_labelling
+    :param argumentation_framework: The argumentation framework for which we need the stable extensions.
+    :param limit: Stop the search after this many stable extensions (no limit if None).
+    :param as_bitmasks: Yield bitmasks over argumentation_framework.arguments instead.
+    :param budget: Budget for the search nodes (see py_arg.utils.budget); BudgetExceeded is raised once it is exhausted.
+    :param stats: Statistics in which the search counts its work (see py_arg.utils.search_statistics).
+    :return: Iterator over the stable extensions of the argumentation framework.
+    """
+    search = LabellingSearch.from_argumentation_framework(argumentation_framework, is_accepted=is_stable_labelling,
+                                                         fix_grounded_labels=True, propagate_for='Stable',
+                                                         budget=budget, stats=stats)
+    for bitmask in islice(search.search(), limit):
+        yield bitmask if as_bitmasks else bitmask_to_extension(bitmask, argumentation_framework)
 
 
 if __name__ == "__main__":
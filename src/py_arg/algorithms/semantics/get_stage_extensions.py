@@ -0,0 +1,64 @@
+from typing import FrozenSet, Optional, Set, Union
+
+from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
+from py_arg.abstract_argumentation_classes.argument import Argument
+from py_arg.abstract_argumentation_classes.compact_argumentation_framework import CompactArgumentationFramework
+from py_arg.abstract_argumentation_classes.defeat import Defeat
+import py_arg.algorithms.semantics.get_naive_extensions as get_naive_extensions
+from py_arg.algorithms.semantics.extension_bitmask import bitmasks_to_extensions, iterate_bitmask
+from py_arg.algorithms.semantics.range_maximal_search import RangeAntichain
+from py_arg.utils.budget import Budget
+from py_arg.utils.search_statistics import SearchStatistics, in_phase
+
+
+def get_stage_extensions(argumentation_framework: AbstractArgumentationFramework, as_bitmasks: bool = False,
+                         budget: Optional[Budget] = None, stats: Optional[SearchStatistics] = None) \
+        -> Union[Set[FrozenSet[Argument]], Set[int]]:
+    """
+    Get the stage extensions of an argumentation framework: the conflict-free sets with a maximal range.
+
+    :param argumentation_framework: The argumentation framework for which we need the stage extensions.
+    :param as_bitmasks: Return each extension as a bitmask over argumentation_framework.arguments instead.
+    :param budget: Budget for the search (see py_arg.utils.budget). If it is exhausted, BudgetExceeded is raised,
+        without partial results: no extension is known to be a stage extension before the search completes.
+    :param stats: Statistics in which the search counts its work (see py_arg.utils.search_statistics). The naive
+        extensions without a maximal range count as maximality rejections.
+    :return: The stage extensions of the argumentation framework.
+
+    >>> a, b, c = Argument('a'), Argument('b'), Argument('c')
+    >>> af = AbstractArgumentationFramework('af', [a, b, c], [Defeat(a, b), Defeat(b, c), Defeat(c, a)])
+    >>> sorted(sorted(extension) for extension in get_stage_extensions(af))
+    [[a], [b], [c]]
+    >>> af = AbstractArgumentationFramework('af', [a, b, c], [Defeat(a, b), Defeat(b, a), Defeat(b, c), Defeat(c, c)])
+    >>> sorted(sorted(extension) for extension in get_stage_extensions(af))
+    [[b]]
+    """
+    # A conflict-free set with a maximal range is also maximal under set inclusion, since adding an argument that is
+    # not in conflict with the set adds that argument to the range. So the stage extensions are the naive extensions
+    # with a maximal range.
+    compact_framework = CompactArgumentationFramework.from_abstract_argumentation_framework(argumentation_framework)
+    attacked_bitmasks = [sum(1 << attacked_id for attacked_id in set(attacked_ids))
+                         for attacked_ids in compact_framework.get_attacked_lists()]
+    antichain = RangeAntichain()
+    nr_of_naive_extensions = 0
+    with in_phase(stats, 'search'):
+        for naive_bitmask in get_naive_extensions.iter_naive_extensions(argumentation_framework, as_bitmasks=True,
+                                                                        budget=budget, stats=stats):
+            range_bitmask = naive_bitmask
+            for argument_id in iterate_bitmask(naive_bitmask):
+                range_bitmask |= attacked_bitmasks[argument_id]
+            antichain.add(range_bitmask, naive_bitmask)
+            nr_of_naive_extensions += 1
+    stage_bitmasks = antichain.get_in_bitmasks()
+    if stats is not None:
+        stats.nr_of_maximality_rejections += nr_of_naive_extensions - len(stage_bitmasks)
+    if as_bitmasks:
+        return stage_bitmasks
+    with in_phase(stats, 'conversion'):
+        return bitmasks_to_extensions(stage_bitmasks, argumentation_framework)
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
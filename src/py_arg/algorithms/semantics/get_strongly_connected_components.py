@@ -0,0 +1,97 @@
+from typing import List
+
+from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
+from py_arg.abstract_argumentation_classes.argument import Argument
+from py_arg.abstract_argumentation_classes.compact_argumentation_framework import CompactArgumentationFramework
+from py_arg.abstract_argumentation_classes.defeat import Defeat
+
+
+def get_strongly_connected_components(argumentation_framework: AbstractArgumentationFramework) \
+        -> List[List[Argument]]:
+    """
+    Get the strongly connected components of the defeat graph of an argumentation framework, in topological order:
+    if an argument in one component defeats an argument in another component, the first component comes first.
+
+    :param argumentation_framework: The argumentation framework to decompose.
+    :return: List of components, each a list of arguments.
+
+    >>> a, b, c, d = Argument('a'), Argument('b'), Argument('c'), Argument('d')
+    >>> defeats = [Defeat(c, d), Defeat(d, c), Defeat(b, c), Defeat(a, b)]
+    >>> af = AbstractArgumentationFramework('af', [a, b, c, d], defeats)
+    >>> get_strongly_connected_components(af)
+    [[a], [b], [c, d]]
+    """
+    compact_framework = CompactArgumentationFramework.from_abstract_argumentation_framework(argumentation_framework)
+    arguments = argumentation_framework.arguments
+    return [[arguments[argument_id] for argument_id in component]
+            for component in get_strongly_connected_component_ids(compact_framework.get_attacked_lists())]
+
+
+def get_strongly_connected_component_ids(attacked_ids: List[List[int]]) -> List[List[int]]:
+    """
+    Get the strongly connected components of a framework given by integer ids, in topological order. This is Tarjan's
+    algorithm, with an explicit stack so that long chains of defeats do not hit the recursion limit. It takes
+    O(|arguments| + |defeats|) time. The ids within each component are sorted.
+
+    :param attacked_ids: For each argument id, the ids of the arguments it defeats.
+    :return: List of components, each a list of argument ids.
+
+    >>> get_strongly_connected_component_ids([[1], [2], [1], [0]])
+    [[3], [0], [1, 2]]
+    """
+    nr_of_arguments = len(attacked_ids)
+    index = [-1] * nr_of_arguments
+    low_link = [0] * nr_of_arguments
+    on_stack = [False] * nr_of_arguments
+    component_stack = []
+    components = []
+    next_index = 0
+
+    for root_id in range(nr_of_arguments):
+        if index[root_id] != -1:
+            continue
+        # Each frame is [argument_id, position of the next defeat of this argument to follow].
+        call_stack = [[root_id, 0]]
+        index[root_id] = low_link[root_id] = next_index
+        next_index += 1
+        component_stack.append(root_id)
+        on_stack[root_id] = True
+        while call_stack:
+            frame = call_stack[-1]
+            argument_id, position = frame
+            if position < len(attacked_ids[argument_id]):
+                frame[1] += 1
+                attacked_id = attacked_ids[argument_id][position]
+                if index[attacked_id] == -1:
+                    index[attacked_id] = low_link[attacked_id] = next_index
+                    next_index += 1
+                    component_stack.append(attacked_id)
+                    on_stack[attacked_id] = True
+                    call_stack.append([attacked_id, 0])
+                elif on_stack[attacked_id]:
+                    low_link[argument_id] = min(low_link[argument_id], index[attacked_id])
+                continue
+
+            call_stack.pop()
+            if call_stack:
+                parent_id = call_stack[-1][0]
+                low_link[parent_id] = min(low_link[parent_id], low_link[argument_id])
+            if low_link[argument_id] == index[argument_id]:
+                component = []
+                while True:
+                    member_id = component_stack.pop()
+                    on_stack[member_id] = False
+                    component.append(member_id)
+                    if member_id == argument_id:
+                        break
+                components.append(sorted(component))
+
+    # Tarjan's algorithm finds a component only after all components reachable from it, so reverse the order.
+    components.reverse()
+    return components
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
@@ -0,0 +1,213 @@
+from typing import List, Optional
+
+from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
+from py_arg.abstract_argumentation_classes.argument import Argument
+from py_arg.abstract_argumentation_classes.defeat import Defeat
+from py_arg.algorithms.semantics.get_eager_extension import get_eager_extension
+from py_arg.algorithms.semantics.get_grounded_labelling import GroundedLabel, get_grounded_labelling
+from py_arg.algorithms.semantics.get_ideal_extension import get_ideal_extension
+from py_arg.algorithms.semantics.get_preferred_extensions import iter_preferred_extensions
+from py_arg.algorithms.semantics.get_semistable_extensions import iter_semistable_extensions
+from py_arg.algorithms.semantics.labelling_search import LabellingSearch, BLANK, IN, is_stable_labelling
+from py_arg.utils.budget import Budget, BudgetExceeded
+from py_arg.utils.search_statistics import SearchStatistics
+
+
+# Decision procedures for credulous and skeptical acceptance. Rather than enumerating all extensions, they search for a
+# single witness (an extension containing the argument) or counterexample (an extension not containing it).
+# Complete, grounded, preferred and ideal semantics satisfy directionality: whether an argument is accepted only depends
+# on the arguments from which it can be reached by a path of defeats, so only that part of the framework is searched.
+# Stable, semi-stable and eager semantics do not, so for these semantics the whole framework is searched.
+
+ACCEPTANCE_SEMANTICS = ['Admissible', 'Complete', 'Grounded', 'Preferred', 'Ideal', 'Stable', 'SemiStable', 'Eager']
+
+
+def is_credulously_accepted(argumentation_framework: AbstractArgumentationFramework, argument: Argument,
+                            semantics: str, budget: Optional[Budget] = None,
+                            stats: Optional[SearchStatistics] = None) -> bool:
+    """
+    Check if an argument is in at least one extension under some semantics. The search stops at the first extension
+    containing the argument.
+
+    :param argumentation_framework: The argumentation framework.
+    :param argument: The argument for which we want to know if it is credulously accepted.
+    :param semantics: The semantics: Admissible, Complete, Grounded, Preferred, Ideal, Stable, SemiStable or Eager.
+    :param budget: Budget for the search (see py_arg.utils.budget). If it is exhausted, BudgetExceeded is raised,
+        without partial results.
+    :param stats: Statistics in which the search counts its work (see py_arg.utils.search_statistics).
+    :return: Is there an extension containing the argument?
+
+    >>> a, b, c = Argument('a'), Argument('b'), Argument('c')
+    >>> defeats = [Defeat(a, b), Defeat(b, a), Defeat(b, c), Defeat(c, c)]
+    >>> af = AbstractArgumentationFramework('af', [a, b, c], defeats)
+    >>> is_credulously_accepted(af, a, 'Preferred'), is_credulously_accepted(af, a, 'Stable')
+    (True, False)
+    >>> is_credulously_accepted(af, c, 'Complete')
+    False
+    """
+    _check_arguments(argumentation_framework, argument, semantics)
+    try:
+        return _is_credulously_accepted(argumentation_framework, argument, semantics, budget, stats)
+    except BudgetExceeded as error:
+        # Whatever the search found so far does not decide the acceptance.
+        error.partial_results = None
+        raise
+
+
+def _is_credulously_accepted(argumentation_framework: AbstractArgumentationFramework, argument: Argument,
+                             semantics: str, budget: Optional[Budget], stats: Optional[SearchStatistics]) -> bool:
+    if semantics in ['Admissible', 'Complete', 'Preferred']:
+        # The argument is in some admissible set iff it is in some complete or preferred extension.
+        relevant_framework = get_relevant_framework(argumentation_framework, argument)
+        grounded_label = get_grounded_labelling(relevant_framework)[argument]
+        if grounded_label is not GroundedLabel.UNDEC:
+            return grounded_label is GroundedLabel.IN
+        search = LabellingSearch.from_argumentation_framework(relevant_framework, prune=_argument_cannot_be_in,
+                                                              fix_grounded_labels=True, propagate_for='Complete',
+                                                              budget=budget, stats=stats)
+        return _has_accepted_labelling(search)
+    if semantics == 'Grounded':
+        relevant_framework = get_relevant_framework(argumentation_framework, argument)
+        return get_grounded_labelling(relevant_framework)[argument] is GroundedLabel.IN
+    if semantics == 'Stable':
+        search = LabellingSearch.from_argumentation_framework(_put_argument_first(argumentation_framework, argument),
+                                                              is_accepted=is_stable_labelling,
+                                                              prune=_argument_cannot_be_in, fix_grounded_labels=True,
+                                                              propagate_for='Stable', budget=budget,
+                                                              stats=stats)
+        return _has_accepted_labelling(search)
+    if semantics == 'SemiStable':
+        return any(argument in extension
+                   for extension in iter_semistable_extensions(argumentation_framework, budget=budget,
+                                                                             stats=stats))
+    return _is_in_unique_extension(argumentation_framework, argument, semantics, budget, stats)
+
+
+def is_skeptically_accepted(argumentation_framework: AbstractArgumentationFramework, argument: Argument,
+                            semantics: str, budget: Optional[Budget] = None,
+                            stats: Optional[SearchStatistics] = None) -> bool:
+    """
+    Check if an argument is in every extension under some semantics. The search stops at the first extension that does
+    not contain the argument. Note that, under stable semantics, every argument is skeptically accepted if there are no
+    stable extensions.
+
+    :param argumentation_framework: The argumentation framework.
+    :param argument: The argument for which we want to know if it is skeptically accepted.
+    :param semantics: The semantics: Admissible, Complete, Grounded, Preferred, Ideal, Stable, SemiStable or Eager.
+    :param budget: Budget for the search (see py_arg.utils.budget). If it is exhausted, BudgetExceeded is raised,
+        without partial results.
+    :param stats: Statistics in which the search counts its work (see py_arg.utils.search_statistics).
+    :return: Is the argument in each extension?
+
+    >>> a, b, c, d = Argument('a'), Argument('b'), Argument('c'), Argument('d')
+    >>> defeats = [Defeat(a, b), Defeat(b, a), Defeat(a, c), Defeat(b, c), Defeat(c, d)]
+    >>> af = AbstractArgumentationFramework('af', [a, b, c, d], defeats)
+    >>> is_skeptically_accepted(af, d, 'Preferred'), is_skeptically_accepted(af, d, 'Complete')
+    (True, False)
+    >>> is_skeptically_accepted(af, a, 'Stable')
+    False
+    """
+    _check_arguments(argumentation_framework, argument, semantics)
+    try:
+        return _is_skeptically_accepted(argumentation_framework, argument, semantics, budget, stats)
+    except BudgetExceeded as error:
+        # Whatever the search found so far does not decide the acceptance.
+        error.partial_results = None
+        raise
+
+
+def _is_skeptically_accepted(argumentation_framework: AbstractArgumentationFramework, argument: Argument,
+                             semantics: str, budget: Optional[Budget], stats: Optional[SearchStatistics]) -> bool:
+    if semantics == 'Admissible':
+        # The empty set is always admissible.
+        return False
+    if semantics in ['Complete', 'Grounded']:
+        # The grounded extension is the intersection of all complete extensions.
+        relevant_framework = get_relevant_framework(argumentation_framework, argument)
+        return get_grounded_labelling(relevant_framework)[argument] is GroundedLabel.IN
+    if semantics == 'Preferred':
+        relevant_framework = get_relevant_framework(argumentation_framework, argument)
+        grounded_label = get_grounded_labelling(relevant_framework)[argument]
+        if grounded_label is not GroundedLabel.UNDEC:
+            return grounded_label is GroundedLabel.IN
+        return all(argument in extension
+                   for extension in iter_preferred_extensions(relevant_framework, budget=budget, stats=stats))
+    if semantics == 'Stable':
+        search = LabellingSearch.from_argumentation_framework(_put_argument_first(argumentation_framework, argument),
+                                                              is_accepted=is_stable_labelling,
+                                                              prune=_argument_is_in, fix_grounded_labels=True,
+                                                              propagate_for='Stable', budget=budget,
+                                                              stats=stats)
+        return not _has_accepted_labelling(search)
+    if semantics == 'SemiStable':
+        return all(argument in extension
+                   for extension in iter_semistable_extensions(argumentation_framework, budget=budget,
+                                                                             stats=stats))
+    return _is_in_unique_extension(argumentation_framework, argument, semantics, budget, stats)
+
+
+def get_relevant_framework(argumentation_framework: AbstractArgumentationFramework, argument: Argument) \
+        -> AbstractArgumentationFramework:
+    """
+    Get the sub-framework of the arguments from which there is a path of defeats to this argument (including the
+    argument itself), with the defeats between them. The argument comes first in its list of arguments.
+
+    >>> a, b, c, d = Argument('a'), Argument('b'), Argument('c'), Argument('d')
+    >>> af = AbstractArgumentationFramework('af', [a, b, c, d], [Defeat(a, b), Defeat(b, c), Defeat(c, d)])
+    >>> get_relevant_framework(af, c)
+    ( [c, b, a], [(b, c), (a, b)] )
+    """
+    relevant_arguments = [argument]
+    relevant_argument_set = {argument}
+    defeats = []
+    for relevant_argument in relevant_arguments:
+        for defeater in argumentation_framework.get_incoming_defeat_arguments(relevant_argument):
+            defeats.append(Defeat(defeater, relevant_argument))
+            if defeater not in relevant_argument_set:
+                relevant_argument_set.add(defeater)
+                relevant_arguments.append(defeater)
+    return AbstractArgumentationFramework(argumentation_framework.name, relevant_arguments, defeats)
+
+
+def _put_argument_first(argumentation_framework: AbstractArgumentationFramework, argument: Argument) \
+        -> AbstractArgumentationFramework:
+    # The search branches on the BLANK argument with the lowest id first, so this decides the argument first.
+    arguments: List[Argument] = [argument] + [other for other in argumentation_framework.arguments if other != argument]
+    return AbstractArgumentationFramework(argumentation_framework.name, arguments, argumentation_framework.defeats)
+
+
+def _has_accepted_labelling(search: LabellingSearch) -> bool:
+    # The search only calls prune after a transition, so check the (grounded) labels it starts with as well.
+    if search.prune(search):
+        return False
+    return next(search.search(), None) is not None
+
+
+def _argument_cannot_be_in(search: LabellingSearch) -> bool:
+    # The argument of interest has id 0. Once it is labelled anything but IN, it cannot become IN on this branch.
+    return search.labels[0] != BLANK and search.labels[0] != IN
+
+
+def _argument_is_in(search: LabellingSearch) -> bool:
+    return search.labels[0] == IN
+
+
+def _is_in_unique_extension(argumentation_framework: AbstractArgumentationFramework, argument: Argument,
+                            semantics: str, budget: Optional[Budget], stats: Optional[SearchStatistics]) -> bool:
+    if semantics == 'Ideal':
+        return argument in get_ideal_extension(get_relevant_framework(argumentation_framework, argument),
+                                               budget=budget, stats=stats)[0]
+    return argument in get_eager_extension(argumentation_framework, budget=budget, stats=stats)[0]
+
+
+def _check_arguments(argumentation_framework: AbstractArgumentationFramework, argument: Argument, semantics: str):
+    if semantics not in ACCEPTANCE_SEMANTICS:
+        raise ValueError('Unknown semantics ' + semantics + '; choose one of ' + ', '.join(ACCEPTANCE_SEMANTICS) + '.')
+    if not argumentation_framework.is_in_arguments(argument.name):
+        raise ValueError('There is no argument named ' + argument.name + '.')
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
@@ -32,7 +32,8 @@ def is_admissible(argument_set: Iterable[Argument], argumentation_framework: Abs
     >>> is_admissible([arguments['B'], arguments['D']], af)
     True
     """
-    if any(argument not in argumentation_framework.arguments for argument in argument_set):
+    argument_set = set(argument_set)
+    if any(not argumentation_framework.is_in_arguments(argument.name) for argument in argument_set):
         raise ValueError('Not all arguments in the argument set are in the argumentation framework.')
 
     if not is_conflict_free(argument_set, argumentation_framework):
@@ -1,13 +1,12 @@
-from typing import List
+from typing import Iterable
 
 from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
 from py_arg.abstract_argumentation_classes.argument import Argument
 from py_arg.abstract_argumentation_classes.defeat import Defeat
-from py_arg.algorithms.semantics.get_acceptable_with_respect_to import get_acceptable_with_respect_to
 from py_arg.algorithms.semantics.is_admissible import is_admissible
 
 
-def is_complete(argument_set: List[Argument], argumentation_framework: AbstractArgumentationFramework) -> bool:
+def is_complete(argument_set: Iterable[Argument], argumentation_framework: AbstractArgumentationFramework) -> bool:
     """
     Check if the argument set if it is admissible in the corresponding argumentation framework.
     :param argument_set: Set of arguments for which we want to know if it is admissible.
@@ -32,14 +31,25 @@ def is_complete(argument_set: List[Argument], argumentation_framework: AbstractA
     >>> is_complete([arguments['B'], arguments['D']], af)
     True
     """
-    if any(argument not in argumentation_framework.arguments for argument in argument_set):
+    argument_set = set(argument_set)
+    if any(not argumentation_framework.is_in_arguments(argument.name) for argument in argument_set):
         raise ValueError('Not all arguments in the argument set are in the argumentation framework.')
 
     if not is_admissible(argument_set, argumentation_framework):
         return False
 
-    if any(acceptable_argument not in argument_set
-           for acceptable_argument in get_acceptable_with_respect_to(argument_set, argumentation_framework)):
+    # An argument that is acceptable with respect to the set is either undefeated, or defeated by some argument that
+    # the set defeats, so only these candidates need to be checked rather than all arguments.
+    defeated_by_set = {defeated for argument in argument_set
+                       for defeated in argumentation_framework.get_outgoing_defeat_arguments(argument)}
+    candidates = {candidate for defeated in defeated_by_set
+                  for candidate in argumentation_framework.get_outgoing_defeat_arguments(defeated)}
+    candidates.update(argument for argument in argumentation_framework.arguments
+                      if not argumentation_framework.is_defeated(argument))
+    if any(candidate not in argument_set and
+           all(attacker in defeated_by_set
+               for attacker in argumentation_framework.get_incoming_defeat_arguments(candidate))
+           for candidate in candidates):
         return False
 
     return True
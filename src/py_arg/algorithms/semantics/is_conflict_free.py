@@ -1,4 +1,3 @@
-import itertools
 from typing import Iterable
 
 from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
@@ -23,8 +22,10 @@ def is_conflict_free(argument_set: Iterable[Argument], argumentation_framework:
     >>> is_conflict_free([arguments['A'], arguments['B']], af)
     False
     """
-    if any(argument not in argumentation_framework.arguments for argument in argument_set):
+    argument_set = set(argument_set)
+    if any(not argumentation_framework.is_in_arguments(argument.name) for argument in argument_set):
         raise ValueError('Not all arguments in the argument set are in the argumentation framework.')
 
-    return not any(Defeat(arg_a, arg_b) in argumentation_framework.defeats
-                   for arg_a, arg_b in itertools.product(argument_set, argument_set))
+    return not any(defeated in argument_set
+                   for argument in argument_set
+                   for defeated in argumentation_framework.get_outgoing_defeat_arguments(argument))
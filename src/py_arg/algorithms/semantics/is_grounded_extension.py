@@ -1,4 +1,4 @@
-from typing import List
+from typing import Iterable
 
 from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
 from py_arg.abstract_argumentation_classes.argument import Argument
@@ -6,7 +6,8 @@ from py_arg.abstract_argumentation_classes.defeat import Defeat
 from py_arg.algorithms.semantics.get_grounded_extension import get_grounded_extension
 
 
-def is_grounded_extension(argument_set: List[Argument], argumentation_framework: AbstractArgumentationFramework) -> bool:
+def is_grounded_extension(argument_set: Iterable[Argument],
+                          argumentation_framework: AbstractArgumentationFramework) -> bool:
     """
     Check if the argument set if it is the grounded extension in the corresponding argumentation framework.
     :param argument_set: Set of arguments for which we want to know if it is the grounded extension.
@@ -25,9 +26,8 @@ def is_grounded_extension(argument_set: List[Argument], argumentation_framework:
     >>> is_grounded_extension([arguments['D'], arguments['A']], af)
     True
     """
-    if any(argument not in argumentation_framework.arguments for argument in argument_set):
+    argument_set = set(argument_set)
+    if any(not argumentation_framework.is_in_arguments(argument.name) for argument in argument_set):
         raise ValueError('Not all arguments in the argument set are in the argumentation framework.')
 
-    sorted_grounded_extension = sorted(get_grounded_extension(argumentation_framework))
-    sorted_set = sorted(argument_set)
-    return sorted_grounded_extension == sorted_set
+    return set(get_grounded_extension(argumentation_framework)) == argument_set
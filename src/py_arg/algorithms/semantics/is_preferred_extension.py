@@ -1,18 +1,21 @@
-import itertools
-from typing import List
+from typing import Iterable, Optional
 
 from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
 from py_arg.abstract_argumentation_classes.argument import Argument
 from py_arg.abstract_argumentation_classes.defeat import Defeat
-from py_arg.algorithms.semantics.is_admissible import is_admissible
+from py_arg.algorithms.semantics.is_complete import is_complete
+from py_arg.algorithms.semantics.labelling_search import LabellingSearch, IN, is_admissible_labelling
+from py_arg.utils.budget import Budget
 
 
-def is_preferred_extension(argument_set: List[Argument], argumentation_framework: AbstractArgumentationFramework) \
-        -> bool:
+def is_preferred_extension(argument_set: Iterable[Argument], argumentation_framework: AbstractArgumentationFramework,
+                           budget: Optional[Budget] = None) -> bool:
     """
     Check if the argument set if it is a preferred extension in the corresponding argumentation framework.
     :param argument_set: Set of arguments for which we want to know if it is a preferred extension.
     :param argumentation_framework: Argumentation framework specifying defeats between arguments.
+    :param budget: Budget for the search for a larger admissible set (see py_arg.utils.budget). If it is exhausted,
+        BudgetExceeded is raised, without partial results.
     :return: Is this argument set a preferred exension?
 
     >>> arguments = {s: Argument(s) for s in 'ABCDEF'}
@@ -33,19 +36,23 @@ def is_preferred_extension(argument_set: List[Argument], argumentation_framework
     >>> is_preferred_extension([arguments['D'], arguments['A'], arguments['F']], af)
     True
     """
-    if any(argument not in argumentation_framework.arguments for argument in argument_set):
+    argument_set = set(argument_set)
+    if any(not argumentation_framework.is_in_arguments(argument.name) for argument in argument_set):
         raise ValueError('Not all arguments in the argument set are in the argumentation framework.')
 
-    if not is_admissible(argument_set, argumentation_framework):
+    # A complete extension that is not preferred is contained in a strictly larger admissible set, and so is an
+    # admissible set that is not complete (it can be extended with an acceptable argument), so the set is preferred iff
+    # it is complete and a search for a larger admissible set, starting with all its arguments IN, finds none.
+    if not is_complete(argument_set, argumentation_framework):
         return False
 
-    # Iterator for generating all sets of arguments
-    arguments_not_in_argument_set = [arg for arg in argumentation_framework.arguments if arg not in argument_set]
-    all_combinations_of_arguments_not_in_argument_set = itertools.chain.from_iterable(
-        itertools.combinations(arguments_not_in_argument_set, n)
-        for n in range(1, len(arguments_not_in_argument_set) + 1))
-    if any(is_admissible(argument_set + list(subset), argumentation_framework)
-           for subset in all_combinations_of_arguments_not_in_argument_set):
-        return False
+    argument_ids = [argument_id for argument_id, argument in enumerate(argumentation_framework.arguments)
+                    if argument in argument_set]
+
+    def is_larger_admissible_labelling(search: LabellingSearch) -> bool:
+        return is_admissible_labelling(search) and search.label_counts[IN] > len(argument_ids)
 
-    return True
+    search = LabellingSearch.from_argumentation_framework(argumentation_framework,
+                                                          is_accepted=is_larger_admissible_labelling, budget=budget)
+    search.fix_in_labels(argument_ids)
+    return next(search.search(), None) is None
@@ -0,0 +1,38 @@
+from typing import Iterable
+
+from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
+from py_arg.abstract_argumentation_classes.argument import Argument
+from py_arg.abstract_argumentation_classes.defeat import Defeat
+from py_arg.algorithms.semantics.is_conflict_free import is_conflict_free
+
+
+def is_stable_extension(argument_set: Iterable[Argument],
+                        argumentation_framework: AbstractArgumentationFramework) -> bool:
+    """
+    Check if the argument set is a stable extension in the corresponding argumentation framework: it is conflict-free
+    and defeats each argument outside the set.
+    :param argument_set: Set of arguments for which we want to know if it is a stable extension.
+    :param argumentation_framework: Argumentation framework specifying defeats between arguments.
+    :return: Is this argument set a stable extension?
+
+    >>> arguments = {s: Argument(s) for s in 'ABCD'}
+    >>> defeats = [Defeat(arguments[s[0]], arguments[s[1]]) for s in ['AB', 'BA', 'AC', 'BC', 'CD']]
+    >>> af = AbstractArgumentationFramework('Test', list(arguments.values()), defeats)
+    >>> is_stable_extension([arguments['A']], af)
+    False
+    >>> is_stable_extension([arguments['A'], arguments['D']], af)
+    True
+    >>> is_stable_extension([arguments['A'], arguments['B'], arguments['D']], af)
+    False
+    """
+    argument_set = set(argument_set)
+    if any(not argumentation_framework.is_in_arguments(argument.name) for argument in argument_set):
+        raise ValueError('Not all arguments in the argument set are in the argumentation framework.')
+
+    if not is_conflict_free(argument_set, argumentation_framework):
+        return False
+
+    defeated_by_set = {defeated for argument in argument_set
+                       for defeated in argumentation_framework.get_outgoing_defeat_arguments(argument)}
+    return len(argument_set) + len(defeated_by_set) == len(argumentation_framework.arguments)
+
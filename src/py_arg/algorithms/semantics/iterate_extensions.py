@@ -0,0 +1,152 @@
+from itertools import islice
+from typing import Callable, Dict, FrozenSet, Iterator, Optional
+
+from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
+from py_arg.abstract_argumentation_classes.argument import Argument
+from py_arg.abstract_argumentation_classes.defeat import Defeat
+from py_arg.algorithms.semantics.external_iccma_solver import ICCMA_SEMANTICS, ExternalICCMASolver
+from py_arg.algorithms.semantics.get_admissible_sets import iter_admissible_sets
+from py_arg.algorithms.semantics.get_complete_extensions import iter_complete_extensions
+from py_arg.algorithms.semantics.get_eager_extension import get_eager_extension
+from py_arg.algorithms.semantics.get_grounded_extension import get_grounded_extension
+from py_arg.algorithms.semantics.get_ideal_extension import get_ideal_extension
+from py_arg.algorithms.semantics.get_number_of_extensions import COUNTABLE_SEMANTICS, get_number_of_extensions
+from py_arg.algorithms.semantics.get_preferred_extensions import iter_preferred_extensions
+from py_arg.algorithms.semantics.get_semistable_extensions import iter_semistable_extensions
+from py_arg.algorithms.semantics.get_stable_extensions import iter_stable_extensions
+from py_arg.algorithms.semantics.get_stage_extensions import get_stage_extensions
+from py_arg.utils.budget import Budget, BudgetExceeded, iterate_within_budget
+
+
+def _iter_grounded_extensions(argumentation_framework: AbstractArgumentationFramework,
+                              budget: Optional[Budget] = None) -> Iterator[FrozenSet[Argument]]:
+    # The grounded extension takes polynomial time, so only the extension itself is charged to the budget.
+    yield frozenset(get_grounded_extension(argumentation_framework))
+
+
+def _iter_ideal_extensions(argumentation_framework: AbstractArgumentationFramework,
+                           budget: Optional[Budget] = None) -> Iterator[FrozenSet[Argument]]:
+    for extension in get_ideal_extension(argumentation_framework, budget=budget):
+        yield frozenset(extension)
+
+
+def _iter_stage_extensions(argumentation_framework: AbstractArgumentationFramework,
+                           budget: Optional[Budget] = None) -> Iterator[FrozenSet[Argument]]:
+    yield from get_stage_extensions(argumentation_framework, budget=budget)
+
+
+def _iter_eager_extensions(argumentation_framework: AbstractArgumentationFramework,
+                           budget: Optional[Budget] = None) -> Iterator[FrozenSet[Argument]]:
+    for extension in get_eager_extension(argumentation_framework, budget=budget):
+        yield frozenset(extension)
+
+
+# The semantics names are the same as in the visualisation of abstract argumentation frameworks. Each iterator also
+# takes a budget as keyword argument.
+_EXTENSION_ITERATORS: Dict[str, Callable[..., Iterator[FrozenSet[Argument]]]] = {
+    'Admissible': iter_admissible_sets,
+    'Complete': iter_complete_extensions,
+    'Grounded': _iter_grounded_extensions,
+    'Preferred': iter_preferred_extensions,
+    'Ideal': _iter_ideal_extensions,
+    'Stable': iter_stable_extensions,
+    'SemiStable': iter_semistable_extensions,
+    'Stage': _iter_stage_extensions,
+    'Eager': _iter_eager_extensions,
+}
+
+
+def iter_extensions(argumentation_framework: AbstractArgumentationFramework, semantics: str,
+                    limit: Optional[int] = None, external_solver: Optional[ExternalICCMASolver] = None,
+                    external_solver_min_arguments: int = 0, budget: Optional[Budget] = None) \
+        -> Iterator[FrozenSet[Argument]]:
+    """
+    Iterate over the extensions of an argumentation framework under some semantics, yielding each extension as soon
+    as it is found. The search stops as soon as the caller stops iterating or the limit is reached.
+
+    :param argumentation_framework: The argumentation framework for which we need the extensions.
+    :param semantics: The semantics: Admissible, Complete, Grounded, Preferred, Ideal, Stable, SemiStable, Stage or
+        Eager.
+    :param limit: Stop the search after this many extensions (no limit if None).
+    :param external_solver: An external ICCMA solver for frameworks with at least external_solver_min_arguments
+        arguments, if it supports the semantics. It returns all extensions at once, of which the first limit are used.
+    :param external_solver_min_arguments: The number of arguments from which on the external solver is used.
+    :param budget: Budget for the search and the extensions (see py_arg.utils.budget). If it is exhausted,
+        BudgetExceeded is raised, with the list of extensions yielded so far as partial results. An external solver
+        cannot be stopped halfway, so then only its extensions are charged.
+    :return: Iterator over the extensions.
+
+    >>> a, b, c = Argument('a'), Argument('b'), Argument('c')
+    >>> af = AbstractArgumentationFramework('af', [a, b, c], [Defeat(a, b), Defeat(b, a), Defeat(c, c)])
+    >>> [sorted(extension) for extension in iter_extensions(af, 'Preferred')]
+    [[a], [b]]
+    >>> [sorted(extension) for extension in iter_extensions(af, 'Complete', limit=2)]
+    [[a], [b]]
+    >>> try:
+    ...     list(iter_extensions(af, 'Complete', budget=Budget(max_extensions=1)))
+    ... except BudgetExceeded as error:
+    ...     [sorted(extension) for extension in error.partial_results]
+    [[a]]
+    """
+    if semantics not in _EXTENSION_ITERATORS:
+        raise ValueError('Unknown semantics ' + semantics + '; choose one of ' +
+                         ', '.join(_EXTENSION_ITERATORS.keys()) + '.')
+    if external_solver is not None and semantics in ICCMA_SEMANTICS and \
+            len(argumentation_framework.arguments) >= external_solver_min_arguments:
+        return iterate_within_budget(islice(external_solver.get_extensions(argumentation_framework, semantics), limit),
+                                     budget)
+    return iterate_within_budget(islice(_EXTENSION_ITERATORS[semantics](argumentation_framework, budget=budget), limit),
+                                 budget)
+
+
+def first_extension(argumentation_framework: AbstractArgumentationFramework, semantics: str) \
+        -> Optional[FrozenSet[Argument]]:
+    """
+    Get the first extension found under some semantics, or None if there is no extension. The search stops as soon as
+    one extension is found.
+
+    >>> a, b = Argument('a'), Argument('b')
+    >>> af = AbstractArgumentationFramework('af', [a, b], [Defeat(a, b), Defeat(b, b)])
+    >>> sorted(first_extension(af, 'Stable'))
+    [a]
+    >>> first_extension(AbstractArgumentationFramework('af', [b], [Defeat(b, b)]), 'Stable') is None
+    True
+    """
+    return next(iter_extensions(argumentation_framework, semantics), None)
+
+
+def has_extension(argumentation_framework: AbstractArgumentationFramework, semantics: str) -> bool:
+    """
+    Check if there is some extension under this semantics. The search stops as soon as one extension is found.
+
+    >>> b = Argument('b')
+    >>> af = AbstractArgumentationFramework('af', [b], [Defeat(b, b)])
+    >>> has_extension(af, 'Stable'), has_extension(af, 'Preferred')
+    (False, True)
+    """
+    return first_extension(argumentation_framework, semantics) is not None
+
+
+def count_extensions(argumentation_framework: AbstractArgumentationFramework, semantics: str,
+                     limit: Optional[int] = None) -> int:
+    """
+    Count the extensions under some semantics without keeping them in memory. If a limit is given, the search stops
+    once this many extensions are found, so the result is min(limit, number of extensions). Otherwise, complete,
+    grounded, preferred and stable extensions are counted by get_number_of_extensions, without enumerating them.
+
+    >>> a, b, c = Argument('a'), Argument('b'), Argument('c')
+    >>> af = AbstractArgumentationFramework('af', [a, b, c], [Defeat(a, b), Defeat(b, a)])
+    >>> count_extensions(af, 'Admissible'), count_extensions(af, 'Admissible', limit=2)
+    (6, 2)
+    >>> count_extensions(af, 'Complete')
+    3
+    """
+    if limit is None and semantics in COUNTABLE_SEMANTICS:
+        return get_number_of_extensions(argumentation_framework, semantics)
+    return sum(1 for _ in iter_extensions(argumentation_framework, semantics, limit))
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
@@ -0,0 +1,444 @@
+from enum import Enum
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
+from py_arg.abstract_argumentation_classes.compact_argumentation_framework import CompactArgumentationFramework
+from py_arg.algorithms.semantics.get_grounded_labelling import GroundedLabel, get_grounded_labels_by_id
+from py_arg.utils.budget import Budget
+from py_arg.utils.search_statistics import SearchStatistics, in_phase
+
+
+# Algorithm 1 from Nofal, Samer, Katie Atkinson, and Paul E. Dunne. "Algorithms for decision problems in argument
+# systems under preferred semantics." Artificial Intelligence 207 (2014): 23-51.
+# Adjustment based on Modgil, Sanjay and Martin Caminada. "Proof Theories and Algorithms for Abstract Argumentation
+# Frameworks." In Iyad Rahwan and Guillermo R. Simari, editors, Argumentation in Artificial Intelligence, pages
+# 105–132
+# This is the labelling search shared by the admissible, complete, preferred, stable, semi-stable, ideal and eager
+# semantics; the semantics only differ in which completed labellings they accept.
+
+
+class ExtensionLabel(Enum):
+    IN = 1          # Arguments *might* be in an extension
+    OUT = 2         # Argument is defeated by an IN argument
+    BLANK = 3       # Default label for all arguments, indicating that the argument is still unprocessed.
+    MUST_OUT = 4    # Argument defeats IN argument
+    UNDEC = 5       # Argument may not be included in an extension because not defended by any IN argument.
+
+
+# The search itself works with the plain integer values of the labels, which are much faster to compare.
+IN = ExtensionLabel.IN.value
+OUT = ExtensionLabel.OUT.value
+BLANK = ExtensionLabel.BLANK.value
+MUST_OUT = ExtensionLabel.MUST_OUT.value
+UNDEC = ExtensionLabel.UNDEC.value
+
+# The semantics for which the search can propagate labels, see LabellingSearch.
+PROPAGATION_SEMANTICS = ['Admissible', 'Complete', 'Stable']
+# The heuristics for choosing the BLANK argument to branch on, see LabellingSearch.
+BRANCHING_HEURISTICS = ['first', 'max_out_degree', 'min_in_degree', 'attacker_of_in']
+
+
+class LabellingSearch:
+    """
+    Backtracking search over labellings of an argumentation framework whose arguments are identified by integer ids
+    (as in a CompactArgumentationFramework). The search repeatedly picks a BLANK argument and first tries to label it
+    IN, then UNDEC. Instead of copying the labelling for every branch, it records each label change on an undo trail
+    and reverts the trail when backtracking. It also keeps a count of the arguments per label, so checking whether a
+    labelling is complete (no BLANK arguments) or admissible (no MUST_OUT arguments) takes constant time.
+
+    Semantics plug in through two hooks, both of which get the search itself so they can inspect the current labels:
+
+    * is_accepted is called on every labelling without BLANK arguments and decides whether it should be reported.
+      By default, the labellings without MUST_OUT arguments (i.e. the admissible ones) are accepted.
+    * prune is called after every IN or UNDEC transition and returns True if the branch cannot lead to an accepted
+      labelling, in which case it is not explored further.
+
+    If fix_grounded_labels is True, the arguments that are IN or OUT in the grounded labelling get that label before
+    the search starts and keep it throughout, so the search only branches on the arguments that are UNDEC in the
+    grounded labelling. This is sound whenever every accepted labelling extends the grounded labelling, as is the case
+    for complete labellings and their refinements (preferred, stable, semi-stable), but not for admissible labellings.
+
+    If propagate_for is Admissible, Complete or Stable, only labellings of that kind (or their refinements) can be
+    accepted, and after each transition the search infers what follows from it, like unit propagation in a SAT solver:
+
+    * Admissible: a MUST_OUT argument without defeaters that can still become IN makes the branch fail.
+    * Complete: besides, a BLANK argument whose defeaters are all OUT is labelled IN (with the usual transition), and
+      an UNDEC argument whose defeaters are all OUT makes the branch fail.
+    * Stable: besides, an argument that can no longer become IN or OUT makes the branch fail.
+
+    The branching heuristic decides which BLANK argument the search branches on: the first one by id ('first'), the
+    one that defeats the most ('max_out_degree') or is defeated by the fewest ('min_in_degree') arguments, or
+    ('attacker_of_in') the first one that defeats a MUST_OUT argument, as it can defend the IN arguments, and
+    otherwise the first one.
+
+    If a budget is given, each node of the search tree (each transition that is not pruned) is charged to it, so the
+    search raises BudgetExceeded once the budget is exhausted. If statistics are given, the search counts its nodes,
+    propagated labels and backtracks in them, as well as the labellings it holds: those on the current branch, plus
+    nr_of_candidates, which a maximality check on top of the search sets to the number of candidates it keeps.
+    """
+    def __init__(self, attacked_ids: List[List[int]], attacker_ids: List[List[int]],
+                 is_accepted: Optional[Callable[['LabellingSearch'], bool]] = None,
+                 prune: Optional[Callable[['LabellingSearch'], bool]] = None, fix_grounded_labels: bool = False,
+                 propagate_for: Optional[str] = None, branching: str = 'first', budget: Optional[Budget] = None,
+                 stats: Optional[SearchStatistics] = None):
+        if propagate_for is not None and propagate_for not in PROPAGATION_SEMANTICS:
+            raise ValueError('Cannot propagate labels for ' + propagate_for + '; choose one of ' +
+                             ', '.join(PROPAGATION_SEMANTICS) + '.')
+        if branching not in BRANCHING_HEURISTICS:
+            raise ValueError('Unknown branching heuristic ' + branching + '; choose one of ' +
+                             ', '.join(BRANCHING_HEURISTICS) + '.')
+        self.nr_of_arguments = len(attacked_ids)
+        self.attacked_ids = attacked_ids
+        self.attacker_ids = attacker_ids
+        self.is_self_attacking = [argument_id in attacked_ids[argument_id]
+                                  for argument_id in range(self.nr_of_arguments)]
+        self.is_accepted = is_accepted if is_accepted is not None else is_admissible_labelling
+        self.prune = prune
+        self.propagate_for = propagate_for
+        self._propagates_complete = propagate_for in ['Complete', 'Stable']
+        self._propagates_stable = propagate_for == 'Stable'
+        self.branching = branching
+        if branching == 'max_out_degree':
+            self._branching_order = sorted(range(self.nr_of_arguments), key=lambda i: -len(attacked_ids[i]))
+        elif branching == 'min_in_degree':
+            self._branching_order = sorted(range(self.nr_of_arguments), key=lambda i: len(attacker_ids[i]))
+        else:
+            self._branching_order = list(range(self.nr_of_arguments))
+        self._is_inconsistent = False
+        self.budget = budget
+        self.stats = stats
+        self.nr_of_candidates = 0
+
+        self.labels = [BLANK] * self.nr_of_arguments
+        self.label_counts = [0] * (len(ExtensionLabel) + 1)
+        self.label_counts[BLANK] = self.nr_of_arguments
+        self._trail_arguments: List[int] = []
+        self._trail_labels: List[int] = []
+        if fix_grounded_labels:
+            with in_phase(stats, 'grounded'):
+                self._fix_grounded_labels()
+
+    @classmethod
+    def from_argumentation_framework(cls, argumentation_framework: AbstractArgumentationFramework,
+                                     is_accepted: Optional[Callable[['LabellingSearch'], bool]] = None,
+                                     prune: Optional[Callable[['LabellingSearch'], bool]] = None,
+                                     fix_grounded_labels: bool = False, propagate_for: Optional[str] = None,
+                                     branching: str = 'first', budget: Optional[Budget] = None,
+                                     stats: Optional[SearchStatistics] = None) -> 'LabellingSearch':
+        """
+        Create a search over the labellings of this framework. Argument ids follow argumentation_framework.arguments,
+        so the bitmasks reported by the search are bitmasks over argumentation_framework.arguments.
+        """
+        compact_framework = CompactArgumentationFramework.from_abstract_argumentation_framework(argumentation_framework)
+        return cls(compact_framework.get_attacked_lists(), compact_framework.get_attacker_lists(), is_accepted, prune,
+                   fix_grounded_labels, propagate_for, branching, budget, stats)
+
+    def get_bitmask(self, label: int) -> int:
+        """
+        Get the bitmask of the arguments that currently have this label.
+        """
+        bitmask = 0
+        for argument_id, argument_label in enumerate(self.labels):
+            if argument_label == label:
+                bitmask |= 1 << argument_id
+        return bitmask
+
+    def search(self) -> Iterator[int]:
+        """
+        Explore all labellings and yield the bitmask of IN arguments of each accepted labelling. While the caller
+        handles a yielded bitmask, the labels of the search still describe the accepted labelling.
+
+        >>> search = LabellingSearch([[1], [2], [1]], [[], [0, 2], [1]])
+        >>> [bin(bitmask) for bitmask in search.search()]
+        ['0b101', '0b1', '0b100', '0b0']
+        """
+        # The search is iterative rather than recursive, so it is not limited by the Python recursion limit: there is
+        # one frame per argument on the current branch. A frame is [argument_id, trail_size, next_label, position],
+        # where trail_size is the length of the undo trail before the argument was labelled, next_label is the label
+        # to try next for this argument (IN, UNDEC or BLANK once both have been tried) and position is the position
+        # of the first BLANK argument in the branching order when the argument was chosen.
+        if self._is_inconsistent:
+            return
+        stack = []
+        position = 0
+        descend = True
+        while True:
+            if descend:
+                if self.label_counts[BLANK] == 0:
+                    if self.is_accepted(self):
+                        yield self.get_bitmask(IN)
+                else:
+                    # Arguments before position are not BLANK: labels only become BLANK again by backtracking past
+                    # the frame that set position.
+                    position, argument_id = self._select_argument(position)
+                    stack.append([argument_id, len(self._trail_arguments), IN, position])
+
+            descend = False
+            while stack:
+                frame = stack[-1]
+                argument_id, trail_size, next_label, position = frame
+                self._undo(trail_size)
+                if next_label == IN:
+                    frame[2] = UNDEC
+                    if self.is_self_attacking[argument_id]:
+                        continue
+                    self._in_trans(argument_id)
+                elif next_label == UNDEC:
+                    frame[2] = BLANK
+                    self._set_label(argument_id, UNDEC)
+                else:
+                    stack.pop()
+                    if self.stats is not None:
+                        self.stats.nr_of_backtracks += 1
+                    continue
+                is_consistent = self._is_consistent(trail_size)
+                if self.stats is not None:
+                    # Every label on the trail after the one chosen for this argument was inferred.
+                    self.stats.nr_of_propagations += len(self._trail_arguments) - trail_size - 1
+                if is_consistent and (self.prune is None or not self.prune(self)):
+                    if self.budget is not None:
+                        self.budget.add_node()
+                    if self.stats is not None:
+                        self.stats.add_node(len(stack) + self.nr_of_candidates)
+                    descend = True
+                    break
+            if not descend:
+                return
+
+    def fix_in_labels(self, argument_ids: Iterable[int]):
+        """
+        Before the search starts, label these arguments IN (and the arguments they defeat OUT, and their defeaters
+        MUST_OUT, as usual). Like the grounded labels, these labels are never undone, so the search only visits
+        labellings in which these arguments are IN.
+
+        >>> search = LabellingSearch([[1], [0], []], [[1], [0], []])
+        >>> search.fix_in_labels([0])
+        >>> [bin(bitmask) for bitmask in search.search()]
+        ['0b101', '0b1']
+        """
+        self.fix_decisions((argument_id, IN) for argument_id in argument_ids)
+
+    def fix_decisions(self, decisions: Iterable[Tuple[int, int]]):
+        """
+        Before the search starts, replay a sequence of branching decisions (argument id and label, IN or UNDEC) and
+        keep their labels throughout the search, so the search only explores the part of the search tree below them.
+        """
+        if not self._apply_decisions(decisions):
+            self._is_inconsistent = True
+        self._trail_arguments.clear()
+        self._trail_labels.clear()
+
+    def search_assuming(self, decisions: Iterable[Tuple[int, int]]) -> Iterator[int]:
+        """
+        Explore only the labellings below a sequence of branching decisions (argument id and label, IN or UNDEC), as
+        a search on which they are fixed would (see fix_decisions), but undo them once the iterator is exhausted or
+        closed. So one search, with its grounded labels fixed only once, can answer many such queries.
+
+        >>> search = LabellingSearch([[1], [0], []], [[1], [0], []])
+        >>> [bin(bitmask) for bitmask in search.search_assuming([(1, IN)])]
+        ['0b110', '0b10']
+        >>> search.labels == [BLANK] * 3
+        True
+        """
+        trail_size = len(self._trail_arguments)
+        try:
+            if self._apply_decisions(decisions):
+                yield from self.search()
+        finally:
+            self._undo(trail_size)
+
+    def split(self, nr_of_subproblems: int) -> List[List[Tuple[int, int]]]:
+        """
+        Split the search tree at its top branching decisions into at least nr_of_subproblems subtrees (unless the tree
+        is smaller), breadth-first. Each subtree is given by the decisions leading to it, so a search with the same
+        framework, hooks and fixed labels on which these decisions are fixed (see fix_decisions) explores exactly that
+        subtree. Together, the subtrees contain each labelling of the search exactly once. The search should not have
+        started yet; afterwards, its labels are as before. Note that the decisions depend on the branching heuristic
+        and on the labels that are propagated, so they should be the same in the searches of the subtrees.
+
+        >>> search = LabellingSearch([[1], [2], [1]], [[], [0, 2], [1]])
+        >>> search.split(3)
+        [[(0, 1), (2, 1)], [(0, 1), (2, 5)], [(0, 5), (1, 1)], [(0, 5), (1, 5)]]
+        """
+        subproblems = [[]]
+        while len(subproblems) < nr_of_subproblems:
+            new_subproblems = []
+            is_split = False
+            for decisions in subproblems:
+                self._apply_decisions(decisions)
+                if self.label_counts[BLANK] == 0:
+                    new_subproblems.append(decisions)
+                else:
+                    # Branch on the same argument as the search itself would.
+                    _, argument_id = self._select_argument(0)
+                    trail_size = len(self._trail_arguments)
+                    for label in [IN, UNDEC]:
+                        if label == IN and self.is_self_attacking[argument_id]:
+                            continue
+                        if self._apply_decisions([(argument_id, label)]) and (self.prune is None or
+                                                                               not self.prune(self)):
+                            new_subproblems.append(decisions + [(argument_id, label)])
+                        self._undo(trail_size)
+                    is_split = True
+                self._undo(0)
+            subproblems = new_subproblems
+            if not is_split:
+                break
+        return subproblems
+
+    def _apply_decisions(self, decisions: Iterable[Tuple[int, int]]) -> bool:
+        # Returns False if propagating the labels shows that no labelling can be accepted after these decisions.
+        for argument_id, label in decisions:
+            trail_size = len(self._trail_arguments)
+            if label == IN:
+                self._in_trans(argument_id)
+            else:
+                self._set_label(argument_id, label)
+            if not self._is_consistent(trail_size):
+                return False
+        return True
+
+    def _select_argument(self, position: int) -> Tuple[int, int]:
+        # Get the position of the first BLANK argument in the branching order, starting from position, and the BLANK
+        # argument to branch on.
+        labels = self.labels
+        branching_order = self._branching_order
+        while labels[branching_order[position]] != BLANK:
+            position += 1
+        if self.branching == 'attacker_of_in' and self.label_counts[MUST_OUT]:
+            for argument_id in branching_order[position:]:
+                if labels[argument_id] == BLANK and not self.is_self_attacking[argument_id] and \
+                        any(labels[attacked_id] == MUST_OUT for attacked_id in self.attacked_ids[argument_id]):
+                    return position, argument_id
+        return position, branching_order[position]
+
+    def _is_consistent(self, trail_size: int) -> bool:
+        # Propagate the label changes on the trail from trail_size on (see propagate_for), including the changes made
+        # by the propagation itself. Returns False if some argument can no longer get a label that can be accepted.
+        if self.propagate_for is None:
+            return True
+        labels = self.labels
+        trail_arguments = self._trail_arguments
+        propagates_complete = self._propagates_complete
+        propagates_stable = self._propagates_stable
+        index = trail_size
+        while index < len(trail_arguments):
+            argument_id = trail_arguments[index]
+            index += 1
+            label = labels[argument_id]
+            if label == IN:
+                continue
+            if label == MUST_OUT or (propagates_stable and label == UNDEC):
+                if not self._can_become_out(argument_id):
+                    return False
+            elif propagates_complete and label == UNDEC and self._has_only_out_attackers(argument_id):
+                return False
+            # The argument can no longer become IN, which may affect the arguments it defeats.
+            for attacked_id in self.attacked_ids[argument_id]:
+                attacked_label = labels[attacked_id]
+                if attacked_label == MUST_OUT or (propagates_stable and (
+                        attacked_label == UNDEC or (attacked_label == BLANK and self.is_self_attacking[attacked_id]))):
+                    if not self._can_become_out(attacked_id):
+                        return False
+                elif propagates_complete and label == OUT and \
+                        (attacked_label == BLANK or attacked_label == UNDEC) and \
+                        self._has_only_out_attackers(attacked_id):
+                    if attacked_label == UNDEC:
+                        return False
+                    self._in_trans(attacked_id)
+        return True
+
+    def _can_become_out(self, argument_id: int) -> bool:
+        labels = self.labels
+        is_self_attacking = self.is_self_attacking
+        return any(labels[attacker_id] == IN or (labels[attacker_id] == BLANK and not is_self_attacking[attacker_id])
+                   for attacker_id in self.attacker_ids[argument_id])
+
+    def _has_only_out_attackers(self, argument_id: int) -> bool:
+        labels = self.labels
+        return all(labels[attacker_id] == OUT for attacker_id in self.attacker_ids[argument_id])
+
+    def _fix_grounded_labels(self):
+        grounded_labels, _ = get_grounded_labels_by_id(self.attacked_ids,
+                                                       [len(attacker_ids) for attacker_ids in self.attacker_ids])
+        for argument_id, grounded_label in enumerate(grounded_labels):
+            if grounded_label is GroundedLabel.IN:
+                self._set_label(argument_id, IN)
+            elif grounded_label is GroundedLabel.OUT:
+                self._set_label(argument_id, OUT)
+        # These labels are the same in every labelling the search may visit, so backtracking should never undo them.
+        self._trail_arguments.clear()
+        self._trail_labels.clear()
+
+    def _in_trans(self, argument_id: int):
+        labels = self.labels
+        self._set_label(argument_id, IN)
+        for attacked_id in self.attacked_ids[argument_id]:
+            if labels[attacked_id] != OUT:
+                self._set_label(attacked_id, OUT)
+        for attacker_id in self.attacker_ids[argument_id]:
+            if labels[attacker_id] != OUT and labels[attacker_id] != MUST_OUT:
+                self._set_label(attacker_id, MUST_OUT)
+
+    def _set_label(self, argument_id: int, label: int):
+        old_label = self.labels[argument_id]
+        self._trail_arguments.append(argument_id)
+        self._trail_labels.append(old_label)
+        self.labels[argument_id] = label
+        self.label_counts[old_label] -= 1
+        self.label_counts[label] += 1
+
+    def _undo(self, trail_size: int):
+        labels = self.labels
+        label_counts = self.label_counts
+        trail_arguments = self._trail_arguments
+        trail_labels = self._trail_labels
+        while len(trail_arguments) > trail_size:
+            argument_id = trail_arguments.pop()
+            old_label = trail_labels.pop()
+            label_counts[labels[argument_id]] -= 1
+            label_counts[old_label] += 1
+            labels[argument_id] = old_label
+
+
+def is_admissible_labelling(search: LabellingSearch) -> bool:
+    return search.label_counts[MUST_OUT] == 0
+
+
+def is_complete_labelling(search: LabellingSearch) -> bool:
+    """
+    Check that the current labelling is admissible and that each UNDEC argument is legally UNDEC, that is: it has a
+    defeater that is not OUT (no defeater can be IN, otherwise the argument would be OUT).
+    """
+    if search.label_counts[MUST_OUT] != 0:
+        return False
+    labels = search.labels
+    return all(any(labels[attacker_id] != OUT for attacker_id in search.attacker_ids[argument_id])
+               for argument_id in range(search.nr_of_arguments) if labels[argument_id] == UNDEC)
+
+
+def is_stable_labelling(search: LabellingSearch) -> bool:
+    return search.label_counts[MUST_OUT] == 0 and search.label_counts[UNDEC] == 0
+
+
+def iter_maximal_bitmasks(search: LabellingSearch) -> Iterator[int]:
+    """
+    Iterate over the bitmasks of the accepted labellings that are maximal under set inclusion, such as the preferred
+    extensions if the search accepts admissible labellings. The search tries IN before UNDEC, so a bitmask found later
+    is never a superset of one found earlier: the two differ in the first argument on which the search branched, which
+    is IN in the earlier one only. Hence a bitmask that is not a subset of a maximal bitmask found so far is maximal.
+    """
+    maximal_bitmasks = []
+    for bitmask in search.search():
+        if not any(bitmask & maximal_bitmask == bitmask for maximal_bitmask in maximal_bitmasks):
+            maximal_bitmasks.append(bitmask)
+            search.nr_of_candidates = len(maximal_bitmasks)
+            yield bitmask
+        elif search.stats is not None:
+            search.stats.nr_of_maximality_rejections += 1
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
@@ -0,0 +1,147 @@
+from typing import Dict, List, Set
+
+from py_arg.algorithms.semantics.extension_bitmask import is_strict_subset
+from py_arg.algorithms.semantics.labelling_search import LabellingSearch, IN, OUT, BLANK, MUST_OUT, UNDEC
+
+
+# Semi-stable and stage extensions are the sets (admissible and conflict-free, respectively) with a maximal range,
+# where the range of a set is the set itself together with all arguments it defeats. In a labelling without BLANK
+# arguments found by the labelling search, the range of the IN arguments is exactly the set of IN and OUT arguments.
+
+
+class RangeAntichain:
+    """
+    The ranges of the candidates found so far that are not a strict subset of the range of another candidate, each
+    with the bitmasks of IN arguments of its candidates. Ranges are bitmasks, so each dominance check is a single AND.
+
+    The search checks for dominance at every node, so the antichain also keeps the union of its ranges and groups
+    them by size. A range with an argument outside the union, or at least as large as every range in the antichain,
+    is not dominated, which takes constant time; otherwise only the strictly larger ranges are compared with it.
+
+    >>> antichain = RangeAntichain()
+    >>> antichain.add(0b0011, 0b0001), antichain.add(0b0111, 0b0100), antichain.add(0b0001, 0b0001)
+    (True, True, False)
+    >>> antichain.add(0b0111, 0b0010), antichain.is_dominated(0b0110), antichain.is_dominated(0b1001)
+    (True, True, False)
+    >>> antichain.in_bitmasks_by_range
+    {7: [4, 2]}
+    """
+    def __init__(self):
+        self.in_bitmasks_by_range: Dict[int, List[int]] = {}
+        self._union_bitmask = 0
+        self._ranges_by_size: Dict[int, List[int]] = {}
+        self._max_size = 0
+
+    def is_dominated(self, range_bitmask: int) -> bool:
+        """
+        Check if the range is a strict subset of some range in the antichain.
+        """
+        if range_bitmask & ~self._union_bitmask:
+            return False
+        size = _get_size(range_bitmask)
+        if size >= self._max_size:
+            return False
+        return any(range_bitmask & ~other_range_bitmask == 0
+                   for other_size, other_range_bitmasks in self._ranges_by_size.items() if other_size > size
+                   for other_range_bitmask in other_range_bitmasks)
+
+    def add(self, range_bitmask: int, in_bitmask: int) -> bool:
+        """
+        Add a candidate, unless its range is dominated, and remove the candidates whose range it dominates.
+
+        :return: True if the candidate was added.
+        """
+        if range_bitmask in self.in_bitmasks_by_range:
+            self.in_bitmasks_by_range[range_bitmask].append(in_bitmask)
+            return True
+        if self.is_dominated(range_bitmask):
+            return False
+        self.in_bitmasks_by_range = {other_range_bitmask: in_bitmasks
+                                     for other_range_bitmask, in_bitmasks in self.in_bitmasks_by_range.items()
+                                     if not is_strict_subset(other_range_bitmask, range_bitmask)}
+        self.in_bitmasks_by_range[range_bitmask] = [in_bitmask]
+        # Candidates are added far less often than dominance is checked, so the index is simply rebuilt.
+        self._union_bitmask = 0
+        self._ranges_by_size = {}
+        for other_range_bitmask in self.in_bitmasks_by_range:
+            self._union_bitmask |= other_range_bitmask
+            self._ranges_by_size.setdefault(_get_size(other_range_bitmask), []).append(other_range_bitmask)
+        self._max_size = max(self._ranges_by_size)
+        return True
+
+    def get_nr_of_candidates(self) -> int:
+        return sum(len(in_bitmasks) for in_bitmasks in self.in_bitmasks_by_range.values())
+
+    def get_in_bitmasks(self) -> Set[int]:
+        return {in_bitmask for in_bitmasks in self.in_bitmasks_by_range.values() for in_bitmask in in_bitmasks}
+
+
+def _get_size(bitmask: int) -> int:
+    return bin(bitmask).count('1')
+
+
+def get_range_bitmask(search: LabellingSearch) -> int:
+    """
+    Get the bitmask of the arguments that are currently IN or OUT.
+    """
+    bitmask = 0
+    for argument_id, label in enumerate(search.labels):
+        if label == IN or label == OUT:
+            bitmask |= 1 << argument_id
+    return bitmask
+
+
+def get_range_upper_bound(search: LabellingSearch) -> int:
+    """
+    Get a superset of the range of every labelling that the search can reach from the current labelling. An UNDEC or
+    MUST_OUT argument can only become OUT if one of its defeaters is labelled IN later, and only BLANK arguments can be
+    labelled IN later, so the UNDEC and MUST_OUT arguments without BLANK defeaters stay outside the range.
+
+    >>> search = LabellingSearch([[1], [2], [1]], [[], [0, 2], [1]])
+    >>> search._set_label(1, UNDEC)
+    >>> bin(get_range_upper_bound(search))
+    '0b111'
+    >>> search._set_label(0, OUT)
+    >>> search._set_label(2, OUT)
+    >>> bin(get_range_upper_bound(search))
+    '0b101'
+    """
+    labels = search.labels
+    attacker_ids = search.attacker_ids
+    outside_bitmask = 0
+    for argument_id, label in enumerate(labels):
+        if (label == UNDEC or label == MUST_OUT) and \
+                all(labels[attacker_id] != BLANK for attacker_id in attacker_ids[argument_id]):
+            outside_bitmask |= 1 << argument_id
+    return ((1 << search.nr_of_arguments) - 1) & ~outside_bitmask
+
+
+def get_range_maximal_bitmasks(search: LabellingSearch) -> Set[int]:
+    """
+    Get the bitmasks of IN arguments of the labellings accepted by the search whose range is maximal among them. The
+    search only keeps an antichain of ranges, and it skips every branch whose largest possible range is already a
+    strict subset of a range in the antichain. The search should not have a prune hook yet, as it gets this one.
+
+    >>> search = LabellingSearch([[1], [0, 2], []], [[1], [0], [1]], is_accepted=lambda _: True)
+    >>> sorted(bin(bitmask) for bitmask in get_range_maximal_bitmasks(search))
+    ['0b10', '0b101']
+    """
+    antichain = RangeAntichain()
+    search.prune = lambda current_search: antichain.is_dominated(get_range_upper_bound(current_search))
+    nr_of_labellings = 0
+    for in_bitmask in search.search():
+        antichain.add(get_range_bitmask(search), in_bitmask)
+        nr_of_labellings += 1
+        if search.stats is not None:
+            search.nr_of_candidates = antichain.get_nr_of_candidates()
+    range_maximal_bitmasks = antichain.get_in_bitmasks()
+    if search.stats is not None:
+        # The labellings that were not added to the antichain, or were removed from it later.
+        search.stats.nr_of_maximality_rejections += nr_of_labellings - len(range_maximal_bitmasks)
+    return range_maximal_bitmasks
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
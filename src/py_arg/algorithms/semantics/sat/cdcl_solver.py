@@ -0,0 +1,327 @@
+import heapq
+from typing import Dict, Iterable, List, Optional
+
+from py_arg.algorithms.semantics.sat.sat_solver import SATSolver
+
+
+class CDCLSolver(SATSolver):
+    """
+    A small conflict-driven clause learning SAT solver in pure Python, so that the SAT backend also works without any
+    SAT library installed. It implements the core of MiniSat (Eén, Niklas and Niklas Sörensson. "An extensible
+    SAT-solver." SAT 2003): unit propagation with two watched literals, first-UIP clause learning with non-chronological
+    backtracking, the VSIDS decision heuristic with phase saving, Luby restarts and incremental solving under
+    assumptions. Learned clauses are never deleted. It is much slower than a native solver, but fine for frameworks
+    with a few thousand arguments.
+
+    >>> solver = CDCLSolver()
+    >>> for clause in [[1, 2], [-1, 2], [1, -2]]:
+    ...     solver.add_clause(clause)
+    >>> solver.solve(), solver.get_model()
+    (True, [1, 2])
+    >>> solver.solve(assumptions=[-2])
+    False
+    >>> solver.add_clause([-1, -2])
+    >>> solver.solve()
+    False
+    """
+    def __init__(self):
+        self.nr_of_variables = 0
+        self._clauses: List[List[int]] = []
+        self._watches: Dict[int, List[int]] = {}
+        # For each variable: 1 if true, -1 if false, 0 if unassigned (index 0 is unused).
+        self._values: List[int] = [0]
+        self._levels: List[int] = [0]
+        self._reasons: List[Optional[int]] = [None]
+        self._saved_phases: List[int] = [-1]
+        self._activities: List[float] = [0.0]
+        self._activity_increment = 1.0
+        self._heap: List = []
+        self._trail: List[int] = []
+        self._trail_limits: List[int] = []
+        self._propagation_head = 0
+        self._is_unsatisfiable = False
+        self._model: List[int] = []
+        self.nr_of_decisions = 0
+        self.nr_of_propagations = 0
+        self.nr_of_conflicts = 0
+
+    def add_clause(self, clause: Iterable[int]):
+        self._backtrack(0)
+        literals = []
+        for literal in clause:
+            self._add_variables(abs(literal))
+            if -literal in literals:
+                return
+            value = self._get_value(literal)
+            if value == 1:
+                return
+            if value == 0 and literal not in literals:
+                literals.append(literal)
+        if self._is_unsatisfiable:
+            return
+        if not literals:
+            self._is_unsatisfiable = True
+        elif len(literals) == 1:
+            self._assign(literals[0], None)
+            if self._propagate() is not None:
+                self._is_unsatisfiable = True
+        else:
+            self._add_watched_clause(literals)
+
+    def solve(self, assumptions: Iterable[int] = ()) -> bool:
+        assumptions = list(assumptions)
+        for literal in assumptions:
+            self._add_variables(abs(literal))
+        self._backtrack(0)
+        if self._is_unsatisfiable:
+            return False
+
+        nr_of_conflicts = 0
+        restart_index = 1
+        restart_limit = 100 * _luby(restart_index)
+        while True:
+            conflict = self._propagate()
+            if conflict is not None:
+                if not self._trail_limits:
+                    self._is_unsatisfiable = True
+                    return False
+                nr_of_conflicts += 1
+                self.nr_of_conflicts += 1
+                learned_clause, backtrack_level = self._analyze(conflict)
+                self._backtrack(backtrack_level)
+                if len(learned_clause) == 1:
+                    self._assign(learned_clause[0], None)
+                else:
+                    self._assign(learned_clause[0], self._add_watched_clause(learned_clause))
+                self._activity_increment /= 0.95
+                continue
+
+            if nr_of_conflicts >= restart_limit:
+                nr_of_conflicts = 0
+                restart_index += 1
+                restart_limit = 100 * _luby(restart_index)
+                self._backtrack(0)
+                continue
+
+            # The first decisions are the assumptions, one per decision level.
+            decision = 0
+            while len(self._trail_limits) < len(assumptions):
+                assumption = assumptions[len(self._trail_limits)]
+                value = self._get_value(assumption)
+                if value == -1:
+                    self._backtrack(0)
+                    return False
+                self._trail_limits.append(len(self._trail))
+                if value == 0:
+                    decision = assumption
+                    break
+            if decision == 0:
+                variable = self._pick_branching_variable()
+                if variable == 0:
+                    self._model = [variable if self._values[variable] == 1 else -variable
+                                   for variable in range(1, self.nr_of_variables + 1)]
+                    self._backtrack(0)
+                    return True
+                decision = variable * self._saved_phases[variable]
+                self._trail_limits.append(len(self._trail))
+                self.nr_of_decisions += 1
+            self._assign(decision, None)
+
+    def get_model(self) -> List[int]:
+        return self._model
+
+    def get_statistics(self) -> Dict[str, int]:
+        return {'decisions': self.nr_of_decisions, 'propagations': self.nr_of_propagations,
+                'conflicts': self.nr_of_conflicts}
+
+    def _add_variables(self, variable: int):
+        while self.nr_of_variables < variable:
+            self.nr_of_variables += 1
+            self._values.append(0)
+            self._levels.append(0)
+            self._reasons.append(None)
+            self._saved_phases.append(-1)
+            self._activities.append(0.0)
+            self._watches[self.nr_of_variables] = []
+            self._watches[-self.nr_of_variables] = []
+            heapq.heappush(self._heap, (0.0, self.nr_of_variables))
+
+    def _add_watched_clause(self, literals: List[int]) -> int:
+        clause_index = len(self._clauses)
+        self._clauses.append(literals)
+        self._watches[literals[0]].append(clause_index)
+        self._watches[literals[1]].append(clause_index)
+        return clause_index
+
+    def _get_value(self, literal: int) -> int:
+        value = self._values[abs(literal)]
+        return value if literal > 0 else -value
+
+    def _assign(self, literal: int, reason: Optional[int]):
+        variable = abs(literal)
+        self._values[variable] = 1 if literal > 0 else -1
+        self._levels[variable] = len(self._trail_limits)
+        self._reasons[variable] = reason
+        self._trail.append(literal)
+
+    def _propagate(self) -> Optional[int]:
+        """
+        Propagate all assignments on the trail that have not been propagated yet. Each clause watches two of its
+        literals (its first two), which are not false unless the clause is unit or conflicting, so when a literal
+        becomes false, only the clauses watching it need to be visited.
+
+        :return: The index of a conflicting clause, or None if there is no conflict.
+        """
+        values = self._values
+        clauses = self._clauses
+        watches = self._watches
+        trail = self._trail
+        while self._propagation_head < len(trail):
+            false_literal = -trail[self._propagation_head]
+            self._propagation_head += 1
+            watch_list = watches[false_literal]
+            kept_watches = []
+            for position, clause_index in enumerate(watch_list):
+                clause = clauses[clause_index]
+                if clause[0] == false_literal:
+                    clause[0], clause[1] = clause[1], clause[0]
+                other_literal = clause[0]
+                other_value = values[abs(other_literal)]
+                if other_value != 0 and (other_value == 1) == (other_literal > 0):
+                    kept_watches.append(clause_index)
+                    continue
+                for replacement_position in range(2, len(clause)):
+                    literal = clause[replacement_position]
+                    value = values[abs(literal)]
+                    if value == 0 or (value == 1) == (literal > 0):
+                        clause[1], clause[replacement_position] = literal, false_literal
+                        watches[literal].append(clause_index)
+                        break
+                else:
+                    kept_watches.append(clause_index)
+                    if other_value != 0:
+                        kept_watches.extend(watch_list[position + 1:])
+                        watches[false_literal] = kept_watches
+                        self._propagation_head = len(trail)
+                        return clause_index
+                    self._assign(other_literal, clause_index)
+                    self.nr_of_propagations += 1
+            watches[false_literal] = kept_watches
+        return None
+
+    def _analyze(self, conflict: int):
+        """
+        Derive a learned clause from a conflict by resolving with the reasons of the literals assigned at the current
+        decision level, until a single such literal is left (the first unique implication point).
+
+        :return: The learned clause, starting with its literal of the current decision level, and the decision level to
+            backtrack to.
+        """
+        current_level = len(self._trail_limits)
+        seen = set()
+        learned_clause = [0]
+        nr_of_open_literals = 0
+        trail_position = len(self._trail) - 1
+        clause_index = conflict
+        resolved_variable = 0
+        while True:
+            for literal in self._clauses[clause_index]:
+                variable = abs(literal)
+                if variable == resolved_variable or variable in seen or self._levels[variable] == 0:
+                    continue
+                seen.add(variable)
+                self._bump_activity(variable)
+                if self._levels[variable] == current_level:
+                    nr_of_open_literals += 1
+                else:
+                    learned_clause.append(literal)
+            while abs(self._trail[trail_position]) not in seen:
+                trail_position -= 1
+            resolved_literal = self._trail[trail_position]
+            resolved_variable = abs(resolved_literal)
+            trail_position -= 1
+            nr_of_open_literals -= 1
+            if nr_of_open_literals == 0:
+                break
+            seen.discard(resolved_variable)
+            clause_index = self._reasons[resolved_variable]
+        learned_clause[0] = -resolved_literal
+
+        backtrack_level = 0
+        if len(learned_clause) > 1:
+            # Watch the literal with the highest decision level, which becomes false last.
+            highest_position = max(range(1, len(learned_clause)), key=lambda i: self._levels[abs(learned_clause[i])])
+            learned_clause[1], learned_clause[highest_position] = \
+                learned_clause[highest_position], learned_clause[1]
+            backtrack_level = self._levels[abs(learned_clause[1])]
+        return learned_clause, backtrack_level
+
+    def _backtrack(self, level: int):
+        if len(self._trail_limits) <= level:
+            return
+        trail_limit = self._trail_limits[level]
+        for literal in self._trail[trail_limit:]:
+            variable = abs(literal)
+            self._saved_phases[variable] = self._values[variable]
+            self._values[variable] = 0
+            self._reasons[variable] = None
+            heapq.heappush(self._heap, (-self._activities[variable], variable))
+        del self._trail[trail_limit:]
+        del self._trail_limits[level:]
+        self._propagation_head = min(self._propagation_head, trail_limit)
+        if len(self._heap) > 4 * self.nr_of_variables + 1000:
+            self._rebuild_heap()
+
+    def _bump_activity(self, variable: int):
+        self._activities[variable] += self._activity_increment
+        if self._activities[variable] > 1e100:
+            self._activities = [activity * 1e-100 for activity in self._activities]
+            self._activity_increment *= 1e-100
+            self._rebuild_heap()
+        elif self._values[variable] == 0:
+            heapq.heappush(self._heap, (-self._activities[variable], variable))
+
+    def _rebuild_heap(self):
+        self._heap = [(-self._activities[variable], variable) for variable in range(1, self.nr_of_variables + 1)
+                      if self._values[variable] == 0]
+        heapq.heapify(self._heap)
+
+    def _pick_branching_variable(self) -> int:
+        # The heap may contain outdated entries: variables that are assigned or whose activity has increased since.
+        heap = self._heap
+        while heap:
+            negative_activity, variable = heapq.heappop(heap)
+            if self._values[variable] == 0 and -negative_activity == self._activities[variable]:
+                return variable
+        # Entries with outdated activities were skipped, so check whether some variable is still unassigned.
+        for variable in range(1, self.nr_of_variables + 1):
+            if self._values[variable] == 0:
+                return variable
+        return 0
+
+
+def _luby(index: int) -> int:
+    """
+    Get the index-th element (starting at 1) of the Luby sequence 1, 1, 2, 1, 1, 2, 4, 1, 1, 2, ...
+
+    >>> [_luby(i) for i in range(1, 11)]
+    [1, 1, 2, 1, 1, 2, 4, 1, 1, 2]
+    """
+    # As in MiniSat: find the smallest complete binary tree containing the (0-based) index and descend into it.
+    index -= 1
+    size = 1
+    sequence = 0
+    while size < index + 1:
+        sequence += 1
+        size = 2 * size + 1
+    while size - 1 != index:
+        size = (size - 1) // 2
+        sequence -= 1
+        index = index % size
+    return 2 ** sequence
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
@@ -0,0 +1,121 @@
+from itertools import islice
+from typing import FrozenSet, Iterator, Optional, Set, Union
+
+from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
+from py_arg.abstract_argumentation_classes.argument import Argument
+from py_arg.abstract_argumentation_classes.defeat import Defeat
+from py_arg.algorithms.semantics.extension_bitmask import bitmask_to_extension, bitmasks_to_extensions, \
+    collect_bitmasks
+from py_arg.algorithms.semantics.sat.labelling_encoding import LabellingEncoding
+from py_arg.utils.budget import Budget
+from py_arg.utils.search_statistics import SearchStatistics, in_phase
+
+SAT_SEMANTICS = ['Complete', 'Preferred', 'Stable', 'SemiStable']
+
+
+def get_extensions(argumentation_framework: AbstractArgumentationFramework, semantics: str,
+                   backend: Optional[str] = None, as_bitmasks: bool = False, budget: Optional[Budget] = None,
+                   stats: Optional[SearchStatistics] = None) \
+        -> Union[Set[FrozenSet[Argument]], Set[int]]:
+    """
+    Get the extensions of an argumentation framework under some semantics, using a SAT solver.
+
+    :param argumentation_framework: The argumentation framework for which we need the extensions.
+    :param semantics: The semantics: Complete, Preferred, Stable or SemiStable.
+    :param backend: The SAT backend: 'pysat', 'cdcl' or None (PySAT if it is installed, otherwise the bundled solver).
+    :param as_bitmasks: Return each extension as a bitmask over argumentation_framework.arguments instead.
+    :param budget: Budget for the SAT calls (see py_arg.utils.budget). If it is exhausted, BudgetExceeded is raised,
+        with the extensions found so far as partial results.
+    :param stats: Statistics in which the SAT solver counts its work (see py_arg.utils.search_statistics).
+    :return: The extensions of the argumentation framework.
+
+    >>> a, b, c = Argument('a'), Argument('b'), Argument('c')
+    >>> defeats = [Defeat(a, b), Defeat(b, a), Defeat(b, c), Defeat(c, c)]
+    >>> af = AbstractArgumentationFramework('af', [a, b, c], defeats)
+    >>> sorted(sorted(extension) for extension in get_extensions(af, 'Preferred', backend='cdcl'))
+    [[a], [b]]
+    >>> sorted(sorted(extension) for extension in get_extensions(af, 'Stable', backend='cdcl'))
+    [[b]]
+    """
+    bitmasks = collect_bitmasks(iter_extensions(argumentation_framework, semantics, backend=backend, as_bitmasks=True,
+                                                budget=budget, stats=stats),
+                                argumentation_framework, as_bitmasks, budget)
+    if as_bitmasks:
+        return bitmasks
+    with in_phase(stats, 'conversion'):
+        return bitmasks_to_extensions(bitmasks, argumentation_framework)
+
+
+def iter_extensions(argumentation_framework: AbstractArgumentationFramework, semantics: str,
+                    limit: Optional[int] = None, backend: Optional[str] = None, as_bitmasks: bool = False,
+                    budget: Optional[Budget] = None, stats: Optional[SearchStatistics] = None) \
+        -> Iterator[Union[FrozenSet[Argument], int]]:
+    """
+    Iterate over the extensions of an argumentation framework under some semantics, using a SAT solver. Each extension
+    is yielded as soon as it is found.
+
+    Complete and stable extensions are found by repeatedly asking the solver for a labelling and then excluding its set
+    of IN arguments. Preferred and semi-stable extensions are found by iterative maximisation, as in PrefSAT (Cerutti,
+    Federico, Massimiliano Giacomin and Mauro Vallati. "ArgSemSAT: Solving argumentation problems using SAT." COMMA
+    2014): a complete labelling is extended until its IN arguments (for semi-stable: its range) can no longer grow, and
+    then all labellings that it dominates are excluded.
+
+    :param argumentation_framework: The argumentation framework for which we need the extensions.
+    :param semantics: The semantics: Complete, Preferred, Stable or SemiStable.
+    :param limit: Stop after this many extensions (no limit if None).
+    :param backend: The SAT backend: 'pysat', 'cdcl' or None (PySAT if it is installed, otherwise the bundled solver).
+    :param as_bitmasks: Yield bitmasks over argumentation_framework.arguments instead.
+    :param budget: Budget for the SAT calls (see py_arg.utils.budget); BudgetExceeded is raised once it is exhausted.
+    :param stats: Statistics in which the SAT solver counts its work (see py_arg.utils.search_statistics).
+    :return: Iterator over the extensions.
+    """
+    if semantics not in SAT_SEMANTICS:
+        raise ValueError('Unknown semantics ' + semantics + '; choose one of ' + ', '.join(SAT_SEMANTICS) + '.')
+    encoding = LabellingEncoding(argumentation_framework, stable=semantics == 'Stable', backend=backend, budget=budget,
+                                 stats=stats)
+    if semantics == 'Preferred':
+        bitmasks = _iter_preferred_bitmasks(encoding)
+    elif semantics == 'SemiStable':
+        bitmasks = _iter_semistable_bitmasks(encoding)
+    else:
+        bitmasks = _iter_labelling_bitmasks(encoding)
+    for bitmask in islice(bitmasks, limit):
+        yield bitmask if as_bitmasks else bitmask_to_extension(bitmask, argumentation_framework)
+
+
+def _iter_labelling_bitmasks(encoding: LabellingEncoding, assumptions=()) -> Iterator[int]:
+    while encoding.solve(assumptions):
+        in_bitmask = encoding.get_in_bitmask()
+        yield in_bitmask
+        if not encoding.block_in_bitmask(in_bitmask):
+            return
+
+
+def _iter_preferred_bitmasks(encoding: LabellingEncoding) -> Iterator[int]:
+    all_bitmask = (1 << encoding.nr_of_arguments) - 1
+    while encoding.solve():
+        preferred_bitmask = encoding.maximise_in_bitmask(encoding.get_in_bitmask())
+        yield preferred_bitmask
+        # From now on, some argument outside this preferred extension must be IN, which excludes all its subsets.
+        if preferred_bitmask == all_bitmask:
+            return
+        encoding.add_clause(encoding.get_in_literals(all_bitmask & ~preferred_bitmask))
+
+
+def _iter_semistable_bitmasks(encoding: LabellingEncoding) -> Iterator[int]:
+    all_bitmask = (1 << encoding.nr_of_arguments) - 1
+    while encoding.solve():
+        undec_bitmask = encoding.minimise_undec_bitmask(encoding.get_undec_bitmask())
+        # Every complete labelling with exactly these UNDEC arguments is semi-stable.
+        yield from _iter_labelling_bitmasks(encoding, encoding.get_undec_literals(undec_bitmask) +
+                                            encoding.get_undec_literals(all_bitmask & ~undec_bitmask, is_undec=False))
+        # From now on, some argument of this set must not be UNDEC, which excludes all its supersets.
+        if not undec_bitmask:
+            return
+        encoding.add_clause(encoding.get_undec_literals(undec_bitmask, is_undec=False))
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
@@ -0,0 +1,98 @@
+from typing import Optional
+
+from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
+from py_arg.abstract_argumentation_classes.argument import Argument
+from py_arg.abstract_argumentation_classes.defeat import Defeat
+from py_arg.algorithms.semantics.is_accepted import get_relevant_framework
+from py_arg.algorithms.semantics.sat.get_extensions import SAT_SEMANTICS, iter_extensions
+from py_arg.algorithms.semantics.sat.labelling_encoding import LabellingEncoding
+
+
+def is_credulously_accepted(argumentation_framework: AbstractArgumentationFramework, argument: Argument,
+                            semantics: str, backend: Optional[str] = None) -> bool:
+    """
+    Check if an argument is in at least one extension under some semantics, using a SAT solver.
+
+    :param argumentation_framework: The argumentation framework.
+    :param argument: The argument for which we want to know if it is credulously accepted.
+    :param semantics: The semantics: Complete, Preferred, Stable or SemiStable.
+    :param backend: The SAT backend: 'pysat', 'cdcl' or None (PySAT if it is installed, otherwise the bundled solver).
+    :return: Is there an extension containing the argument?
+
+    >>> a, b, c = Argument('a'), Argument('b'), Argument('c')
+    >>> defeats = [Defeat(a, b), Defeat(b, a), Defeat(b, c), Defeat(c, c)]
+    >>> af = AbstractArgumentationFramework('af', [a, b, c], defeats)
+    >>> is_credulously_accepted(af, a, 'Preferred', 'cdcl'), is_credulously_accepted(af, a, 'Stable', 'cdcl')
+    (True, False)
+    """
+    _check_arguments(argumentation_framework, argument, semantics)
+    if semantics == 'SemiStable':
+        return any(argument in extension for extension in iter_extensions(argumentation_framework, semantics,
+                                                                          backend=backend))
+    if semantics == 'Stable':
+        encoding = LabellingEncoding(argumentation_framework, stable=True, backend=backend)
+        argument_id = argumentation_framework.arguments.index(argument)
+    else:
+        # An argument is in some complete extension iff it is in some preferred extension. Only the arguments from
+        # which the argument can be reached matter; in the relevant framework, the argument has id 0.
+        encoding = LabellingEncoding(get_relevant_framework(argumentation_framework, argument), backend=backend)
+        argument_id = 0
+    return encoding.solve([encoding.in_variable(argument_id)])
+
+
+def is_skeptically_accepted(argumentation_framework: AbstractArgumentationFramework, argument: Argument,
+                            semantics: str, backend: Optional[str] = None) -> bool:
+    """
+    Check if an argument is in every extension under some semantics, using a SAT solver. Under stable semantics, every
+    argument is skeptically accepted if there are no stable extensions.
+
+    :param argumentation_framework: The argumentation framework.
+    :param argument: The argument for which we want to know if it is skeptically accepted.
+    :param semantics: The semantics: Complete, Preferred, Stable or SemiStable.
+    :param backend: The SAT backend: 'pysat', 'cdcl' or None (PySAT if it is installed, otherwise the bundled solver).
+    :return: Is the argument in each extension?
+
+    >>> a, b, c, d = Argument('a'), Argument('b'), Argument('c'), Argument('d')
+    >>> defeats = [Defeat(a, b), Defeat(b, a), Defeat(a, c), Defeat(b, c), Defeat(c, d)]
+    >>> af = AbstractArgumentationFramework('af', [a, b, c, d], defeats)
+    >>> is_skeptically_accepted(af, d, 'Preferred', 'cdcl'), is_skeptically_accepted(af, d, 'Complete', 'cdcl')
+    (True, False)
+    """
+    _check_arguments(argumentation_framework, argument, semantics)
+    if semantics == 'SemiStable':
+        return all(argument in extension for extension in iter_extensions(argumentation_framework, semantics,
+                                                                          backend=backend))
+    if semantics == 'Stable':
+        encoding = LabellingEncoding(argumentation_framework, stable=True, backend=backend)
+        return not encoding.solve([-encoding.in_variable(argumentation_framework.arguments.index(argument))])
+
+    encoding = LabellingEncoding(get_relevant_framework(argumentation_framework, argument), backend=backend)
+    not_in_literal = -encoding.in_variable(0)
+    if semantics == 'Complete':
+        return not encoding.solve([not_in_literal])
+
+    # Look for a preferred extension without the argument. Each complete labelling in which the argument is not IN
+    # extends to a preferred labelling; if the argument is IN there, that preferred extension and its subsets are
+    # excluded and the search continues.
+    all_bitmask = (1 << encoding.nr_of_arguments) - 1
+    while encoding.solve([not_in_literal]):
+        preferred_bitmask = encoding.maximise_in_bitmask(encoding.get_in_bitmask())
+        if not preferred_bitmask & 1:
+            return False
+        if preferred_bitmask == all_bitmask:
+            return True
+        encoding.add_clause(encoding.get_in_literals(all_bitmask & ~preferred_bitmask))
+    return True
+
+
+def _check_arguments(argumentation_framework: AbstractArgumentationFramework, argument: Argument, semantics: str):
+    if semantics not in SAT_SEMANTICS:
+        raise ValueError('Unknown semantics ' + semantics + '; choose one of ' + ', '.join(SAT_SEMANTICS) + '.')
+    if not argumentation_framework.is_in_arguments(argument.name):
+        raise ValueError('There is no argument named ' + argument.name + '.')
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
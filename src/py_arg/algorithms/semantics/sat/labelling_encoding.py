@@ -0,0 +1,211 @@
+from typing import Iterable, List, Optional
+
+from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
+from py_arg.abstract_argumentation_classes.argument import Argument
+from py_arg.abstract_argumentation_classes.compact_argumentation_framework import CompactArgumentationFramework
+from py_arg.abstract_argumentation_classes.defeat import Defeat
+from py_arg.algorithms.semantics.sat.sat_solver import create_sat_solver
+from py_arg.utils.budget import Budget
+from py_arg.utils.search_statistics import SearchStatistics, in_phase
+
+
+# The labelling-based encoding from Cerutti, Federico, Paul E. Dunne, Massimiliano Giacomin and Mauro Vallati.
+# "Computing preferred extensions in abstract argumentation: a SAT-based approach." TAFA 2013. Each argument has three
+# variables (IN, OUT and UNDEC), of which exactly one is true, and the clauses make the labelling complete:
+# an argument is IN iff all its defeaters are OUT, and OUT iff some defeater is IN.
+
+
+class LabellingEncoding:
+    """
+    SAT encoding of the complete (or, if stable is True, the stable) labellings of an argumentation framework, on top of
+    an incremental SAT solver. Argument ids follow argumentation_framework.arguments.
+
+    >>> a, b = Argument('a'), Argument('b')
+    >>> af = AbstractArgumentationFramework('af', [a, b], [Defeat(a, b), Defeat(b, a)])
+    >>> encoding = LabellingEncoding(af, backend='cdcl')
+    >>> encoding.solve([encoding.in_variable(1)]), encoding.get_in_bitmask()
+    (True, 2)
+    """
+    def __init__(self, argumentation_framework: AbstractArgumentationFramework, stable: bool = False,
+                 backend: Optional[str] = None, budget: Optional[Budget] = None,
+                 stats: Optional[SearchStatistics] = None):
+        """
+        :param argumentation_framework: The argumentation framework to encode.
+        :param stable: Only encode stable labellings (without UNDEC arguments).
+        :param backend: The SAT backend, see create_sat_solver.
+        :param budget: Budget charged one node per call to the SAT solver (see py_arg.utils.budget). A call cannot be
+            interrupted, so the limits are checked before each call.
+        :param stats: Statistics to which each call to the SAT solver adds its decisions (as nodes), propagations and
+            conflicts (as backtracks), see py_arg.utils.search_statistics.
+        """
+        compact_framework = CompactArgumentationFramework.from_abstract_argumentation_framework(argumentation_framework)
+        self.nr_of_arguments = compact_framework.nr_of_arguments
+        self.solver = create_sat_solver(backend)
+        self.budget = budget
+        self.stats = stats
+        self._solver_statistics = {}
+        self._next_variable = 3 * self.nr_of_arguments + 1
+        self._true_variables = set()
+
+        with in_phase(stats, 'encoding'):
+            for argument_id, attacker_ids in enumerate(compact_framework.get_attacker_lists()):
+                self._add_argument_clauses(argument_id, attacker_ids, stable)
+
+    def _add_argument_clauses(self, argument_id: int, attacker_ids: List[int], stable: bool):
+        in_variable = self.in_variable(argument_id)
+        out_variable = self.out_variable(argument_id)
+        undec_variable = self.undec_variable(argument_id)
+        self.solver.add_clause([in_variable, out_variable, undec_variable])
+        self.solver.add_clause([-in_variable, -out_variable])
+        self.solver.add_clause([-in_variable, -undec_variable])
+        self.solver.add_clause([-out_variable, -undec_variable])
+        if stable:
+            self.solver.add_clause([-undec_variable])
+
+        # IN iff all defeaters are OUT.
+        for attacker_id in attacker_ids:
+            self.solver.add_clause([-in_variable, self.out_variable(attacker_id)])
+        self.solver.add_clause([in_variable] + [-self.out_variable(attacker_id) for attacker_id in attacker_ids])
+        # OUT iff some defeater is IN.
+        self.solver.add_clause([-out_variable] + [self.in_variable(attacker_id) for attacker_id in attacker_ids])
+        for attacker_id in attacker_ids:
+            self.solver.add_clause([out_variable, -self.in_variable(attacker_id)])
+
+    @staticmethod
+    def in_variable(argument_id: int) -> int:
+        return 3 * argument_id + 1
+
+    @staticmethod
+    def out_variable(argument_id: int) -> int:
+        return 3 * argument_id + 2
+
+    @staticmethod
+    def undec_variable(argument_id: int) -> int:
+        return 3 * argument_id + 3
+
+    def new_variable(self) -> int:
+        """
+        Get a fresh variable, for example to activate clauses only under an assumption.
+        """
+        variable = self._next_variable
+        self._next_variable += 1
+        return variable
+
+    def add_clause(self, clause: Iterable[int]):
+        self.solver.add_clause(clause)
+
+    def solve(self, assumptions: Iterable[int] = ()) -> bool:
+        """
+        Look for a labelling satisfying the clauses and assumptions; if there is one, it can be retrieved with
+        get_in_bitmask and get_undec_bitmask.
+        """
+        if self.budget is not None:
+            self.budget.add_node()
+            self.budget.check()
+        with in_phase(self.stats, 'search'):
+            is_satisfiable = self.solver.solve(assumptions)
+        if self.stats is not None:
+            self._add_solver_statistics()
+        if is_satisfiable:
+            model = self.solver.get_model()
+            self._true_variables = {literal for literal in model if literal > 0}
+        return is_satisfiable
+
+    def _add_solver_statistics(self):
+        solver_statistics = self.solver.get_statistics()
+        difference = {key: value - self._solver_statistics.get(key, 0) for key, value in solver_statistics.items()}
+        self._solver_statistics = solver_statistics
+        self.stats.nr_of_nodes += difference.get('decisions', 0)
+        self.stats.nr_of_propagations += difference.get('propagations', 0)
+        self.stats.nr_of_backtracks += difference.get('conflicts', 0)
+        self.stats.report_progress()
+
+    def get_in_bitmask(self) -> int:
+        return self._get_bitmask(self.in_variable)
+
+    def get_undec_bitmask(self) -> int:
+        return self._get_bitmask(self.undec_variable)
+
+    def _get_bitmask(self, variable_function) -> int:
+        bitmask = 0
+        for argument_id in range(self.nr_of_arguments):
+            if variable_function(argument_id) in self._true_variables:
+                bitmask |= 1 << argument_id
+        return bitmask
+
+    def get_in_literals(self, bitmask: int, is_in: bool = True) -> List[int]:
+        """
+        Get the literals stating that the arguments in the bitmask are IN (or, if is_in is False, not IN).
+        """
+        sign = 1 if is_in else -1
+        return [sign * self.in_variable(argument_id) for argument_id in range(self.nr_of_arguments)
+                if bitmask >> argument_id & 1]
+
+    def get_undec_literals(self, bitmask: int, is_undec: bool = True) -> List[int]:
+        """
+        Get the literals stating that the arguments in the bitmask are UNDEC (or, if is_undec is False, not UNDEC).
+        """
+        sign = 1 if is_undec else -1
+        return [sign * self.undec_variable(argument_id) for argument_id in range(self.nr_of_arguments)
+                if bitmask >> argument_id & 1]
+
+    def block_in_bitmask(self, in_bitmask: int) -> bool:
+        """
+        Exclude the labellings with exactly this set of IN arguments from now on.
+
+        :return: False if this excludes all labellings (which only happens if there are no arguments).
+        """
+        all_bitmask = (1 << self.nr_of_arguments) - 1
+        clause = self.get_in_literals(in_bitmask, is_in=False) + self.get_in_literals(all_bitmask & ~in_bitmask)
+        if not clause:
+            return False
+        self.add_clause(clause)
+        return True
+
+    def maximise_in_bitmask(self, in_bitmask: int) -> int:
+        """
+        Starting from the IN arguments of a labelling that satisfies the clauses, repeatedly look for a labelling with
+        strictly more IN arguments, until there is none. The larger sets are only required under an assumption, so the
+        clauses of the encoding are unchanged afterwards.
+
+        :return: The IN arguments of a labelling with a maximal set of IN arguments that contains in_bitmask.
+        """
+        all_bitmask = (1 << self.nr_of_arguments) - 1
+        while in_bitmask != all_bitmask:
+            activation_variable = self.new_variable()
+            self.add_clause([-activation_variable] + self.get_in_literals(all_bitmask & ~in_bitmask))
+            is_satisfiable = self.solve([activation_variable] + self.get_in_literals(in_bitmask))
+            self.add_clause([-activation_variable])
+            if not is_satisfiable:
+                break
+            in_bitmask = self.get_in_bitmask()
+            if self.stats is not None:
+                self.stats.nr_of_maximality_rejections += 1
+        return in_bitmask
+
+    def minimise_undec_bitmask(self, undec_bitmask: int) -> int:
+        """
+        Starting from the UNDEC arguments of a labelling that satisfies the clauses, repeatedly look for a labelling
+        with a strict subset of UNDEC arguments, until there is none.
+
+        :return: A minimal set of UNDEC arguments (of a labelling satisfying the clauses) contained in undec_bitmask.
+        """
+        all_bitmask = (1 << self.nr_of_arguments) - 1
+        while undec_bitmask:
+            activation_variable = self.new_variable()
+            self.add_clause([-activation_variable] + self.get_undec_literals(undec_bitmask, is_undec=False))
+            is_satisfiable = self.solve([activation_variable] +
+                                        self.get_undec_literals(all_bitmask & ~undec_bitmask, is_undec=False))
+            self.add_clause([-activation_variable])
+            if not is_satisfiable:
+                break
+            undec_bitmask = self.get_undec_bitmask()
+            if self.stats is not None:
+                self.stats.nr_of_maximality_rejections += 1
+        return undec_bitmask
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
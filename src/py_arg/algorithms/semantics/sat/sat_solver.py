@@ -0,0 +1,90 @@
+from typing import Dict, Iterable, List, Optional
+
+try:
+    from pysat.solvers import Solver as PySATLibrarySolver
+except ImportError:
+    PySATLibrarySolver = None
+
+
+class SATSolver:
+    """
+    Interface of the incremental SAT solvers used by the SAT backend. Variables are positive integers and literals are
+    non-zero integers, where -v is the negation of variable v (as in the DIMACS format). Clauses can be added between
+    calls to solve, and each call to solve can have assumptions: literals that are only true for that call.
+    """
+    def add_clause(self, clause: Iterable[int]):
+        raise NotImplementedError
+
+    def solve(self, assumptions: Iterable[int] = ()) -> bool:
+        raise NotImplementedError
+
+    def get_model(self) -> List[int]:
+        """
+        Get the assignment found by the last successful call to solve, as a list with for each variable v either v
+        (true) or -v (false).
+        """
+        raise NotImplementedError
+
+    def get_statistics(self) -> Dict[str, int]:
+        """
+        Get the numbers of decisions, propagations and conflicts over all calls to solve so far, as far as the solver
+        reports them.
+        """
+        return {}
+
+
+class PySATSolver(SATSolver):
+    """
+    SAT solver from the PySAT library (https://pysathq.github.io), if it is installed.
+    """
+    def __init__(self, solver_name: str = 'cadical153'):
+        if PySATLibrarySolver is None:
+            raise ImportError('The PySAT library is not installed; install python-sat or use the cdcl backend.')
+        self._solver = PySATLibrarySolver(name=solver_name)
+        self._model: List[int] = []
+
+    def add_clause(self, clause: Iterable[int]):
+        self._solver.add_clause(list(clause))
+
+    def solve(self, assumptions: Iterable[int] = ()) -> bool:
+        is_satisfiable = self._solver.solve(assumptions=list(assumptions))
+        if is_satisfiable:
+            self._model = self._solver.get_model()
+        return is_satisfiable
+
+    def get_model(self) -> List[int]:
+        return self._model
+
+    def get_statistics(self) -> Dict[str, int]:
+        # Not every solver of the library keeps statistics.
+        return self._solver.accum_stats() or {}
+
+
+def create_sat_solver(backend: Optional[str] = None) -> SATSolver:
+    """
+    Create an empty SAT solver.
+
+    :param backend: Either 'pysat' (the PySAT library), 'cdcl' (the pure-Python solver bundled with py_arg) or None,
+        in which case PySAT is used if it is installed and the bundled solver otherwise.
+    :return: The SAT solver.
+
+    >>> solver = create_sat_solver('cdcl')
+    >>> solver.add_clause([1, 2])
+    >>> solver.add_clause([-1])
+    >>> solver.solve(), solver.get_model()
+    (True, [-1, 2])
+    """
+    if backend is None:
+        backend = 'pysat' if PySATLibrarySolver is not None else 'cdcl'
+    if backend == 'pysat':
+        return PySATSolver()
+    if backend == 'cdcl':
+        from py_arg.algorithms.semantics.sat.cdcl_solver import CDCLSolver
+        return CDCLSolver()
+    raise ValueError('Unknown SAT backend ' + backend + '; choose pysat or cdcl.')
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
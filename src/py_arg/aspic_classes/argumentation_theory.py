@@ -1,5 +1,5 @@
 import itertools
-from typing import List, Dict, Optional, Set, Tuple
+from typing import List, Dict, Iterator, Optional, Set, Tuple
 
 from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
 from py_arg.abstract_argumentation_classes.defeat import Defeat
@@ -11,18 +11,26 @@ from py_arg.aspic_classes.instantiated_argument import InstantiatedArgument
 from py_arg.aspic_classes.argumentation_system import ArgumentationSystem
 from py_arg.aspic_classes.orderings.preference_preorder import PreferencePreorder
 from py_arg.aspic_classes.structured_argumentation_framework import StructuredArgumentationFramework
+from py_arg.utils.budget import Budget, BudgetExceeded
 
 
 class ArgumentationTheory:
     """
     An ArgumentationTheory consists of an ArgumentationSystem and a knowledge base.
     Arguments can be inferred on the basis of an ArgumentationTheory.
+
+    The construction of the arguments can be limited by a budget (see py_arg.utils.budget), which is charged one node
+    per combination of sub-arguments that is tried. If it is exhausted, BudgetExceeded is raised, with the arguments
+    per conclusion constructed so far as partial results. The budget only applies to the call it is given to, so a
+    theory does not keep it: the methods that add to the knowledge base and create_abstract_argumentation_framework
+    (charged one node per pair of arguments, without partial results) take a budget of their own.
     """
 
     def __init__(self, argumentation_system: ArgumentationSystem,
                  knowledge_base_axioms: List[Literal],
                  knowledge_base_ordinary_premises: List[Literal],
-                 ordinary_premise_preferences: Optional[PreferencePreorder] = None):
+                 ordinary_premise_preferences: Optional[PreferencePreorder] = None,
+                 budget: Optional[Budget] = None):
         self._argumentation_system = argumentation_system
         self._knowledge_base_axioms = knowledge_base_axioms
         self._knowledge_base_ordinary_premises = knowledge_base_ordinary_premises
@@ -34,7 +42,7 @@ class ArgumentationTheory:
             self.ordinary_premise_preferences = \
                 PreferencePreorder.create_reflexive_preorder(self._knowledge_base_ordinary_premises)
 
-        self._recompute_arguments()
+        self._recompute_arguments(budget)
 
     @property
     def argumentation_system(self):
@@ -58,9 +66,9 @@ class ArgumentationTheory:
         self._knowledge_base_axioms = knowledge_base_axioms_input
         self._recompute_arguments()
 
-    def add_to_knowledge_base_axioms(self, new_knowledge_base_axiom: Literal):
+    def add_to_knowledge_base_axioms(self, new_knowledge_base_axiom: Literal, budget: Optional[Budget] = None):
         self._knowledge_base_axioms.append(new_knowledge_base_axiom)
-        self._recompute_arguments()
+        self._recompute_arguments(budget)
 
     @property
     def knowledge_base_ordinary_premises(self):
@@ -71,9 +79,10 @@ class ArgumentationTheory:
         self._knowledge_base_ordinary_premises = knowledge_base_ordinary_premises_input
         self._recompute_arguments()
 
-    def add_to_knowledge_base_ordinary_premises(self, new_knowledge_base_ordinary_premise: Literal):
+    def add_to_knowledge_base_ordinary_premises(self, new_knowledge_base_ordinary_premise: Literal,
+                                                budget: Optional[Budget] = None):
         self._knowledge_base_ordinary_premises.append(new_knowledge_base_ordinary_premise)
-        self._recompute_arguments()
+        self._recompute_arguments(budget)
 
     @property
     def arguments(self) -> Dict[Literal, Set[InstantiatedArgument]]:
@@ -84,12 +93,14 @@ class ArgumentationTheory:
         """
         return self._arguments
 
-    def _recompute_arguments(self):
+    def _recompute_arguments(self, budget: Optional[Budget] = None):
         """
         Recompute the set of arguments inferred from this argumentation theory.
 
         This step is necessary after every change in the argumentation system or knowledge base (note that this is done
         automatically by the corresponding setters).
+
+        :param budget: Budget for the construction (see the class docstring).
         """
         arguments_per_conclusion = {literal: set() for literal in self._argumentation_system.language.values()}
 
@@ -98,6 +109,16 @@ class ArgumentationTheory:
         for knowledge_item in self._knowledge_base_ordinary_premises:
             arguments_per_conclusion[knowledge_item].add(InstantiatedArgument.ordinary_premise_based(knowledge_item))
 
+        try:
+            self._add_rule_based_arguments(arguments_per_conclusion, budget)
+        except BudgetExceeded as error:
+            error.partial_results = arguments_per_conclusion
+            raise
+
+        self._arguments = arguments_per_conclusion
+
+    def _add_rule_based_arguments(self, arguments_per_conclusion: Dict[Literal, Set[InstantiatedArgument]],
+                                  budget: Optional[Budget]):
         change = True
         while change:
             change = False
@@ -108,6 +129,8 @@ class ArgumentationTheory:
                                         for antecedent in defeasible_rule.antecedents]
                 if all(possible_antecedents):
                     for direct_sub_argument_tuple in itertools.product(*possible_antecedents):
+                        if budget is not None:
+                            budget.add_node()
                         new_instantiated_argument = \
                             InstantiatedArgument.defeasible_rule_based(defeasible_rule, set(direct_sub_argument_tuple))
                         if new_instantiated_argument not in arguments_per_conclusion[defeasible_rule.consequent]:
@@ -120,14 +143,14 @@ class ArgumentationTheory:
                                         for antecedent in strict_rule.antecedents]
                 if all(possible_antecedents):
                     for direct_sub_argument_tuple in itertools.product(*possible_antecedents):
+                        if budget is not None:
+                            budget.add_node()
                         new_instantiated_argument = \
                             InstantiatedArgument.strict_rule_based(strict_rule, set(direct_sub_argument_tuple))
                         if new_instantiated_argument not in arguments_per_conclusion[strict_rule.consequent]:
                             arguments_per_conclusion[strict_rule.consequent].add(new_instantiated_argument)
                             change = True
 
-        self._arguments = arguments_per_conclusion
-
     @property
     def all_arguments(self) -> List[InstantiatedArgument]:
         """
@@ -312,38 +335,50 @@ class ArgumentationTheory:
             return True
         return False
 
-    def recompute_all_defeats(self, ordering: Ordering) -> List[Defeat]:
+    def recompute_all_defeats(self, ordering: Ordering, budget: Optional[Budget] = None) -> List[Defeat]:
         """
         Recompute all defeats between all arguments, given the specified ordering.
 
         :param ordering: The ordering used to decide if the attacking argument is weaker than the attacking argument.
+        :param budget: Budget charged one node per pair of arguments (see py_arg.utils.budget); BudgetExceeded is
+            raised once it is exhausted.
         :return: List of all defeats.
         """
         if ordering is None:
             return [Defeat(argument_a, argument_b)
-                    for argument_a in self.all_arguments
-                    for argument_b in self.all_arguments
+                    for argument_a, argument_b in self._iter_argument_pairs(budget)
                     if self.attacks(argument_a, argument_b)]
 
         return [Defeat(argument_a, argument_b)
-                for argument_a in self.all_arguments
-                for argument_b in self.all_arguments
+                for argument_a, argument_b in self._iter_argument_pairs(budget)
                 if self.defeats(argument_a, argument_b, ordering)]
 
-    def create_abstract_argumentation_framework(self, name: str, ordering: Optional[Ordering] = None):
+    def _iter_argument_pairs(self, budget: Optional[Budget]) \
+            -> Iterator[Tuple[InstantiatedArgument, InstantiatedArgument]]:
+        # All pairs of arguments, each charged to the budget.
+        all_arguments = self.all_arguments
+        for argument_a in all_arguments:
+            for argument_b in all_arguments:
+                if budget is not None:
+                    budget.add_node()
+                yield argument_a, argument_b
+
+    def create_abstract_argumentation_framework(self, name: str, ordering: Optional[Ordering] = None,
+                                                budget: Optional[Budget] = None):
         """
         Create an abstract argumentation framework based on this argumentation theory. Note: if no ordering is given,
         last link elitist ordering is chosen as default ordering.
 
         :param name: The name of the argumentation framework.
         :param ordering: Ordering that influences which attacks are defeats. Note: default is last link elitist.
+        :param budget: Budget for computing the defeats, see recompute_all_defeats.
         :return: Abstract argumentation framework based on this argumentation theory.
 
         """
         if ordering is None:
             ordering = LastLinkElitistOrdering(self.argumentation_system.rule_preferences,
                                                self.ordinary_premise_preferences)
-        return AbstractArgumentationFramework(name, self.all_arguments, self.recompute_all_defeats(ordering))
+        return AbstractArgumentationFramework(name, self.all_arguments, self.recompute_all_defeats(ordering, budget))
 
     def create_structured_argumentation_framework(self, name: str, ordering: Optional[Ordering] = None):
         """
@@ -0,0 +1,66 @@
+import re
+from array import array
+from typing import Dict, Iterable, Optional
+
+from py_arg.abstract_argumentation_classes.compact_argumentation_framework import CompactArgumentationFramework
+
+
+_ARGUMENT_PATTERN = re.compile(r'arg\(\s*([^,()\s]+)\s*\)\.')
+_ATTACK_PATTERN = re.compile(r'att\(\s*([^,()\s]+)\s*,\s*([^,()\s]+)\s*\)\.')
+
+
+class CompactArgumentationFrameworkFromASPARTIXFormatReader:
+    """
+    Read ASPARTIX (apx) files straight into a CompactArgumentationFramework, without creating Argument or Defeat
+    objects.
+    """
+    @staticmethod
+    def from_apx(apx_str: str, argumentation_framework_name: Optional[str] = None) -> CompactArgumentationFramework:
+        return CompactArgumentationFrameworkFromASPARTIXFormatReader.from_apx_lines(
+            apx_str.splitlines(), argumentation_framework_name)
+
+    @staticmethod
+    def from_apx_file(file_path: str, argumentation_framework_name: Optional[str] = None) \
+            -> CompactArgumentationFramework:
+        with open(file_path, 'r') as file:
+            return CompactArgumentationFrameworkFromASPARTIXFormatReader.from_apx_lines(
+                file, argumentation_framework_name)
+
+    @staticmethod
+    def from_apx_lines(lines: Iterable[str], argumentation_framework_name: Optional[str] = None) \
+            -> CompactArgumentationFramework:
+        """
+        >>> caf = CompactArgumentationFrameworkFromASPARTIXFormatReader.from_apx('arg(a).arg(b).\\natt(a, b).')
+        >>> caf.argument_names
+        ['a', 'b']
+        >>> list(caf.get_attacker_ids(1))
+        [0]
+        """
+        if argumentation_framework_name:
+            name = argumentation_framework_name
+        else:
+            name = ''
+
+        argument_ids: Dict[str, int] = {}
+        attack_sources = array('i')
+        attack_targets = array('i')
+        attack_names = []
+        for line in lines:
+            for argument_name in _ARGUMENT_PATTERN.findall(line):
+                if argument_name not in argument_ids:
+                    argument_ids[argument_name] = len(argument_ids)
+            for from_name, to_name in _ATTACK_PATTERN.findall(line):
+                if from_name in argument_ids and to_name in argument_ids:
+                    attack_sources.append(argument_ids[from_name])
+                    attack_targets.append(argument_ids[to_name])
+                else:
+                    # Attacks may be listed before their arguments; resolve them once all arguments are known.
+                    attack_names.append((from_name, to_name))
+
+        for from_name, to_name in attack_names:
+            if from_name not in argument_ids or to_name not in argument_ids:
+                raise ValueError('Attack (' + from_name + ', ' + to_name + ') involves an undeclared argument.')
+            attack_sources.append(argument_ids[from_name])
+            attack_targets.append(argument_ids[to_name])
+
+        return CompactArgumentationFramework(name, list(argument_ids.keys()), attack_sources, attack_targets)
@@ -0,0 +1,61 @@
+from array import array
+from typing import Iterable, Optional
+
+from py_arg.abstract_argumentation_classes.compact_argumentation_framework import CompactArgumentationFramework
+
+
+class CompactArgumentationFrameworkFromICCMA23FormatReader:
+    """
+    Read ICCMA 2023 files straight into a CompactArgumentationFramework, without creating Argument or Defeat objects.
+    Arguments are named as in ArgumentationFrameworkFromICCMA23FormatReader ('A1', 'A2', ...), so converting the
+    result to an abstract argumentation framework gives the same framework as that reader.
+    """
+    @staticmethod
+    def from_iccma23(iccma_23_str: str, argumentation_framework_name: Optional[str] = None) \
+            -> CompactArgumentationFramework:
+        return CompactArgumentationFrameworkFromICCMA23FormatReader.from_iccma23_lines(
+            iccma_23_str.split('\n'), argumentation_framework_name)
+
+    @staticmethod
+    def from_iccma23_file(file_path: str, argumentation_framework_name: Optional[str] = None) \
+            -> CompactArgumentationFramework:
+        with open(file_path, 'r') as file:
+            return CompactArgumentationFrameworkFromICCMA23FormatReader.from_iccma23_lines(
+                file, argumentation_framework_name)
+
+    @staticmethod
+    def from_iccma23_lines(lines: Iterable[str], argumentation_framework_name: Optional[str] = None) \
+            -> CompactArgumentationFramework:
+        """
+        >>> caf = CompactArgumentationFrameworkFromICCMA23FormatReader.from_iccma23('p af 3\\n# comment\\n1 2\\n2 3\\n')
+        >>> caf.argument_names
+        ['A1', 'A2', 'A3']
+        >>> list(caf.get_attacked_ids(1))
+        [2]
+        """
+        if argumentation_framework_name:
+            name = argumentation_framework_name
+        else:
+            name = ''
+
+        nr_of_arguments = None
+        attack_sources = array('i')
+        attack_targets = array('i')
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            if nr_of_arguments is None:
+                header_parts = line.split()
+                if len(header_parts) != 3 or header_parts[0] != 'p' or header_parts[1] != 'af':
+                    raise ValueError('The first line should be of the form "p af <nr_of_arguments>".')
+                nr_of_arguments = int(header_parts[2])
+                continue
+            from_argument, to_argument = line.split()
+            attack_sources.append(int(from_argument) - 1)
+            attack_targets.append(int(to_argument) - 1)
+
+        if nr_of_arguments is None:
+            raise ValueError('The first line should be of the form "p af <nr_of_arguments>".')
+        argument_names = ['A' + str(index) for index in range(1, nr_of_arguments + 1)]
+        return CompactArgumentationFramework(name, argument_names, attack_sources, attack_targets)
@@ -0,0 +1,129 @@
+import time
+from typing import Any, Iterable, Iterator, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+class BudgetExceeded(Exception):
+    """
+    Raised by a solver when its budget is exhausted or it is cancelled. The partial results are what the solver found
+    before it stopped, in the form in which it would otherwise have returned them (or None if it has nothing to
+    report, for instance because no result is final before the search completes).
+    """
+    def __init__(self, reason: str, partial_results: Any = None):
+        super().__init__(reason)
+        self.reason = reason
+        self.partial_results = partial_results
+
+
+class CancellationToken:
+    """
+    A flag to stop a running solver from another thread: once cancel is called, the next budget check of each solver
+    that got this token raises BudgetExceeded.
+    """
+    def __init__(self):
+        self.is_cancelled = False
+
+    def cancel(self):
+        self.is_cancelled = True
+
+
+class Budget:
+    """
+    Limits on the work a solver may do: a time limit, a maximal number of search nodes (or other steps, such as
+    constructed arguments) and a maximal number of extensions (or other results), each unlimited if None, and an
+    optional cancellation token. Solvers charge their work to the budget, which raises BudgetExceeded as soon as one
+    of the limits is exceeded. The time limit counts from the creation of the budget, and the counts accumulate over
+    all solvers that use the same budget.
+
+    >>> budget = Budget(max_nodes=2)
+    >>> try:
+    ...     for _ in range(3):
+    ...         budget.add_node()
+    ... except BudgetExceeded as error:
+    ...     error.reason
+    'The search exceeded its budget of 2 nodes.'
+    >>> token = CancellationToken()
+    >>> budget = Budget(cancellation_token=token)
+    >>> token.cancel()
+    >>> try:
+    ...     budget.check()
+    ... except BudgetExceeded as error:
+    ...     error.reason
+    'The search was cancelled.'
+    """
+    # Looking at the clock is much slower than counting, so the time limit and cancellation are only checked once
+    # every this many nodes.
+    NODES_PER_CHECK = 256
+
+    def __init__(self, time_limit: Optional[float] = None, max_nodes: Optional[int] = None,
+                 max_extensions: Optional[int] = None, cancellation_token: Optional[CancellationToken] = None):
+        self.deadline = time.monotonic() + time_limit if time_limit is not None else None
+        self.time_limit = time_limit
+        self.max_nodes = max_nodes
+        self.max_extensions = max_extensions
+        self.cancellation_token = cancellation_token
+        self.nr_of_nodes = 0
+        self.nr_of_extensions = 0
+
+    def check(self):
+        """
+        Raise BudgetExceeded if the solver was cancelled or ran out of time.
+        """
+        if self.cancellation_token is not None and self.cancellation_token.is_cancelled:
+            raise BudgetExceeded('The search was cancelled.')
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise BudgetExceeded('The search exceeded its time limit of ' + str(self.time_limit) + ' seconds.')
+
+    def add_node(self):
+        """
+        Charge one search node, and raise BudgetExceeded if that is more than allowed (or if the solver was cancelled
+        or ran out of time).
+        """
+        self.nr_of_nodes += 1
+        if self.max_nodes is not None and self.nr_of_nodes > self.max_nodes:
+            raise BudgetExceeded('The search exceeded its budget of ' + str(self.max_nodes) + ' nodes.')
+        if self.nr_of_nodes % self.NODES_PER_CHECK == 0:
+            self.check()
+
+    def add_extension(self):
+        """
+        Charge one extension (before it is reported), and raise BudgetExceeded if that is more than allowed (or if
+        the solver was cancelled or ran out of time).
+        """
+        self.nr_of_extensions += 1
+        if self.max_extensions is not None and self.nr_of_extensions > self.max_extensions:
+            raise BudgetExceeded('The search found more than ' + str(self.max_extensions) + ' extensions.')
+        self.check()
+
+
+def iterate_within_budget(items: Iterable[T], budget: Optional[Budget]) -> Iterator[T]:
+    """
+    Yield the items (such as extensions), charging each one to the budget before it is yielded. If the budget is
+    exhausted, the BudgetExceeded carries the list of the items yielded so far as partial results.
+
+    >>> budget = Budget(max_extensions=2)
+    >>> try:
+    ...     list(iterate_within_budget('abc', budget))
+    ... except BudgetExceeded as error:
+    ...     error.partial_results
+    ['a', 'b']
+    """
+    if budget is None:
+        yield from items
+        return
+    yielded_items = []
+    try:
+        for item in items:
+            budget.add_extension()
+            yielded_items.append(item)
+            yield item
+    except BudgetExceeded as error:
+        error.partial_results = yielded_items
+        raise
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
@@ -0,0 +1,101 @@
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Callable, Dict, Optional
+
+
+class SearchStatistics:
+    """
+    Statistics collected by a solver, for instance to find out why it is slow on some framework:
+
+    * nr_of_nodes: the nodes of the search tree (for the SAT backend: the decisions of the SAT solver);
+    * nr_of_propagations: the labels (for the SAT backend: the literals) inferred by propagation;
+    * nr_of_backtracks: the arguments whose labels have all been tried (for the SAT backend: the conflicts);
+    * nr_of_maximality_rejections: the candidates that turned out not to be maximal (under set inclusion, or for
+      range-maximal semantics by range);
+    * peak_live_labellings: the largest number of labellings held at once, namely the (partial) labellings on the
+      current branch of the search and the candidates kept for a maximality check;
+    * phase_times: the wall time in seconds per phase, such as grounded (fixing the grounded labels), search and
+      conversion (from bitmasks to sets of arguments).
+
+    The counts accumulate over all solvers that use the same statistics. If on_progress is given, it is called with
+    the statistics while the search runs, at most once every progress_interval seconds. The clock is only looked at
+    once every NODES_PER_CHECK nodes, so reporting progress costs next to nothing.
+
+    >>> stats = SearchStatistics()
+    >>> with stats.phase('search'):
+    ...     for nr_of_live_labellings in [1, 3, 2]:
+    ...         stats.add_node(nr_of_live_labellings)
+    >>> stats.nr_of_nodes, stats.peak_live_labellings, 'search' in stats.phase_times
+    (3, 3, True)
+    """
+    NODES_PER_CHECK = 256
+
+    def __init__(self, on_progress: Optional[Callable[['SearchStatistics'], None]] = None,
+                 progress_interval: float = 1.0):
+        self.nr_of_nodes = 0
+        self.nr_of_propagations = 0
+        self.nr_of_backtracks = 0
+        self.nr_of_maximality_rejections = 0
+        self.peak_live_labellings = 0
+        self.phase_times: Dict[str, float] = {}
+        self.on_progress = on_progress
+        self.progress_interval = progress_interval
+        self._last_progress_time = time.monotonic()
+
+    def add_node(self, nr_of_live_labellings: int = 0):
+        """
+        Count a node of the search tree, with the number of labellings held at that point, and report progress if it
+        is time to.
+        """
+        self.nr_of_nodes += 1
+        if nr_of_live_labellings > self.peak_live_labellings:
+            self.peak_live_labellings = nr_of_live_labellings
+        if self.on_progress is not None and self.nr_of_nodes % self.NODES_PER_CHECK == 0:
+            self.report_progress()
+
+    def report_progress(self):
+        """
+        Call on_progress (if any), unless it was called less than progress_interval seconds ago.
+        """
+        if self.on_progress is None:
+            return
+        current_time = time.monotonic()
+        if current_time - self._last_progress_time >= self.progress_interval:
+            self._last_progress_time = current_time
+            self.on_progress(self)
+
+    @contextmanager
+    def phase(self, name: str):
+        """
+        Add the wall time spent in this context to the time of the phase.
+        """
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phase_times[name] = self.phase_times.get(name, 0.0) + time.perf_counter() - start_time
+
+    def as_dict(self) -> Dict[str, object]:
+        """
+        Get the statistics as a dictionary, for example to store them as JSON.
+
+        >>> SearchStatistics().as_dict()['nr_of_nodes']
+        0
+        """
+        return {'nr_of_nodes': self.nr_of_nodes, 'nr_of_propagations': self.nr_of_propagations,
+                'nr_of_backtracks': self.nr_of_backtracks,
+                'nr_of_maximality_rejections': self.nr_of_maximality_rejections,
+                'peak_live_labellings': self.peak_live_labellings, 'phase_times': dict(self.phase_times)}
+
+
+def in_phase(stats: Optional[SearchStatistics], name: str):
+    """
+    Get a context that adds its wall time to this phase of the statistics, or does nothing if there are none.
+    """
+    return stats.phase(name) if stats is not None else nullcontext()
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
@@ -0,0 +1,86 @@
+"""
+Stand-in for an ICCMA 2023 solver, used to test ExternalICCMASolver. It computes extensions by brute force, so it is
+only meant for small frameworks. Usage: iccma_stand_in_solver.py [--sleep SECONDS] -p TASK -f FILE [-a ARGUMENT]
+"""
+import argparse
+import itertools
+import time
+
+
+def read_framework(file_path):
+    nr_of_arguments = 0
+    attacks = set()
+    with open(file_path) as file:
+        for line in file:
+            parts = line.split()
+            if not parts or parts[0].startswith('#'):
+                continue
+            if parts[0] == 'p':
+                nr_of_arguments = int(parts[2])
+            else:
+                attacks.add((int(parts[0]), int(parts[1])))
+    return list(range(1, nr_of_arguments + 1)), attacks
+
+
+def get_extensions(arguments, attacks, semantics):
+    def attacked_by(arguments_set):
+        return {target for attacker, target in attacks if attacker in arguments_set}
+
+    def defends(arguments_set, argument):
+        return all(attacker in attacked_by(arguments_set) for attacker, target in attacks if target == argument)
+
+    subsets = [set(subset) for size in range(len(arguments) + 1) for subset in itertools.combinations(arguments, size)]
+    conflict_free = [subset for subset in subsets if not subset & attacked_by(subset)]
+    if semantics == 'STG':
+        ranges = [subset | attacked_by(subset) for subset in conflict_free]
+        return [subset for subset, subset_range in zip(conflict_free, ranges)
+                if not any(subset_range < other_range for other_range in ranges)]
+    admissible = [subset for subset in conflict_free if all(defends(subset, argument) for argument in subset)]
+    if semantics == 'ID':
+        preferred = get_extensions(arguments, attacks, 'PR')
+        candidates = [subset for subset in admissible if all(subset <= extension for extension in preferred)]
+        return [max(candidates, key=len)]
+    complete = [subset for subset in admissible
+                if all(argument in subset for argument in arguments if defends(subset, argument))]
+    if semantics == 'CO':
+        return complete
+    if semantics == 'GR':
+        return [min(complete, key=len)]
+    if semantics == 'PR':
+        return [subset for subset in complete if not any(subset < other for other in complete)]
+    if semantics == 'ST':
+        return [subset for subset in complete if subset | attacked_by(subset) == set(arguments)]
+    if semantics == 'SST':
+        ranges = [subset | attacked_by(subset) for subset in complete]
+        return [subset for subset, subset_range in zip(complete, ranges)
+                if not any(subset_range < other_range for other_range in ranges)]
+    raise ValueError('Unsupported semantics ' + semantics)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-p', dest='task', required=True)
+    parser.add_argument('-f', dest='file', required=True)
+    parser.add_argument('-a', dest='argument', type=int)
+    parser.add_argument('--sleep', type=float, default=0)
+    options = parser.parse_args()
+    time.sleep(options.sleep)
+
+    problem, semantics = options.task.split('-', 1)
+    arguments, attacks = read_framework(options.file)
+    extensions = get_extensions(arguments, attacks, semantics)
+    if problem == 'DC':
+        print('YES' if any(options.argument in extension for extension in extensions) else 'NO')
+    elif problem == 'DS':
+        print('YES' if all(options.argument in extension for extension in extensions) else 'NO')
+    elif problem in ['SE', 'EE']:
+        if not extensions:
+            print('NO')
+        for extension in extensions[:1] if problem == 'SE' else extensions:
+            print(' '.join(['w'] + [str(argument) for argument in sorted(extension)]))
+    else:
+        raise ValueError('Unsupported problem ' + problem)
+
+
+if __name__ == '__main__':
+    main()
@@ -16,3 +16,15 @@ class TestAFFromScratch(unittest.TestCase):
         self.assertListEqual(af.get_incoming_defeat_arguments(a), [b])
         self.assertListEqual(af.get_incoming_defeat_arguments(b), [a])
         self.assertListEqual(af.get_incoming_defeat_arguments(c), [b])
+        self.assertListEqual(af.get_outgoing_defeat_arguments(a), [b])
+        self.assertListEqual(af.get_outgoing_defeat_arguments(b), [a, c])
+        self.assertListEqual(af.get_outgoing_defeat_arguments(c), [])
+
+    def test_defeat_lookup_is_indexed_per_argument(self):
+        a = Argument('a')
+        b = Argument('b')
+        af = AbstractArgumentationFramework('af', [a, b], [Defeat(a, b)])
+        incoming = af.get_incoming_defeat_arguments(b)
+        incoming.append(b)
+        self.assertListEqual(af.get_incoming_defeat_arguments(b), [a])
+        self.assertListEqual(af.get_incoming_defeat_arguments(Argument('unknown')), [])
@@ -0,0 +1,177 @@
+import itertools
+import unittest
+from typing import FrozenSet, Set
+
+import py_arg.algorithms.semantics.get_conflict_free_extensions as get_conflict_free_extensions
+import py_arg.algorithms.semantics.get_naive_extensions as get_naive_extensions
+from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
+from py_arg.abstract_argumentation_classes.argument import Argument
+from py_arg.abstract_argumentation_classes.defeat import Defeat
+from py_arg.algorithms.semantics.get_acceptance_bounds import iter_acceptance_bounds
+from py_arg.algorithms.semantics.get_admissible_sets import get_admissible_sets
+from py_arg.algorithms.semantics.get_complete_extensions import get_complete_extensions
+from py_arg.algorithms.semantics.get_eager_extension import get_eager_extension
+from py_arg.algorithms.semantics.get_grounded_extension import get_grounded_extension
+from py_arg.algorithms.semantics.get_ideal_extension import get_ideal_extension
+from py_arg.algorithms.semantics.get_number_of_extensions import get_number_of_extensions
+from py_arg.algorithms.semantics.get_preferred_extensions import get_preferred_extensions
+from py_arg.algorithms.semantics.get_semistable_extensions import get_semistable_extensions, \
+    iter_semistable_extensions
+from py_arg.algorithms.semantics.get_stable_extensions import get_stable_extensions
+from py_arg.algorithms.semantics.get_stage_extensions import get_stage_extensions
+from py_arg.generators.abstract_argumentation_framework_generators.abstract_argumentation_framework_generator import \
+    AbstractArgumentationFrameworkGenerator
+from py_arg.utils.search_statistics import SearchStatistics
+
+
+# Reference implementations that follow the definitions of the semantics literally, by checking every subset of the
+# arguments. They are only feasible for small frameworks, but serve as ground truth for the actual algorithms.
+
+
+def _defeats(af: AbstractArgumentationFramework, argument_set) -> Set[Argument]:
+    return {defeated for argument in argument_set for defeated in af.get_outgoing_defeat_arguments(argument)}
+
+
+def _is_conflict_free(af: AbstractArgumentationFramework, argument_set) -> bool:
+    return not _defeats(af, argument_set) & set(argument_set)
+
+
+def _defends(af: AbstractArgumentationFramework, argument_set, argument) -> bool:
+    defeated = _defeats(af, argument_set)
+    return all(attacker in defeated for attacker in af.get_incoming_defeat_arguments(argument))
+
+
+def _maximal(sets) -> Set[FrozenSet[Argument]]:
+    return {s for s in sets if not any(s < t for t in sets)}
+
+
+def brute_force_extensions(af: AbstractArgumentationFramework, semantics: str) -> Set[FrozenSet[Argument]]:
+    arguments = af.arguments
+    subsets = [frozenset(c) for n in range(len(arguments) + 1) for c in itertools.combinations(arguments, n)]
+    conflict_free = [s for s in subsets if _is_conflict_free(af, s)]
+    if semantics == 'CF':
+        return set(conflict_free)
+    if semantics == 'NAI':
+        return _maximal(conflict_free)
+    if semantics == 'STG':
+        ranges = {s: s | _defeats(af, s) for s in conflict_free}
+        return {s for s in conflict_free if not any(ranges[s] < ranges[t] for t in conflict_free)}
+    admissible = [s for s in conflict_free if all(_defends(af, s, a) for a in s)]
+    if semantics == 'ADM':
+        return set(admissible)
+    complete = [s for s in admissible if all(a in s for a in arguments if _defends(af, s, a))]
+    if semantics == 'CO':
+        return set(complete)
+    if semantics == 'GR':
+        return {s for s in complete if not any(t < s for t in complete)}
+    if semantics == 'PR':
+        return _maximal(admissible)
+    if semantics == 'ST':
+        return {s for s in conflict_free if s | _defeats(af, s) == set(arguments)}
+    ranges = {s: s | _defeats(af, s) for s in complete}
+    semi_stable = {s for s in complete if not any(ranges[s] < ranges[t] for t in complete)}
+    if semantics == 'SST':
+        return semi_stable
+    if semantics == 'ID':
+        intersection = frozenset.intersection(*_maximal(admissible))
+        return _maximal([s for s in admissible if s <= intersection])
+    if semantics == 'EA':
+        intersection = frozenset.intersection(*semi_stable)
+        return _maximal([s for s in admissible if s <= intersection])
+    raise ValueError(semantics)
+
+
+def generate_small_frameworks(nr_of_frameworks: int = 30):
+    for index in range(nr_of_frameworks):
+        nr_of_arguments = 3 + index % 6
+        nr_of_defeats = nr_of_arguments + index % 5
+        yield AbstractArgumentationFrameworkGenerator(nr_of_arguments, nr_of_defeats).generate()
+
+
+class TestAFSemanticsBruteForce(unittest.TestCase):
+    def test_enumerators_match_definitions(self):
+        for af in generate_small_frameworks():
+            self.assertSetEqual(set(get_conflict_free_extensions.apply(af)) | {frozenset()},
+                                brute_force_extensions(af, 'CF'))
+            self.assertSetEqual(set(get_naive_extensions.apply(af)), brute_force_extensions(af, 'NAI'))
+            self.assertSetEqual(get_admissible_sets(af), brute_force_extensions(af, 'ADM'))
+            self.assertSetEqual(get_complete_extensions(af), brute_force_extensions(af, 'CO'))
+            self.assertSetEqual({frozenset(get_grounded_extension(af))}, brute_force_extensions(af, 'GR'))
+            self.assertSetEqual(get_preferred_extensions(af), brute_force_extensions(af, 'PR'))
+            self.assertSetEqual(get_stable_extensions(af), brute_force_extensions(af, 'ST'))
+            self.assertSetEqual(get_semistable_extensions(af), brute_force_extensions(af, 'SST'))
+            self.assertSetEqual(get_stage_extensions(af), brute_force_extensions(af, 'STG'))
+            self.assertSetEqual({frozenset(e) for e in get_ideal_extension(af)}, brute_force_extensions(af, 'ID'))
+            self.assertSetEqual({frozenset(e) for e in get_eager_extension(af)}, brute_force_extensions(af, 'EA'))
+
+    def test_range_maximal_enumerators_match_definitions(self):
+        # The range-maximal search prunes branches, so check it on more frameworks than the other enumerators.
+        for af in generate_small_frameworks(150):
+            semistable_extensions = brute_force_extensions(af, 'SST')
+            self.assertSetEqual(get_semistable_extensions(af), semistable_extensions)
+            self.assertSetEqual(set(iter_semistable_extensions(af)), semistable_extensions)
+            self.assertSetEqual(get_stage_extensions(af), brute_force_extensions(af, 'STG'))
+            self.assertSetEqual({frozenset(e) for e in get_eager_extension(af)}, brute_force_extensions(af, 'EA'))
+
+    def test_ideal_extension_without_admissible_enumeration(self):
+        for af in generate_small_frameworks(150):
+            self.assertSetEqual({frozenset(e) for e in get_ideal_extension(af)}, brute_force_extensions(af, 'ID'))
+        # 40 mutual defeats give 3 ** 40 admissible sets; of x and y, only x is in a preferred extension.
+        pairs = [(Argument('a' + str(i)), Argument('b' + str(i))) for i in range(40)]
+        x, y = Argument('x'), Argument('y')
+        defeats = [Defeat(a, b) for a, b in pairs] + [Defeat(b, a) for a, b in pairs] + \
+            [Defeat(x, y), Defeat(y, x), Defeat(y, y)]
+        af = AbstractArgumentationFramework('af', [x, y] + [argument for pair in pairs for argument in pair], defeats)
+        self.assertEqual(get_ideal_extension(af), [{x}])
+
+    def test_ideal_extension_on_chain_of_mutual_defeats(self):
+        # In the chain a0 <-> b0 -> a1 <-> b1 -> ..., every argument is credulously accepted, but none is decided by
+        # the grounded labelling. The labellings with all a's and with all b's IN show this in two short searches.
+        pairs = [(Argument('a' + str(i)), Argument('b' + str(i))) for i in range(150)]
+        x, y = Argument('x'), Argument('y')
+        defeats = [Defeat(a, b) for a, b in pairs] + [Defeat(b, a) for a, b in pairs] + \
+            [Defeat(pairs[i][1], pairs[i + 1][0]) for i in range(len(pairs) - 1)] + \
+            [Defeat(x, y), Defeat(y, x), Defeat(y, y)]
+        af = AbstractArgumentationFramework('af', [argument for pair in pairs for argument in pair] + [x, y], defeats)
+        stats = SearchStatistics()
+        self.assertEqual(get_ideal_extension(af, stats=stats), [{x}])
+        self.assertLess(stats.nr_of_nodes, 1000)
+
+    def test_conflict_free_and_naive_iterators_match_definitions(self):
+        for af in generate_small_frameworks(150):
+            conflict_free_sets = list(get_conflict_free_extensions.iter_conflict_free_extensions(af))
+            self.assertEqual(len(conflict_free_sets), len(set(conflict_free_sets)))
+            self.assertSetEqual(set(conflict_free_sets), brute_force_extensions(af, 'CF'))
+            self.assertSetEqual(set(get_naive_extensions.iter_naive_extensions(af)), brute_force_extensions(af, 'NAI'))
+        a = Argument('a')
+        af = AbstractArgumentationFramework('af', [a], [Defeat(a, a)])
+        self.assertEqual(list(get_naive_extensions.iter_naive_extensions(af)), [frozenset()])
+
+    def test_number_of_extensions_matches_definitions(self):
+        for af in generate_small_frameworks(150):
+            for semantics, short_name in [('Complete', 'CO'), ('Grounded', 'GR'), ('Preferred', 'PR'),
+                                          ('Stable', 'ST')]:
+                self.assertEqual(get_number_of_extensions(af, semantics),
+                                 len(brute_force_extensions(af, short_name)))
+        # A chain of 60 mutual defeats a_i <-> b_i with a_i -> a_(i+1): one connected component with 60 SCCs. The
+        # stable (and preferred) extensions choose a_i or b_i for each i, never both a_i and a_(i+1): Fibonacci(62)
+        # of them.
+        pairs = [(Argument('a' + str(i)), Argument('b' + str(i))) for i in range(60)]
+        defeats = [Defeat(a, b) for a, b in pairs] + [Defeat(b, a) for a, b in pairs] + \
+            [Defeat(pairs[i][0], pairs[i + 1][0]) for i in range(59)]
+        af = AbstractArgumentationFramework('af', [argument for pair in pairs for argument in pair], defeats)
+        self.assertEqual(get_number_of_extensions(af, 'Stable'), 4052739537881)
+        self.assertEqual(get_number_of_extensions(af, 'Preferred'), 4052739537881)
+
+    def test_acceptance_bounds_are_sound(self):
+        for af in generate_small_frameworks(100):
+            for semantics, short_name in [('Complete', 'CO'), ('Preferred', 'PR'), ('Stable', 'ST')]:
+                extensions = brute_force_extensions(af, short_name)
+                credulous = frozenset().union(*extensions)
+                skeptical = frozenset(af.arguments).intersection(*extensions)
+                all_bounds = list(iter_acceptance_bounds(af, semantics))
+                for bounds in all_bounds:
+                    self.assertTrue(bounds.credulous_lower <= credulous <= bounds.credulous_upper)
+                    self.assertTrue(bounds.skeptical_lower <= skeptical <= bounds.skeptical_upper)
+                self.assertEqual((all_bounds[-1].credulous_lower, all_bounds[-1].skeptical_lower),
+                                 (credulous, skeptical))
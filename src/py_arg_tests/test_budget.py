@@ -0,0 +1,121 @@
+import unittest
+
+from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
+from py_arg.abstract_argumentation_classes.argument import Argument
+from py_arg.abstract_argumentation_classes.defeat import Defeat
+from py_arg.algorithms.semantics.get_admissible_sets import get_admissible_sets
+from py_arg.algorithms.semantics.get_number_of_extensions import get_number_of_extensions
+from py_arg.algorithms.semantics.get_preferred_extensions import get_preferred_extensions
+from py_arg.algorithms.semantics.get_scc_recursive_extensions import get_scc_recursive_extensions
+from py_arg.algorithms.semantics.is_accepted import is_credulously_accepted, is_skeptically_accepted
+from py_arg.algorithms.semantics.iterate_extensions import iter_extensions
+from py_arg.algorithms.semantics.sat import get_extensions as sat_get_extensions
+from py_arg.aspic_classes.argumentation_system import ArgumentationSystem
+from py_arg.aspic_classes.argumentation_theory import ArgumentationTheory
+from py_arg.aspic_classes.defeasible_rule import DefeasibleRule
+from py_arg.aspic_classes.literal import Literal
+from py_arg.utils.budget import Budget, BudgetExceeded, CancellationToken
+
+
+def get_pairs_framework(nr_of_pairs: int) -> AbstractArgumentationFramework:
+    # Pairs of arguments that defeat each other, which have 2 ** nr_of_pairs preferred extensions.
+    pairs = [(Argument('a' + str(i)), Argument('b' + str(i))) for i in range(nr_of_pairs)]
+    defeats = [Defeat(a, b) for a, b in pairs] + [Defeat(b, a) for a, b in pairs]
+    return AbstractArgumentationFramework('pairs', [argument for pair in pairs for argument in pair], defeats)
+
+
+class TestBudget(unittest.TestCase):
+    def test_node_budget_gives_partial_extensions(self):
+        af = get_pairs_framework(12)
+        budget = Budget(max_nodes=500)
+        with self.assertRaises(BudgetExceeded) as context:
+            get_preferred_extensions(af, budget=budget)
+        partial_extensions = context.exception.partial_results
+        self.assertGreater(len(partial_extensions), 0)
+        self.assertLess(len(partial_extensions), 2 ** 12)
+        # The preferred extensions contain one argument of each pair.
+        self.assertTrue(all(len(extension) == 12 for extension in partial_extensions))
+
+    def test_extension_budget(self):
+        af = get_pairs_framework(3)
+        self.assertEqual(len(get_admissible_sets(af, budget=Budget(max_extensions=27))), 27)
+        with self.assertRaises(BudgetExceeded) as context:
+            get_admissible_sets(af, as_bitmasks=True, budget=Budget(max_extensions=10))
+        self.assertEqual(len(context.exception.partial_results), 10)
+
+    def test_sat_budget(self):
+        af = get_pairs_framework(6)
+        with self.assertRaises(BudgetExceeded) as context:
+            sat_get_extensions.get_extensions(af, 'Stable', backend='cdcl', budget=Budget(max_nodes=10))
+        # Each SAT call finds a new stable extension, until the eleventh call exceeds the budget.
+        self.assertEqual(len(context.exception.partial_results), 10)
+
+    def test_cancellation(self):
+        token = CancellationToken()
+        extensions = iter_extensions(get_pairs_framework(12), 'Complete', budget=Budget(cancellation_token=token))
+        first_extensions = [next(extensions), next(extensions)]
+        token.cancel()
+        with self.assertRaises(BudgetExceeded) as context:
+            list(extensions)
+        self.assertEqual(context.exception.reason, 'The search was cancelled.')
+        self.assertEqual(context.exception.partial_results[:2], first_extensions)
+
+    def test_argument_construction_budget(self):
+        # Every literal p_i follows from p_(i - 1) and from q_(i - 1), and so does every q_i, so there are 2 ** i
+        # arguments for p_i and q_i.
+        language = {name + str(i): Literal(name + str(i)) for name in 'pq' for i in range(12)}
+        rules = [DefeasibleRule(name + str(i) + from_name, {language[from_name + str(i - 1)]}, language[name + str(i)])
+                 for name in 'pq' for from_name in 'pq' for i in range(1, 12)]
+        argumentation_system = ArgumentationSystem(language, {}, [], rules, add_defeasible_rule_literals=False)
+        with self.assertRaises(BudgetExceeded) as context:
+            ArgumentationTheory(argumentation_system, [], [language['p0'], language['q0']],
+                                budget=Budget(max_nodes=100))
+        partial_arguments = context.exception.partial_results
+        self.assertEqual(len(partial_arguments[language['p0']]), 1)
+        self.assertLessEqual(sum(len(arguments) for arguments in partial_arguments.values()), 102)
+
+    def test_theory_budget_per_call(self):
+        language = {name: Literal(name) for name in 'pqr'}
+        rules = [DefeasibleRule('d1', {language['p']}, language['q']),
+                 DefeasibleRule('d2', {language['q']}, language['r'])]
+        argumentation_system = ArgumentationSystem(language, {}, [], rules)
+        argumentation_theory = ArgumentationTheory(argumentation_system, [], [language['p']],
+                                                   budget=Budget(max_nodes=100))
+        self.assertEqual(len(argumentation_theory.all_arguments), 3)
+        # The budget of the constructor is not kept: later calls are only limited by the budget given to them.
+        with self.assertRaises(BudgetExceeded):
+            argumentation_theory.add_to_knowledge_base_ordinary_premises(language['q'], budget=Budget(max_nodes=0))
+        with self.assertRaises(BudgetExceeded):
+            argumentation_theory.create_abstract_argumentation_framework('af', budget=Budget(max_nodes=0))
+        argumentation_theory.add_to_knowledge_base_axioms(language['r'])
+        argumentation_framework = argumentation_theory.create_abstract_argumentation_framework('af')
+        self.assertEqual(len(argumentation_framework.arguments), len(argumentation_theory.all_arguments))
+
+    def test_acceptance_budget(self):
+        af = get_pairs_framework(12)
+        for is_accepted in [is_credulously_accepted, is_skeptically_accepted]:
+            for semantics in ['Preferred', 'Stable', 'SemiStable']:
+                with self.assertRaises(BudgetExceeded) as context:
+                    is_accepted(af, af.arguments[0], semantics, budget=Budget(max_nodes=0))
+                self.assertIsNone(context.exception.partial_results)
+
+    def test_counting_budget_gives_partial_count(self):
+        # Each pair is a weakly connected component with three complete extensions, so the partial count is the number
+        # of complete extensions of the pairs that were counted before the budget ran out.
+        af = get_pairs_framework(12)
+        with self.assertRaises(BudgetExceeded) as context:
+            get_number_of_extensions(af, 'Complete', budget=Budget(max_nodes=20))
+        partial_count = context.exception.partial_results
+        self.assertIn(partial_count, [3 ** nr_of_pairs for nr_of_pairs in range(1, 12)])
+        self.assertEqual(get_number_of_extensions(af, 'Complete', budget=Budget(max_nodes=1000)), 3 ** 12)
+
+    def test_scc_recursive_budget(self):
+        af = get_pairs_framework(12)
+        with self.assertRaises(BudgetExceeded) as context:
+            get_scc_recursive_extensions(af, 'Preferred', budget=Budget(max_nodes=100))
+        self.assertIsNone(context.exception.partial_results)
+        self.assertEqual(len(get_scc_recursive_extensions(get_pairs_framework(3), 'Preferred', budget=Budget())), 8)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+
+from py_arg.abstract_argumentation_classes.compact_argumentation_framework import CompactArgumentationFramework
+from py_arg.generators.abstract_argumentation_framework_generators.abstract_argumentation_framework_generator import \
+    AbstractArgumentationFrameworkGenerator
+from py_arg.import_export.argumentation_framework_from_iccma23_format_reader import \
+    ArgumentationFrameworkFromICCMA23FormatReader
+from py_arg.import_export.argumentation_framework_to_iccma23_format_writer import \
+    ArgumentationFrameworkToICCMA23FormatWriter
+from py_arg.import_export.compact_argumentation_framework_from_aspartix_format_reader import \
+    CompactArgumentationFrameworkFromASPARTIXFormatReader
+from py_arg.import_export.compact_argumentation_framework_from_iccma23_format_reader import \
+    CompactArgumentationFrameworkFromICCMA23FormatReader
+
+
+class TestCompactArgumentationFramework(unittest.TestCase):
+    def test_round_trip(self):
+        af = AbstractArgumentationFrameworkGenerator(20, 40).generate()
+        caf = CompactArgumentationFramework.from_abstract_argumentation_framework(af)
+        self.assertEqual(caf.nr_of_arguments, 20)
+        self.assertEqual(caf.nr_of_attacks, 40)
+        for argument in af.arguments:
+            argument_id = caf.get_argument_id(argument.name)
+            self.assertEqual(sorted(caf.get_argument_name(i) for i in caf.get_attacked_ids(argument_id)),
+                             sorted(a.name for a in af.get_outgoing_defeat_arguments(argument)))
+            self.assertEqual(sorted(caf.get_argument_name(i) for i in caf.get_attacker_ids(argument_id)),
+                             sorted(a.name for a in af.get_incoming_defeat_arguments(argument)))
+
+        af_again = caf.to_abstract_argumentation_framework()
+        self.assertEqual(af_again.name, af.name)
+        self.assertListEqual(af_again.arguments, af.arguments)
+        self.assertSetEqual(set(af_again.defeats), set(af.defeats))
+
+    def test_iccma23_reader_matches_object_reader(self):
+        af = AbstractArgumentationFrameworkGenerator(15, 30).generate()
+        iccma_str = ArgumentationFrameworkToICCMA23FormatWriter.write_to_str(af)
+        caf = CompactArgumentationFrameworkFromICCMA23FormatReader.from_iccma23(iccma_str, 'test')
+        af_expected = ArgumentationFrameworkFromICCMA23FormatReader.from_iccma23(iccma_str, 'test')
+        af_compact = caf.to_abstract_argumentation_framework()
+        self.assertListEqual(af_compact.arguments, af_expected.arguments)
+        self.assertSetEqual(set(af_compact.defeats), set(af_expected.defeats))
+
+    def test_apx_reader(self):
+        test_file_str = 'arg(A).\n' \
+                        'arg(B).\n' \
+                        'arg(C).\n' \
+                        'att(A, B).\n' \
+                        'att(B, C).\n' \
+                        'att(B, A).\n'
+        caf = CompactArgumentationFrameworkFromASPARTIXFormatReader.from_apx(test_file_str)
+        self.assertEqual(caf.nr_of_arguments, 3)
+        self.assertEqual(caf.nr_of_attacks, 3)
+        self.assertListEqual(list(caf.get_attacked_ids(caf.get_argument_id('B'))), [2, 0])
+
+    def test_invalid_attack(self):
+        with self.assertRaises(ValueError):
+            CompactArgumentationFramework('af', ['a'], [0], [1])
@@ -24,12 +24,21 @@ class TestArgumentationFrameworkFromArgumentationTheory(unittest.TestCase):
         af = arg_theory.create_abstract_argumentation_framework('af')
         arg_for_r = af.get_argument('r (ordinary premise)')
         self.assertEqual(arg_for_r.name, 'r (ordinary premise)')
-        defeaters_of_r = arg_for_r.get_ingoing_defeat_arguments
+        defeaters_of_r = af.get_incoming_defeat_arguments(arg_for_r)
         self.assertEqual(len(defeaters_of_r), 1)
         self.assertEqual(defeaters_of_r[0].name, '-r (ordinary premise)')
-        defeated_by_r = arg_for_r.get_ingoing_defeat_arguments
+        defeated_by_r = af.get_outgoing_defeat_arguments(arg_for_r)
         self.assertEqual(len(defeated_by_r), 1)
         self.assertEqual(defeated_by_r[0].name, '-r (ordinary premise)')
         arg_for_not_r = af.get_argument('-r (ordinary premise)')
-        defeated_by_not_r = arg_for_not_r.get_outgoing_defeat_arguments
+        defeated_by_not_r = af.get_outgoing_defeat_arguments(arg_for_not_r)
         self.assertEqual(len(defeated_by_not_r), 3)
+
+    def test_frameworks_do_not_share_defeats(self):
+        arg_theory = get_argumentation_theory()
+        af_1 = arg_theory.create_abstract_argumentation_framework('af_1')
+        af_2 = arg_theory.create_abstract_argumentation_framework('af_2')
+        arg_for_r = af_2.get_argument('r (ordinary premise)')
+        self.assertIs(arg_for_r, af_1.get_argument('r (ordinary premise)'))
+        self.assertEqual(len(af_1.get_incoming_defeat_arguments(arg_for_r)), 1)
+        self.assertEqual(len(af_2.get_incoming_defeat_arguments(arg_for_r)), 1)
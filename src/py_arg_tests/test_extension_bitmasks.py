@@ -0,0 +1,34 @@
+import unittest
+
+import py_arg.algorithms.semantics.get_conflict_free_extensions as get_conflict_free_extensions
+import py_arg.algorithms.semantics.get_naive_extensions as get_naive_extensions
+from py_arg.algorithms.semantics.extension_bitmask import bitmasks_to_extensions, extension_to_bitmask, \
+    bitmask_to_extension
+from py_arg.algorithms.semantics.get_admissible_sets import get_admissible_sets
+from py_arg.algorithms.semantics.get_complete_extensions import get_complete_extensions
+from py_arg.algorithms.semantics.get_eager_extension import get_eager_extension
+from py_arg.algorithms.semantics.get_grounded_extension import get_grounded_extension
+from py_arg.algorithms.semantics.get_ideal_extension import get_ideal_extension
+from py_arg.algorithms.semantics.get_preferred_extensions import get_preferred_extensions
+from py_arg.algorithms.semantics.get_semistable_extensions import get_semistable_extensions
+from py_arg.algorithms.semantics.get_stable_extensions import get_stable_extensions
+from py_arg.generators.abstract_argumentation_framework_generators.abstract_argumentation_framework_generator import \
+    AbstractArgumentationFrameworkGenerator
+
+
+class TestExtensionBitmasks(unittest.TestCase):
+    def test_bitmask_mode_matches_argument_sets(self):
+        for _ in range(10):
+            af = AbstractArgumentationFrameworkGenerator(8, 10).generate()
+            for get_extensions in [get_admissible_sets, get_complete_extensions, get_preferred_extensions,
+                                   get_semistable_extensions, get_stable_extensions,
+                                   get_conflict_free_extensions.apply, get_naive_extensions.apply]:
+                self.assertSetEqual(bitmasks_to_extensions(get_extensions(af, as_bitmasks=True), af),
+                                    set(get_extensions(af)))
+            for get_extension in [get_ideal_extension, get_eager_extension]:
+                self.assertListEqual([set(bitmask_to_extension(bitmask, af))
+                                      for bitmask in get_extension(af, as_bitmasks=True)],
+                                     get_extension(af))
+            grounded_extension = get_grounded_extension(af)
+            self.assertEqual(get_grounded_extension(af, as_bitmask=True),
+                             extension_to_bitmask(grounded_extension, af))
@@ -0,0 +1,103 @@
+import os
+import subprocess
+import sys
+import threading
+import time
+import unittest
+from unittest import mock
+
+from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
+from py_arg.abstract_argumentation_classes.argument import Argument
+from py_arg.abstract_argumentation_classes.defeat import Defeat
+from py_arg.algorithms.semantics.external_iccma_solver import ExternalICCMASolver, ExternalSolverError, \
+    ExternalSolverTimeout
+from py_arg.algorithms.semantics.iterate_extensions import iter_extensions
+from py_arg_tests.test_af_semantics_brute_force import brute_force_extensions, generate_small_frameworks
+
+STAND_IN_SOLVER = [sys.executable, os.path.join(os.path.dirname(__file__), 'iccma_stand_in_solver.py')]
+
+
+class TestExternalICCMASolver(unittest.TestCase):
+    def test_extensions_and_acceptance_match_definitions(self):
+        solver = ExternalICCMASolver(STAND_IN_SOLVER)
+        abbreviations = {'Complete': 'CO', 'Preferred': 'PR', 'Stable': 'ST', 'SemiStable': 'SST', 'Stage': 'STG',
+                         'Grounded': 'GR', 'Ideal': 'ID'}
+        for af in generate_small_frameworks(6):
+            for semantics, abbreviation in abbreviations.items():
+                extensions = brute_force_extensions(af, abbreviation)
+                self.assertEqual(solver.get_extensions(af, semantics), extensions)
+                some_extension = solver.get_some_extension(af, semantics)
+                self.assertTrue(some_extension in extensions if extensions else some_extension is None)
+            argument = af.arguments[0]
+            preferred_extensions = brute_force_extensions(af, 'PR')
+            self.assertEqual(solver.is_credulously_accepted(af, argument, 'Preferred'),
+                             any(argument in extension for extension in preferred_extensions))
+            self.assertEqual(solver.is_skeptically_accepted(af, argument, 'Preferred'),
+                             all(argument in extension for extension in preferred_extensions))
+
+    def test_iter_extensions_routes_large_frameworks(self):
+        a, b = Argument('a'), Argument('b')
+        af = AbstractArgumentationFramework('af', [a, b], [Defeat(a, b), Defeat(b, a)])
+        calls = []
+
+        class RecordingSolver(ExternalICCMASolver):
+            def run(self, argumentation_framework, task, argument=None):
+                calls.append(task)
+                return super().run(argumentation_framework, task, argument)
+
+        solver = RecordingSolver(STAND_IN_SOLVER)
+        self.assertEqual(set(iter_extensions(af, 'Preferred', external_solver=solver)), {frozenset([a]),
+                                                                                         frozenset([b])})
+        self.assertEqual(calls, ['EE-PR'])
+        self.assertEqual(len(list(iter_extensions(af, 'Preferred', external_solver=solver,
+                                                  external_solver_min_arguments=3))), 2)
+        self.assertEqual(len(list(iter_extensions(af, 'Admissible', external_solver=solver))), 3)
+        self.assertEqual(calls, ['EE-PR'])
+
+    def test_timeout_and_failure(self):
+        af = AbstractArgumentationFramework('af', [Argument('a')], [])
+        solver = ExternalICCMASolver(STAND_IN_SOLVER + ['--sleep', '10'], timeout=0.5)
+        start_time = time.monotonic()
+        with self.assertRaises(ExternalSolverTimeout):
+            solver.get_extensions(af, 'Preferred')
+        self.assertLess(time.monotonic() - start_time, 5)
+        with self.assertRaises(ExternalSolverError):
+            ExternalICCMASolver(STAND_IN_SOLVER + ['--unknown-option']).get_extensions(af, 'Preferred')
+        with self.assertRaises(ValueError):
+            ExternalICCMASolver(STAND_IN_SOLVER).get_extensions(af, 'Eager')
+
+    def test_concurrency_limit(self):
+        af = AbstractArgumentationFramework('af', [Argument('a')], [])
+        lock = threading.Lock()
+        running = [0]
+        maximum_running = [0]
+        run_process = subprocess.run
+
+        def counting_run(*args, **kwargs):
+            with lock:
+                running[0] += 1
+                maximum_running[0] = max(maximum_running[0], running[0])
+            try:
+                return run_process(*args, **kwargs)
+            finally:
+                with lock:
+                    running[0] -= 1
+
+        solver = ExternalICCMASolver(STAND_IN_SOLVER + ['--sleep', '0.2'], max_workers=2)
+        results = []
+        with mock.patch('py_arg.algorithms.semantics.external_iccma_solver.subprocess.run', counting_run):
+            threads = [threading.Thread(target=lambda: results.append(solver.get_extensions(af, 'Grounded')))
+                       for _ in range(5)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            with solver:
+                futures = [solver.submit(solver.get_extensions, af, 'Grounded') for _ in range(3)]
+                results += [future.result() for future in futures]
+        self.assertEqual(results, [{frozenset(af.arguments)}] * 8)
+        self.assertEqual(maximum_running[0], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import random
+import unittest
+from typing import List, Tuple
+
+from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
+from py_arg.abstract_argumentation_classes.argument import Argument
+from py_arg.abstract_argumentation_classes.defeat import Defeat
+from py_arg.algorithms.semantics.get_extensions import ACYCLIC, BIPARTITE, EVEN_CYCLE_FREE, GENERAL, SYMMETRIC, \
+    get_extensions, get_framework_classes
+from py_arg_tests.test_af_semantics_brute_force import brute_force_extensions, generate_small_frameworks
+
+SEMANTICS_ABBREVIATIONS = {'Admissible': 'ADM', 'Complete': 'CO', 'Grounded': 'GR', 'Preferred': 'PR', 'Ideal': 'ID',
+                           'Stable': 'ST', 'SemiStable': 'SST', 'Stage': 'STG', 'Eager': 'EA', 'Naive': 'NAI'}
+
+
+def _create_framework(nr_of_arguments: int, defeat_ids: List[Tuple[int, int]]) -> AbstractArgumentationFramework:
+    arguments = [Argument('a' + str(i)) for i in range(nr_of_arguments)]
+    return AbstractArgumentationFramework('af', arguments, [Defeat(arguments[i], arguments[j])
+                                                            for i, j in sorted(set(defeat_ids))])
+
+
+def generate_frameworks_of_class(framework_class: str, nr_of_frameworks: int = 20):
+    generator = random.Random(framework_class)
+    for index in range(nr_of_frameworks):
+        nr_of_arguments = 3 + index % 5
+        pairs = [(generator.randrange(nr_of_arguments), generator.randrange(nr_of_arguments))
+                 for _ in range(nr_of_arguments + index % 4)]
+        if framework_class == ACYCLIC:
+            defeat_ids = [(i, j) for i, j in pairs if i < j]
+        elif framework_class == EVEN_CYCLE_FREE:
+            # An odd cycle of the last arguments, which only the other arguments defeat, without forming new cycles.
+            cycle_start = nr_of_arguments - 1 - 2 * (index % 2)
+            defeat_ids = [(i, i + 1) for i in range(cycle_start, nr_of_arguments - 1)] + \
+                [(nr_of_arguments - 1, cycle_start)] + [(i, j) for i, j in pairs if i < j and i < cycle_start]
+        elif framework_class == SYMMETRIC:
+            defeat_ids = pairs + [(j, i) for i, j in pairs]
+        else:
+            # Defeats between arguments with odd and even ids, some in both directions.
+            defeat_ids = [(i, j) for i, j in pairs if i % 2 != j % 2] + \
+                [(j, i) for i, j in pairs[::2] if i % 2 != j % 2]
+        yield _create_framework(nr_of_arguments, defeat_ids)
+
+
+class TestGetExtensions(unittest.TestCase):
+    def test_framework_classes(self):
+        for framework_class in [ACYCLIC, EVEN_CYCLE_FREE, SYMMETRIC, BIPARTITE]:
+            for af in generate_frameworks_of_class(framework_class):
+                self.assertIn(framework_class, get_framework_classes(af))
+        # Two cycles of length three that share an argument contain a cycle of length four.
+        af = _create_framework(5, [(0, 1), (1, 2), (2, 0), (0, 3), (3, 4), (4, 0)])
+        self.assertSetEqual(get_framework_classes(af), set())
+
+    def test_extensions_match_definitions(self):
+        frameworks = [af for framework_class in [ACYCLIC, EVEN_CYCLE_FREE, SYMMETRIC, BIPARTITE]
+                      for af in generate_frameworks_of_class(framework_class)] + list(generate_small_frameworks())
+        for af in frameworks:
+            for semantics, abbreviation in SEMANTICS_ABBREVIATIONS.items():
+                self.assertSetEqual(get_extensions(af, semantics), brute_force_extensions(af, abbreviation))
+
+    def test_path(self):
+        af = next(generate_frameworks_of_class(ACYCLIC))
+        self.assertEqual(get_extensions(af, 'Stable', return_path=True)[1], ACYCLIC)
+        self.assertEqual(get_extensions(af, 'Admissible', return_path=True)[1], GENERAL)
+
+        # Pairs of arguments that defeat each other form a symmetric and bipartite framework.
+        af = _create_framework(4, [(0, 1), (1, 0), (2, 3), (3, 2)])
+        extensions, path = get_extensions(af, 'Preferred', return_path=True)
+        self.assertEqual(len(extensions), 4)
+        self.assertEqual(path, SYMMETRIC)
+        af = _create_framework(4, [(0, 1), (1, 0), (2, 3), (3, 2), (0, 3)])
+        self.assertEqual(get_extensions(af, 'Preferred', return_path=True)[1], BIPARTITE)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+
+from py_arg.algorithms.semantics.get_acceptable_with_respect_to import get_acceptable_with_respect_to
+from py_arg.algorithms.semantics.get_grounded_extension import get_grounded_extension
+from py_arg.algorithms.semantics.get_grounded_labelling import get_grounded_labelling, GroundedLabel
+from py_arg.generators.abstract_argumentation_framework_generators.abstract_argumentation_framework_generator import \
+    AbstractArgumentationFrameworkGenerator
+from py_arg.utils.fixpoint import get_least_fixed_point
+
+
+class TestGroundedLabelling(unittest.TestCase):
+    def test_grounded_extension_is_least_fixed_point(self):
+        for _ in range(20):
+            af = AbstractArgumentationFrameworkGenerator(30, 40).generate()
+            expected = get_least_fixed_point(lambda x: get_acceptable_with_respect_to(x, af), set())
+            self.assertSetEqual(get_grounded_extension(af), expected)
+
+    def test_grounded_labelling(self):
+        for _ in range(20):
+            af = AbstractArgumentationFrameworkGenerator(30, 40).generate()
+            labelling = get_grounded_labelling(af)
+            for argument in af.arguments:
+                attackers = af.get_incoming_defeat_arguments(argument)
+                if labelling[argument] == GroundedLabel.IN:
+                    self.assertTrue(all(labelling[attacker] == GroundedLabel.OUT for attacker in attackers))
+                    self.assertTrue(all(labelling.rounds[attacker] < labelling.rounds[argument]
+                                        for attacker in attackers))
+                elif labelling[argument] == GroundedLabel.OUT:
+                    self.assertIn(labelling.rounds[argument],
+                                  [labelling.rounds[attacker] for attacker in attackers
+                                   if labelling[attacker] == GroundedLabel.IN])
+                else:
+                    self.assertIsNone(labelling.rounds[argument])
+                    self.assertFalse(any(labelling[attacker] == GroundedLabel.IN for attacker in attackers))
+                    self.assertFalse(all(labelling[attacker] == GroundedLabel.OUT for attacker in attackers))
@@ -0,0 +1,27 @@
+import unittest
+
+from py_arg.abstract_argumentation_classes.argument import Argument
+from py_arg.algorithms.semantics.is_accepted import ACCEPTANCE_SEMANTICS, is_credulously_accepted, \
+    is_skeptically_accepted
+from py_arg_tests.test_af_semantics_brute_force import brute_force_extensions, generate_small_frameworks
+
+
+class TestIsAccepted(unittest.TestCase):
+    def test_acceptance_matches_definitions(self):
+        abbreviations = {'Admissible': 'ADM', 'Complete': 'CO', 'Grounded': 'GR', 'Preferred': 'PR', 'Ideal': 'ID',
+                         'Stable': 'ST', 'SemiStable': 'SST', 'Eager': 'EA'}
+        for af in generate_small_frameworks(60):
+            for semantics in ACCEPTANCE_SEMANTICS:
+                extensions = brute_force_extensions(af, abbreviations[semantics])
+                for argument in af.arguments:
+                    self.assertEqual(is_credulously_accepted(af, argument, semantics),
+                                     any(argument in extension for extension in extensions))
+                    self.assertEqual(is_skeptically_accepted(af, argument, semantics),
+                                     all(argument in extension for extension in extensions))
+
+    def test_unknown_argument_or_semantics(self):
+        af = next(generate_small_frameworks(1))
+        with self.assertRaises(ValueError):
+            is_credulously_accepted(af, af.arguments[0], 'Unknown')
+        with self.assertRaises(ValueError):
+            is_skeptically_accepted(af, Argument('unknown'), 'Preferred')
@@ -0,0 +1,30 @@
+import unittest
+
+from py_arg.algorithms.semantics.iterate_extensions import count_extensions, first_extension, has_extension, \
+    iter_extensions
+from py_arg_tests.test_af_semantics_brute_force import brute_force_extensions, generate_small_frameworks
+
+
+class TestIterateExtensions(unittest.TestCase):
+    def test_iterators_match_definitions(self):
+        semantics_abbreviations = {'Admissible': 'ADM', 'Complete': 'CO', 'Grounded': 'GR', 'Preferred': 'PR',
+                                   'Ideal': 'ID', 'Stable': 'ST', 'SemiStable': 'SST', 'Eager': 'EA'}
+        for af in generate_small_frameworks():
+            for semantics, abbreviation in semantics_abbreviations.items():
+                expected = brute_force_extensions(af, abbreviation)
+                extensions = list(iter_extensions(af, semantics))
+                self.assertEqual(len(extensions), len(expected))
+                self.assertSetEqual(set(extensions), expected)
+
+                # Every extension is final when it is yielded, so stopping early gives extensions too.
+                first = first_extension(af, semantics)
+                self.assertEqual(first is None, not expected)
+                self.assertTrue(first is None or first in expected)
+                self.assertEqual(has_extension(af, semantics), bool(expected))
+                self.assertEqual(count_extensions(af, semantics), len(expected))
+                self.assertEqual(count_extensions(af, semantics, limit=1), min(1, len(expected)))
+
+    def test_unknown_semantics(self):
+        af = next(generate_small_frameworks(1))
+        with self.assertRaises(ValueError):
+            iter_extensions(af, 'Unknown')
@@ -0,0 +1,81 @@
+import sys
+import unittest
+from typing import List
+
+from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
+from py_arg.abstract_argumentation_classes.argument import Argument
+from py_arg.abstract_argumentation_classes.compact_argumentation_framework import CompactArgumentationFramework
+from py_arg.abstract_argumentation_classes.defeat import Defeat
+from py_arg.algorithms.semantics.get_complete_extensions import get_complete_extensions
+from py_arg.algorithms.semantics.get_grounded_extension import get_grounded_extension
+from py_arg.algorithms.semantics.get_preferred_extensions import get_preferred_extensions
+from py_arg.algorithms.semantics.labelling_search import BRANCHING_HEURISTICS, LabellingSearch, \
+    is_admissible_labelling, is_complete_labelling, is_stable_labelling
+from py_arg_tests.test_af_semantics_brute_force import generate_small_frameworks
+
+
+class TestLabellingSearch(unittest.TestCase):
+    def test_search_deeper_than_recursion_limit(self):
+        nr_of_arguments = 2 * sys.getrecursionlimit()
+        arguments = [Argument('a' + str(i)) for i in range(nr_of_arguments)]
+
+        # Every branch of the search labels each argument, so the first labelling is found at depth nr_of_arguments.
+        chain = AbstractArgumentationFramework('chain', arguments,
+                                               [Defeat(arguments[i], arguments[i + 1])
+                                                for i in range(nr_of_arguments - 1)])
+        first_bitmask = next(LabellingSearch.from_argumentation_framework(chain).search())
+        self.assertEqual(first_bitmask, sum(1 << i for i in range(0, nr_of_arguments, 2)))
+
+        self_attacking = AbstractArgumentationFramework('self_attacking', arguments,
+                                                        [Defeat(argument, argument) for argument in arguments])
+        self.assertSetEqual(get_preferred_extensions(self_attacking), {frozenset()})
+
+    def test_fix_grounded_labels(self):
+        # In a long chain, the grounded labelling labels every argument. Without fixing those labels first, the search
+        # would explore exponentially many (non-admissible) labellings.
+        arguments = [Argument('a' + str(i)) for i in range(200)]
+        chain = AbstractArgumentationFramework('chain', arguments,
+                                               [Defeat(arguments[i], arguments[i + 1]) for i in range(199)])
+        self.assertSetEqual(get_complete_extensions(chain), {frozenset(get_grounded_extension(chain))})
+
+        search = LabellingSearch.from_argumentation_framework(chain, fix_grounded_labels=True)
+        self.assertEqual(len(list(search.search())), 1)
+
+    def test_propagation_and_branching_keep_labellings(self):
+        is_accepted_by_semantics = {'Admissible': is_admissible_labelling, 'Complete': is_complete_labelling,
+                                    'Stable': is_stable_labelling}
+        for af in generate_small_frameworks(100):
+            compact_framework = CompactArgumentationFramework.from_abstract_argumentation_framework(af)
+            attacked_ids, attacker_ids = compact_framework.get_attacked_lists(), compact_framework.get_attacker_lists()
+            for semantics, is_accepted in is_accepted_by_semantics.items():
+                expected = sorted(LabellingSearch(attacked_ids, attacker_ids, is_accepted=is_accepted).search())
+                for branching in BRANCHING_HEURISTICS:
+                    search = LabellingSearch(attacked_ids, attacker_ids, is_accepted=is_accepted,
+                                             propagate_for=semantics, branching=branching)
+                    self.assertEqual(sorted(search.search()), expected)
+
+    def test_propagation_reduces_nodes(self):
+        # p and q defeat each other, q defeats each x_i and x_i defeats y_i. Whichever of p and q is IN, the labels
+        # of all x_i and y_i follow, but without propagation the search branches on each of them.
+        p, q = Argument('p'), Argument('q')
+        arguments: List[Argument] = [p, q]
+        defeats = [Defeat(p, q), Defeat(q, p)]
+        for i in range(12):
+            x, y = Argument('x' + str(i)), Argument('y' + str(i))
+            arguments.extend([x, y])
+            defeats.extend([Defeat(q, x), Defeat(x, y)])
+        af = AbstractArgumentationFramework('af', arguments, defeats)
+        nodes_by_propagation = {}
+        for propagate_for in [None, 'Complete']:
+            nr_of_nodes = [0]
+
+            def count_node(_: LabellingSearch) -> bool:
+                nr_of_nodes[0] += 1
+                return False
+
+            search = LabellingSearch.from_argumentation_framework(af, is_accepted=is_complete_labelling,
+                                                                  prune=count_node, fix_grounded_labels=True,
+                                                                  propagate_for=propagate_for)
+            self.assertEqual(len(list(search.search())), 3)
+            nodes_by_propagation[propagate_for] = nr_of_nodes[0]
+        self.assertLess(100 * nodes_by_propagation['Complete'], nodes_by_propagation[None])
@@ -0,0 +1,35 @@
+import unittest
+
+from py_arg.abstract_argumentation_classes.compact_argumentation_framework import CompactArgumentationFramework
+from py_arg.algorithms.semantics.get_admissible_sets import get_admissible_sets
+from py_arg.algorithms.semantics.get_complete_extensions import get_complete_extensions
+from py_arg.algorithms.semantics.get_preferred_extensions import get_preferred_extensions
+from py_arg.algorithms.semantics.get_semistable_extensions import get_semistable_extensions
+from py_arg.algorithms.semantics.get_stable_extensions import get_stable_extensions
+from py_arg.algorithms.semantics.labelling_search import LabellingSearch
+from py_arg_tests.test_af_semantics_brute_force import brute_force_extensions, generate_small_frameworks
+
+
+class TestParallelExtensions(unittest.TestCase):
+    def test_split_covers_search(self):
+        for af in generate_small_frameworks(40):
+            compact_framework = CompactArgumentationFramework.from_abstract_argumentation_framework(af)
+            attacked_ids, attacker_ids = compact_framework.get_attacked_lists(), compact_framework.get_attacker_lists()
+            expected = list(LabellingSearch(attacked_ids, attacker_ids).search())
+            found = []
+            for decisions in LabellingSearch(attacked_ids, attacker_ids).split(6):
+                search = LabellingSearch(attacked_ids, attacker_ids)
+                search.fix_decisions(decisions)
+                found.extend(search.search())
+            self.assertEqual(sorted(found), sorted(expected))
+
+    def test_parallel_enumerators_match_definitions(self):
+        enumerators = {'ADM': get_admissible_sets, 'CO': get_complete_extensions, 'PR': get_preferred_extensions,
+                       'ST': get_stable_extensions, 'SST': get_semistable_extensions}
+        for af in generate_small_frameworks(6):
+            for semantics, enumerator in enumerators.items():
+                self.assertSetEqual(enumerator(af, n_jobs=2), brute_force_extensions(af, semantics))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import itertools
+import random
+import unittest
+
+from py_arg.algorithms.semantics.sat import is_accepted as sat_is_accepted
+from py_arg.algorithms.semantics.sat.cdcl_solver import CDCLSolver
+from py_arg.algorithms.semantics.sat.get_extensions import SAT_SEMANTICS, get_extensions, iter_extensions
+from py_arg_tests.test_af_semantics_brute_force import brute_force_extensions, generate_small_frameworks
+
+
+class TestSATSemantics(unittest.TestCase):
+    def test_cdcl_solver_on_random_formulas(self):
+        generator = random.Random(0)
+        for _ in range(300):
+            nr_of_variables = generator.randint(1, 8)
+            clauses = [[generator.choice([1, -1]) * generator.randint(1, nr_of_variables)
+                        for _ in range(generator.randint(1, 3))] for _ in range(generator.randint(1, 30))]
+            assumptions = [generator.choice([1, -1]) * generator.randint(1, nr_of_variables)
+                           for _ in range(generator.randint(0, 2))]
+
+            def is_model(assignment, literals=()):
+                return all(any((literal > 0) == assignment[abs(literal) - 1] for literal in clause)
+                           for clause in clauses + [[literal] for literal in literals])
+
+            solver = CDCLSolver()
+            for clause in clauses:
+                solver.add_clause(clause)
+            is_satisfiable = solver.solve(assumptions)
+            self.assertEqual(is_satisfiable, any(is_model(assignment, assumptions) for assignment
+                                                 in itertools.product([False, True], repeat=nr_of_variables)))
+            if is_satisfiable:
+                model = [literal > 0 for literal in solver.get_model()]
+                model += [False] * (nr_of_variables - len(model))
+                self.assertTrue(is_model(model, assumptions))
+
+    def test_sat_extensions_match_definitions(self):
+        abbreviations = {'Complete': 'CO', 'Preferred': 'PR', 'Stable': 'ST', 'SemiStable': 'SST'}
+        for af in generate_small_frameworks(60):
+            for semantics in SAT_SEMANTICS:
+                extensions = brute_force_extensions(af, abbreviations[semantics])
+                self.assertSetEqual(get_extensions(af, semantics, backend='cdcl'), extensions)
+                self.assertEqual(len(list(iter_extensions(af, semantics, limit=1, backend='cdcl'))),
+                                 min(1, len(extensions)))
+                for argument in af.arguments:
+                    self.assertEqual(sat_is_accepted.is_credulously_accepted(af, argument, semantics, 'cdcl'),
+                                     any(argument in extension for extension in extensions))
+                    self.assertEqual(sat_is_accepted.is_skeptically_accepted(af, argument, semantics, 'cdcl'),
+                                     all(argument in extension for extension in extensions))
+
+    def test_unknown_backend(self):
+        af = next(generate_small_frameworks(1))
+        with self.assertRaises(ValueError):
+            get_extensions(af, 'Preferred', backend='unknown')
@@ -0,0 +1,41 @@
+import unittest
+
+from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
+from py_arg.abstract_argumentation_classes.argument import Argument
+from py_arg.abstract_argumentation_classes.defeat import Defeat
+from py_arg.algorithms.semantics.get_preferred_extensions import iter_preferred_extensions
+from py_arg.algorithms.semantics.get_scc_recursive_extensions import get_scc_recursive_extensions
+from py_arg.algorithms.semantics.get_strongly_connected_components import get_strongly_connected_components
+from py_arg_tests.test_af_semantics_brute_force import brute_force_extensions, generate_small_frameworks
+
+
+class TestSCCRecursiveExtensions(unittest.TestCase):
+    def test_scc_recursive_extensions_match_definitions(self):
+        for af in generate_small_frameworks(100):
+            for semantics, abbreviation in [('Complete', 'CO'), ('Grounded', 'GR'), ('Preferred', 'PR'),
+                                            ('Stable', 'ST')]:
+                self.assertSetEqual(get_scc_recursive_extensions(af, semantics),
+                                    brute_force_extensions(af, abbreviation))
+
+    def test_inner_solver(self):
+        for af in generate_small_frameworks(20):
+            self.assertSetEqual(get_scc_recursive_extensions(af, 'Preferred', inner_solver=iter_preferred_extensions),
+                                brute_force_extensions(af, 'PR'))
+
+    def test_chain_of_components(self):
+        # An unattacked argument x defeats the first of a chain of 200 three-cycles, each of which defeats the next. A
+        # single search over these 601 arguments is hopeless, but each component is solved on its own.
+        x = Argument('x')
+        arguments = [x] + [Argument(name + str(i)) for i in range(200) for name in ['a', 'b', 'c']]
+        defeats = [Defeat(x, arguments[1])]
+        for i in range(200):
+            a, b, c = arguments[3 * i + 1:3 * i + 4]
+            defeats += [Defeat(a, b), Defeat(b, c), Defeat(c, a)]
+            if i < 199:
+                defeats.append(Defeat(c, arguments[3 * i + 4]))
+        af = AbstractArgumentationFramework('chain', arguments, defeats)
+        self.assertEqual(len(get_strongly_connected_components(af)), 201)
+        expected = {frozenset({x, af.get_argument('b0')})}
+        for semantics in ['Complete', 'Grounded', 'Preferred']:
+            self.assertSetEqual(get_scc_recursive_extensions(af, semantics), expected)
+        self.assertSetEqual(get_scc_recursive_extensions(af, 'Stable'), set())
@@ -0,0 +1,94 @@
+import unittest
+
+from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
+from py_arg.abstract_argumentation_classes.argument import Argument
+from py_arg.abstract_argumentation_classes.defeat import Defeat
+from py_arg.algorithms.semantics.get_complete_extensions import get_complete_extensions
+from py_arg.algorithms.semantics.get_eager_extension import get_eager_extension
+from py_arg.algorithms.semantics.get_ideal_extension import get_ideal_extension
+from py_arg.algorithms.semantics.get_number_of_extensions import get_number_of_extensions
+from py_arg.algorithms.semantics.get_preferred_extensions import get_preferred_extensions
+from py_arg.algorithms.semantics.get_scc_recursive_extensions import get_scc_recursive_extensions
+from py_arg.algorithms.semantics.get_semistable_extensions import get_semistable_extensions
+from py_arg.algorithms.semantics.get_stage_extensions import get_stage_extensions
+from py_arg.algorithms.semantics.is_accepted import is_credulously_accepted, is_skeptically_accepted
+from py_arg.algorithms.semantics.sat import get_extensions as sat_get_extensions
+from py_arg.utils.search_statistics import SearchStatistics
+from py_arg_tests.test_budget import get_pairs_framework
+
+
+class TestSearchStatistics(unittest.TestCase):
+    def test_labelling_search_statistics(self):
+        af = get_pairs_framework(4)
+        stats = SearchStatistics()
+        self.assertEqual(len(get_complete_extensions(af, stats=stats)), 3 ** 4)
+        self.assertGreaterEqual(stats.nr_of_nodes, 3 ** 4)
+        self.assertGreater(stats.nr_of_propagations, 0)
+        self.assertGreater(stats.nr_of_backtracks, 0)
+        self.assertGreater(stats.peak_live_labellings, 0)
+        self.assertEqual(stats.nr_of_maximality_rejections, 0)
+        self.assertTrue({'grounded', 'search', 'conversion'} <= set(stats.phase_times))
+
+    def test_maximality_rejections(self):
+        stats = SearchStatistics()
+        self.assertEqual(len(get_preferred_extensions(get_pairs_framework(4), stats=stats)), 2 ** 4)
+        self.assertGreater(stats.nr_of_maximality_rejections, 0)
+        # The kept candidates count as live labellings.
+        self.assertGreater(stats.peak_live_labellings, 2 ** 4)
+
+        # The search first finds {a}, whose range {a, b} is smaller than the range {a, b, c} of {b}.
+        a, b, c = Argument('a'), Argument('b'), Argument('c')
+        af = AbstractArgumentationFramework('af', [a, b, c], [Defeat(a, b), Defeat(b, a), Defeat(b, c), Defeat(c, c)])
+        stats = SearchStatistics()
+        self.assertSetEqual(get_semistable_extensions(af, stats=stats), {frozenset({b})})
+        self.assertEqual(stats.nr_of_maximality_rejections, 1)
+
+    def test_sat_statistics(self):
+        af = get_pairs_framework(4)
+        stats = SearchStatistics()
+        self.assertEqual(len(sat_get_extensions.get_extensions(af, 'Preferred', backend='cdcl', stats=stats)), 2 ** 4)
+        self.assertGreater(stats.nr_of_nodes, 0)
+        self.assertGreater(stats.nr_of_propagations, 0)
+        self.assertGreater(stats.nr_of_maximality_rejections, 0)
+        self.assertTrue({'encoding', 'search', 'conversion'} <= set(stats.phase_times))
+
+    def test_other_solvers_count_their_work(self):
+        af = get_pairs_framework(4)
+        solvers = [lambda stats: get_ideal_extension(af, stats=stats),
+                   lambda stats: get_eager_extension(af, stats=stats),
+                   lambda stats: get_stage_extensions(af, stats=stats),
+                   lambda stats: is_credulously_accepted(af, af.arguments[0], 'Stable', stats=stats),
+                   lambda stats: is_skeptically_accepted(af, af.arguments[0], 'SemiStable', stats=stats),
+                   lambda stats: get_number_of_extensions(af, 'Preferred', stats=stats),
+                   lambda stats: get_scc_recursive_extensions(af, 'Complete', stats=stats)]
+        for solver in solvers:
+            stats = SearchStatistics()
+            solver(stats)
+            self.assertGreater(stats.nr_of_nodes, 0)
+
+        # Of the naive extensions {a} and {b}, only {b} has a maximal range: {a, b} is smaller than {a, b, c}.
+        a, b, c = Argument('a'), Argument('b'), Argument('c')
+        af = AbstractArgumentationFramework('af', [a, b, c], [Defeat(a, b), Defeat(b, a), Defeat(b, c), Defeat(c, c)])
+        stats = SearchStatistics()
+        self.assertSetEqual(get_stage_extensions(af, stats=stats), {frozenset({b})})
+        self.assertEqual(stats.nr_of_maximality_rejections, 1)
+        self.assertTrue({'search', 'conversion'} <= set(stats.phase_times))
+
+    def test_progress_callback(self):
+        reported_nr_of_nodes = []
+        stats = SearchStatistics(on_progress=lambda progress: reported_nr_of_nodes.append(progress.nr_of_nodes),
+                                 progress_interval=0)
+        get_complete_extensions(get_pairs_framework(6), stats=stats)
+        self.assertGreater(len(reported_nr_of_nodes), 1)
+        self.assertEqual(reported_nr_of_nodes, sorted(reported_nr_of_nodes))
+
+        # With a long interval, the callback is throttled.
+        reported_nr_of_nodes.clear()
+        stats = SearchStatistics(on_progress=lambda progress: reported_nr_of_nodes.append(progress.nr_of_nodes),
+                                 progress_interval=3600)
+        get_complete_extensions(get_pairs_framework(6), stats=stats)
+        self.assertEqual(reported_nr_of_nodes, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
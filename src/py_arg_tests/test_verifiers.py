@@ -0,0 +1,41 @@
+import itertools
+import unittest
+
+from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
+from py_arg.abstract_argumentation_classes.argument import Argument
+from py_arg.abstract_argumentation_classes.defeat import Defeat
+from py_arg.algorithms.semantics.is_admissible import is_admissible
+from py_arg.algorithms.semantics.is_complete import is_complete
+from py_arg.algorithms.semantics.is_conflict_free import is_conflict_free
+from py_arg.algorithms.semantics.is_grounded_extension import is_grounded_extension
+from py_arg.algorithms.semantics.is_preferred_extension import is_preferred_extension
+from py_arg.algorithms.semantics.is_stable_extension import is_stable_extension
+from py_arg_tests.test_af_semantics_brute_force import brute_force_extensions, generate_small_frameworks
+
+
+class TestVerifiers(unittest.TestCase):
+    def test_verifiers_match_definitions(self):
+        verifiers = {'CF': is_conflict_free, 'ADM': is_admissible, 'CO': is_complete, 'GR': is_grounded_extension,
+                     'PR': is_preferred_extension, 'ST': is_stable_extension}
+        for af in generate_small_frameworks(40):
+            subsets = [frozenset(subset) for size in range(len(af.arguments) + 1)
+                       for subset in itertools.combinations(af.arguments, size)]
+            for semantics, verifier in verifiers.items():
+                extensions = brute_force_extensions(af, semantics)
+                for subset in subsets:
+                    self.assertEqual(verifier(list(subset), af), subset in extensions)
+
+    def test_preferred_verification_on_large_framework(self):
+        # 60 mutual defeats: checking all supersets of a candidate would take 2 ** 60 admissibility checks.
+        pairs = [(Argument('a' + str(i)), Argument('b' + str(i))) for i in range(60)]
+        defeats = [Defeat(a, b) for a, b in pairs] + [Defeat(b, a) for a, b in pairs]
+        af = AbstractArgumentationFramework('af', [argument for pair in pairs for argument in pair], defeats)
+        self.assertTrue(is_preferred_extension([a for a, _ in pairs], af))
+        self.assertFalse(is_preferred_extension([a for a, _ in pairs[1:]], af))
+        self.assertTrue(is_stable_extension([b for _, b in pairs], af))
+        with self.assertRaises(ValueError):
+            is_preferred_extension([Argument('c')], af)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,13 +1,15 @@
-from typing import List, Set
+from typing import List, Optional, Set
 
 from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
 from py_arg.algorithms.explanation.defending import get_defending, get_dir_defending
 from py_arg.algorithms.explanation.not_defending import get_not_defending, get_no_dir_defending, get_no_self_defense
 from py_arg.algorithms.explanation.suff_nec import get_sufficient_or_necessary
+from py_arg.utils.budget import Budget, BudgetExceeded
 
 
 def get_argumentation_framework_explanations(arg_framework: AbstractArgumentationFramework, extensions: List[Set],
-                                             accepted_arguments: Set, explanation_function: str, explanation_type: str):
+                                             accepted_arguments: Set, explanation_function: str, explanation_type: str,
+                                             budget: Optional[Budget] = None):
     """
     Calculate, for each argument, the explanations, given the function, type and strategy.
 
@@ -16,6 +18,9 @@ def get_argumentation_framework_explanations(arg_framework: AbstractArgumentatio
     :param accepted_arguments: The arguments that are considered accepted given the extensions and strategy.
     :param explanation_function: The explanation function, to determine the content of the explanation.
     :param explanation_type: The explanation type, to determine acceptance/non-acceptance explanation.
+    :param budget: Budget for the sufficient and necessary explanations (see py_arg.utils.budget), shared by all
+        arguments. If it is exhausted, BudgetExceeded is raised, with the explanations of the arguments done so far as
+        partial results.
     :return: A dictionary with for each (non-)accepted argument its explanation, given the parameters.
     """
     explanation = {}
@@ -26,7 +31,12 @@ def get_argumentation_framework_explanations(arg_framework: AbstractArgumentatio
             elif explanation_function == 'DirDefending':
                 explanation[str(arg)] = get_dir_defending(arg_framework, arg, extensions)
             else:
-                explanation[str(arg)] = get_sufficient_or_necessary(arg_framework, arg, explanation_function, explanation_type)
+                try:
+                    explanation[str(arg)] = get_sufficient_or_necessary(arg_framework, arg, explanation_function,
+                                                                        explanation_type, budget)
+                except BudgetExceeded as error:
+                    error.partial_results = explanation
+                    raise
         return explanation
 
     elif explanation_type == 'NonAcceptance':
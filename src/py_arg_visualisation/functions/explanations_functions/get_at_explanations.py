@@ -4,7 +4,7 @@ from py_arg.algorithms.explanation.suff_nec import get_sufficient_or_necessary
 
 
 def get_str_explanations(argumentation_theory, semantics, ordering_specification, extensions, accepted_formulas,
-                         function, expl_type, strategy, form):
+                         function, expl_type, strategy, form, budget=None):
     """
     Calculate, for each formula, the explanations, given the function, type, strategy and form.
 
@@ -17,9 +17,12 @@ def get_str_explanations(argumentation_theory, semantics, ordering_specification
     :param expl_type: The explanation type, to determine acceptance/non-acceptance explanation.
     :param strategy: The strategy of the explanation, whether credulous or skeptical reasoning.
     :param form: The form of the explanation, for example, explanations in terms of arguments, rules or premises.
+    :param budget: Budget for the defeats and the sufficient explanations (see py_arg.utils.budget), shared by all
+        formulas; BudgetExceeded is raised once it is exhausted.
     :return: A dictionary with for each (non-)accepted argument its explanation, given the parameters.
     """
-    argumentation_framework = argumentation_theory.create_abstract_argumentation_framework('af', ordering_specification)
+    argumentation_framework = argumentation_theory.create_abstract_argumentation_framework('af', ordering_specification,
+                                                                                           budget)
     abstract_explanation = {}
     if expl_type == 'Acceptance':
         for formula in accepted_formulas:
@@ -32,7 +35,8 @@ def get_str_explanations(argumentation_theory, semantics, ordering_specification
                 elif function == 'DirDefending':
                     arg_expl.extend(get_dir_defending(argumentation_framework, arg, extensions))
                 else:
-                    suff_expl.extend(get_sufficient_or_necessary(argumentation_framework, arg, 'Suff', expl_type))
+                    suff_expl.extend(get_sufficient_or_necessary(argumentation_framework, arg, 'Suff', expl_type,
+                                                                 budget))
             if suff_expl != []:
                 if function == 'Suff':
                     arg_expl.extend(suff_expl)
@@ -2,11 +2,23 @@ def get_accepted_arguments(extensions, strategy_specification: str):
     """
     Calculate the set of accepted arguments from a set of extensions (sets of arguments) and evaluation strategy
 
-    :param extensions: The extensions (sets of collectively accepted arguments).
+    :param extensions: The extensions (sets of collectively accepted arguments). This can be any iterable, such as a
+        generator of extensions; for the skeptical strategy, it is only consumed until no argument is accepted anymore.
     :param strategy_specification: The evaluation strategy (e.g., skeptical or credulous).
     """
     if strategy_specification == 'Skeptical':
-        return set.intersection(*extensions)
+        accepted_arguments = None
+        for extension in extensions:
+            if accepted_arguments is None:
+                accepted_arguments = set(extension)
+            else:
+                accepted_arguments &= extension
+            if not accepted_arguments:
+                break
+        return accepted_arguments if accepted_arguments is not None else set()
     if strategy_specification == 'Credulous':
-        return set.union(*extensions)
+        accepted_arguments = set()
+        for extension in extensions:
+            accepted_arguments |= extension
+        return accepted_arguments
     raise NotImplementedError
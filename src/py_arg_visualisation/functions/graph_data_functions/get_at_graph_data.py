@@ -1,6 +1,7 @@
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 from py_arg.aspic_classes.argumentation_theory import ArgumentationTheory
+from py_arg.utils.budget import Budget
 from py_arg_visualisation.functions.graph_data_functions.get_color import get_color
 from py_arg_visualisation.functions.ordering_functions.get_ordering_by_specification \
     import get_ordering_by_specification
@@ -8,7 +9,7 @@ from py_arg_visualisation.functions.ordering_functions.get_ordering_by_specifica
 
 def get_argumentation_theory_graph_data(argumentation_theory: ArgumentationTheory, ordering_specification: str,
                                         selected_arguments: Dict[str, List[str]],
-                                        color_blind_mode: bool):
+                                        color_blind_mode: bool, budget: Optional[Budget] = None):
     """
     Calculate the data needed for the graphical representation of the argumentation theory and ordering
 
@@ -16,6 +17,8 @@ def get_argumentation_theory_graph_data(argumentation_theory: ArgumentationTheor
     :param ordering_specification: The chosen ordering, combining both last/weakest link and democratic/elitist.
     :param selected_arguments: Arguments to be marked with a different color (e.g. because they are in some extension)
     :param color_blind_mode: Is the color-blind mode on?
+    :param budget: Budget for computing the defeats (see py_arg.utils.budget); BudgetExceeded is raised once it is
+        exhausted.
     """
     if selected_arguments and 'blue' in selected_arguments:
         blue = selected_arguments['blue']
@@ -53,7 +56,7 @@ def get_argumentation_theory_graph_data(argumentation_theory: ArgumentationTheor
 
     ordering = get_ordering_by_specification(argumentation_theory, ordering_specification)
     data_edges = []
-    for defeat in argumentation_theory.recompute_all_defeats(ordering):
+    for defeat in argumentation_theory.recompute_all_defeats(ordering, budget):
         argument_a_id = argument_long_str_to_id[defeat.from_argument.name]
         argument_b_id = argument_long_str_to_id[defeat.to_argument.name]
 
@@ -1,4 +1,4 @@
-from typing import List, Tuple, Set
+from typing import List, Optional, Tuple, Set
 
 from py_arg.aspic_classes.argumentation_system import ArgumentationSystem
 from py_arg.aspic_classes.argumentation_theory import ArgumentationTheory
@@ -6,6 +6,7 @@ from py_arg.aspic_classes.defeasible_rule import DefeasibleRule
 from py_arg.aspic_classes.literal import Literal
 from py_arg.aspic_classes.orderings.preference_preorder import PreferencePreorder
 from py_arg.aspic_classes.strict_rule import StrictRule
+from py_arg.utils.budget import Budget
 
 
 def _read_axioms_and_ordinary_premises(axioms_or_ordinary_premises_str) -> List[str]:
@@ -64,7 +65,8 @@ def _read_preferences(preferences_str: str) -> List[Tuple[str]]:
 
 def read_argumentation_theory(axioms_str: str, ordinary_premises_str: str,
                               strict_rules_str: str, defeasible_rules_str: str,
-                              premise_preferences_str: str, defeasible_rule_preference_str: str):
+                              premise_preferences_str: str, defeasible_rule_preference_str: str,
+                              budget: Optional[Budget] = None):
     """
     Calculate the argumentation theory from the axioms, ordinary premises, strict and defeasible rules, premise and
     rule preference and the given ordering
@@ -75,6 +77,7 @@ def read_argumentation_theory(axioms_str: str, ordinary_premises_str: str,
     :param defeasible_rules_str: The defeasible rules (rules that can be questioned).
     :param premise_preferences_str: The preferences over the ordinary premises.
     :param defeasible_rule_preference_str: The preferences over the defeasible rules.
+    :param budget: Budget for the construction of the arguments (see ArgumentationTheory).
     """
 
     # Read axioms, ordinary premises, defeasible rules and strict rules (first in a str format) from the strs
@@ -143,5 +146,5 @@ def read_argumentation_theory(axioms_str: str, ordinary_premises_str: str,
     argumentation_system = ArgumentationSystem(language, contraries_and_contradictories, strict_rules,
                                                defeasible_rules, defeasible_rule_preferences)
     argumentation_theory = ArgumentationTheory(argumentation_system, axioms, ordinary_premises,
-                                               ordinary_premise_preferences)
+                                               ordinary_premise_preferences, budget)
     return argumentation_theory
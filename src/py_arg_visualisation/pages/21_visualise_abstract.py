@@ -9,6 +9,8 @@ from dash.exceptions import PreventUpdate
 import dash_bootstrap_components as dbc
 
 from py_arg.abstract_argumentation_classes.abstract_argumentation_framework import AbstractArgumentationFramework
+from py_arg.algorithms.semantics.get_acceptance_bounds import ACCEPTANCE_BOUNDS_SEMANTICS, AcceptanceBounds
+from py_arg.algorithms.semantics.iterate_extensions import iter_extensions
 from py_arg.generators.abstract_argumentation_framework_generators.abstract_argumentation_framework_generator import \
     AbstractArgumentationFrameworkGenerator
 from py_arg.import_export.argumentation_framework_from_aspartix_format_reader import \
@@ -25,18 +27,22 @@ from py_arg.import_export.argumentation_framework_to_iccma23_format_writer impor
 from py_arg.import_export.argumentation_framework_to_json_writer import ArgumentationFrameworkToJSONWriter
 from py_arg.import_export.argumentation_framework_to_trivial_graph_format_writer import \
     ArgumentationFrameworkToTrivialGraphFormatWriter
+from py_arg.utils.budget import Budget, BudgetExceeded
 from py_arg_visualisation.functions.explanations_functions.explanation_function_options import \
     EXPLANATION_FUNCTION_OPTIONS
 from py_arg_visualisation.functions.explanations_functions.get_af_explanations import \
     get_argumentation_framework_explanations
 from py_arg_visualisation.functions.extensions_functions.get_accepted_arguments import get_accepted_arguments
-from py_arg_visualisation.functions.extensions_functions.get_af_extensions import get_argumentation_framework_extensions
 from py_arg_visualisation.functions.graph_data_functions.get_af_graph_data import get_argumentation_framework_graph_data
 from py_arg_visualisation.functions.import_functions.read_argumentation_framework_functions import \
     read_argumentation_framework
 
 dash.register_page(__name__, name='Visualise AF', title='Visualise AF')
 
+# The time in seconds that the solvers may take per request. uWSGI kills workers after 30 seconds (harakiri in
+# wsgi.ini), so the solvers are stopped well before that.
+SOLVER_TIME_LIMIT = 20
+
 
 # Create layout elements and compose them into the layout for this page.
 
@@ -255,9 +261,21 @@ def evaluate_abstract_argumentation_framework(arguments: str, attacks: str,
     # Read the abstract argumentation framework.
     arg_framework = read_argumentation_framework(arguments, attacks)
 
-    # Compute the extensions and put them in a list of sets.
-    frozen_extensions = get_argumentation_framework_extensions(arg_framework, semantics)
-    extensions = [set(frozen_extension) for frozen_extension in frozen_extensions]
+    # Compute the extensions and put them in a list of sets, as they are found. If this takes too long, show the
+    # extensions found so far.
+    time_limit_note = []
+    acceptance_bounds = None
+    try:
+        extensions = [set(extension) for extension in
+                      iter_extensions(arg_framework, semantics, budget=Budget(time_limit=SOLVER_TIME_LIMIT))]
+    except BudgetExceeded as error:
+        extensions = [set(extension) for extension in error.partial_results]
+        time_limit_note = [html.P('The computation was stopped after ' + str(SOLVER_TIME_LIMIT) + ' seconds, so only '
+                                  'the extensions found until then are shown.')]
+        if semantics in ACCEPTANCE_BOUNDS_SEMANTICS:
+            acceptance_bounds = AcceptanceBounds(arg_framework, semantics)
+            for extension in extensions:
+                acceptance_bounds.add_extension(extension)
 
     # Make a button for each extension.
     extension_buttons = []
@@ -275,15 +293,31 @@ def evaluate_abstract_argumentation_framework(arguments: str, attacks: str,
         extension_buttons.append(dbc.Button([extension_readable_str], color='secondary',
                                             id={'type': 'extension-button-abstract', 'index': extension_long_str}))
 
-    # Based on the extensions, get the acceptance status of arguments.
-    accepted_arguments = get_accepted_arguments(extensions, strategy)
+    # Based on the extensions, get the acceptance status of arguments. If not all extensions were found, only the
+    # arguments that are certainly accepted are shown, together with those that may be accepted as well.
+    if acceptance_bounds is not None:
+        if strategy == 'Skeptical':
+            accepted_arguments = acceptance_bounds.skeptical_lower
+            possibly_accepted_arguments = acceptance_bounds.skeptical_upper - accepted_arguments
+        else:
+            accepted_arguments = acceptance_bounds.credulous_lower
+            possibly_accepted_arguments = acceptance_bounds.credulous_upper - accepted_arguments
+        time_limit_note.append(html.P('The accepted arguments below are certainly accepted; it is not known yet if '
+                                      'these arguments are accepted as well: {' +
+                                      ', '.join(argument.name for argument in sorted(possibly_accepted_arguments)) +
+                                      '}.'))
+    else:
+        accepted_arguments = get_accepted_arguments(extensions, strategy)
+        if time_limit_note:
+            time_limit_note.append(html.P('The accepted arguments are based on these extensions only.'))
 
     # Make a button for each accepted argument.
     accepted_argument_buttons = [dbc.Button(argument.name, color='secondary', id={'type': 'argument-button-abstract',
                                                                                   'index': argument.name})
                                  for argument in sorted(accepted_arguments)]
 
-    return html.Div([html.B('The extension(s):'), html.Div(extension_buttons),
+    return html.Div(time_limit_note +
+                    [html.B('The extension(s):'), html.Div(extension_buttons),
                      html.B('The accepted argument(s):'), html.Div(accepted_argument_buttons),
                      html.P('Click on the extension/argument buttons to display the corresponding argument(s) '
                             'in the graph.')])
@@ -340,11 +374,20 @@ def derive_explanations_abstract_argumentation_framework(active_item,
 
     # Compute the explanations based on the input.
     arg_framework = read_argumentation_framework(arguments, attacks)
-    frozen_extensions = get_argumentation_framework_extensions(arg_framework, semantics)
-    extensions = [set(frozen_extension) for frozen_extension in frozen_extensions]
+    # The extensions and the explanations share one budget, so together they stay within the time limit.
+    budget = Budget(time_limit=SOLVER_TIME_LIMIT)
+    try:
+        extensions = [set(extension) for extension in iter_extensions(arg_framework, semantics, budget=budget)]
+    except BudgetExceeded:
+        return html.P('The computation of the extensions was stopped after ' + str(SOLVER_TIME_LIMIT) +
+                      ' seconds, so no explanations can be given.')
     accepted_arguments = get_accepted_arguments(extensions, explanation_strategy)
-    explanations = get_argumentation_framework_explanations(arg_framework, extensions, accepted_arguments,
-                                                            explanation_function, explanation_type)
+    try:
+        explanations = get_argumentation_framework_explanations(arg_framework, extensions, accepted_arguments,
+                                                                explanation_function, explanation_type, budget)
+    except BudgetExceeded:
+        return html.P('The computation of the explanations was stopped after ' + str(SOLVER_TIME_LIMIT) +
+                      ' seconds.')
 
     # Print the explanations for each of the arguments.
     return html.Div([html.Div(html.B('Explanation(s) by argument:'))] +
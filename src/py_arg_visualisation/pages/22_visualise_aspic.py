@@ -14,6 +14,7 @@ from py_arg.generators.argumentation_system_generators.layered_argumentation_sys
     LayeredArgumentationSystemGenerator
 from py_arg.generators.argumentation_theory_generators.argumentation_theory_generator import \
     ArgumentationTheoryGenerator
+from py_arg.utils.budget import Budget, BudgetExceeded
 from py_arg_visualisation.functions.explanations_functions.explanation_function_options import \
     EXPLANATION_FUNCTION_OPTIONS
 from py_arg_visualisation.functions.explanations_functions.get_at_explanations import get_str_explanations
@@ -27,6 +28,10 @@ from py_arg_visualisation.functions.ordering_functions.get_ordering_by_specifica
 
 dash.register_page(__name__, name='Visualise ASPIC+ AT', title='Visualise ASPIC+ AT')
 
+# The time in seconds that the argument construction and the solvers may take per request. uWSGI kills workers after
+# 30 seconds (harakiri in wsgi.ini), so they are stopped well before that.
+SOLVER_TIME_LIMIT = 20
+
 
 def get_aspic_layout(aspic_setting, structured_evaluation, structured_explanation):
     left_column = dbc.Col(
@@ -239,16 +244,24 @@ def create_argumentation_theory(axioms_str: str, ordinary_premises_str: str, str
     # Read the ordering
     ordering_specification = ordering_choice_value + '_' + ordering_link_value
 
-    # Read the argumentation theory
+    # Read the argumentation theory. If constructing its arguments or generating the graph data takes too long, the
+    # graph is left as it was.
+    budget = Budget(time_limit=SOLVER_TIME_LIMIT)
     try:
         arg_theory = read_argumentation_theory(
             axioms_str, ordinary_premises_str, strict_rules_str, defeasible_rules_str, ordinary_premise_preferences_str,
-            defeasible_rule_preferences_str)
+            defeasible_rule_preferences_str, budget)
     except ValueError:
         arg_theory = ArgumentationTheory(ArgumentationSystem({}, {}, [], []), [], [])
+    except BudgetExceeded:
+        raise PreventUpdate
 
     # Generate the graph data for this argumentation theory
-    return get_argumentation_theory_graph_data(arg_theory, ordering_specification, selected_arguments, color_blind_mode)
+    try:
+        return get_argumentation_theory_graph_data(arg_theory, ordering_specification, selected_arguments,
+                                                   color_blind_mode, budget)
+    except BudgetExceeded:
+        raise PreventUpdate
 
 
 @callback(
@@ -279,17 +292,26 @@ def evaluate_structured_argumentation_framework(axioms_str: str, ordinary_premis
     # Read the ordering
     ordering_specification = ordering_choice_value + '_' + ordering_link_value
 
-    # Read the argumentation theory
+    # Read the argumentation theory. The construction of its arguments and the computation of the extensions share
+    # one budget, so together they stay within the time limit.
+    budget = Budget(time_limit=SOLVER_TIME_LIMIT)
     try:
         arg_theory = read_argumentation_theory(
             axioms_str, ordinary_premises_str, strict_rules_str, defeasible_rules_str, ordinary_premise_preferences_str,
-            defeasible_rule_preferences_str)
+            defeasible_rule_preferences_str, budget)
     except ValueError:
         arg_theory = ArgumentationTheory(ArgumentationSystem({}, {}, [], []), [], [])
+    except BudgetExceeded:
+        return html.P('The construction of the arguments or the computation of the extensions was stopped after ' +
+                      str(SOLVER_TIME_LIMIT) + ' seconds.')
 
     ordering = get_ordering_by_specification(arg_theory, ordering_specification)
-    arg_framework = arg_theory.create_abstract_argumentation_framework('af', ordering)
-    frozen_extensions = get_argumentation_framework_extensions(arg_framework, semantics_specification)
+    try:
+        arg_framework = arg_theory.create_abstract_argumentation_framework('af', ordering, budget)
+        frozen_extensions = get_argumentation_framework_extensions(arg_framework, semantics_specification, budget)
+    except BudgetExceeded:
+        return html.P('The construction of the arguments or the computation of the extensions was stopped after ' +
+                      str(SOLVER_TIME_LIMIT) + ' seconds.')
 
     extensions = [set(frozen_extension) for frozen_extension in frozen_extensions]
     accepted_formulas = get_accepted_formulas(extensions, acceptance_strategy_specification)
@@ -373,15 +395,25 @@ def derive_explanation_structured(active_item: str, axioms, ordinary, strict, de
     if active_item != 'Explanation':
         raise PreventUpdate
 
+    # The construction of the arguments, the extensions and the explanations share one budget, so together they stay
+    # within the time limit.
+    budget = Budget(time_limit=SOLVER_TIME_LIMIT)
     try:
         arg_theory = read_argumentation_theory(axioms, ordinary, strict, defeasible,
-                                               premise_preferences, rule_preferences)
+                                               premise_preferences, rule_preferences, budget)
     except ValueError:
         arg_theory = ArgumentationTheory(ArgumentationSystem({}, {}, [], []), [], [])
+    except BudgetExceeded:
+        return html.P('The construction of the arguments or the computation of the extensions was stopped after ' +
+                      str(SOLVER_TIME_LIMIT) + ' seconds, so no explanations can be given.')
 
     ordering = get_ordering_by_specification(arg_theory, choice + '_' + link)
-    arg_framework = arg_theory.create_abstract_argumentation_framework('af', ordering)
-    frozen_extensions = get_argumentation_framework_extensions(arg_framework, semantics)
+    try:
+        arg_framework = arg_theory.create_abstract_argumentation_framework('af', ordering, budget)
+        frozen_extensions = get_argumentation_framework_extensions(arg_framework, semantics, budget)
+    except BudgetExceeded:
+        return html.P('The construction of the arguments or the computation of the extensions was stopped after ' +
+                      str(SOLVER_TIME_LIMIT) + ' seconds, so no explanations can be given.')
 
     if semantics == 'Grounded':
         extension = frozen_extensions
@@ -389,8 +421,12 @@ def derive_explanation_structured(active_item: str, axioms, ordinary, strict, de
     else:
         extension = [set(frozen_extension) for frozen_extension in frozen_extensions]
         accepted = get_accepted_formulas(extension, strategy)
-    explanations = get_str_explanations(arg_theory, semantics, ordering, extension, accepted, function,
-                                        explanation_type, strategy, form)
+    try:
+        explanations = get_str_explanations(arg_theory, semantics, ordering, extension, accepted, function,
+                                            explanation_type, strategy, form, budget)
+    except BudgetExceeded:
+        return html.P('The computation of the explanations was stopped after ' + str(SOLVER_TIME_LIMIT) +
+                      ' seconds.')
 
     # return html.Div([html.B('The Explanation(s):'),
     #                  html.H6('\n {}'.format(str(explanations).replace('set()', '{}')))])